@@ -15,36 +15,1563 @@ Pembuat: Tim DevOps yang Kece
 Versi: 3.0.0 Edisi Betawi Comprehensive
 """
 
+from __future__ import annotations
+
 import argparse
-import boto3
+import fnmatch
+import gzip
+import hashlib
+import heapq
 import json
 import logging
 import os
+import queue
+import random
+import re
+import sqlite3
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Set
 
-import colorama
 from botocore.exceptions import (
     BotoCoreError, ClientError, NoCredentialsError, 
     PartialCredentialsError, ProfileNotFound
 )
-from colorama import Fore, Back, Style
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt, IntPrompt
-from rich.logging import RichHandler
-from rich.text import Text
-from rich.tree import Tree
-
-# Initialize colorama buat warna-warni cross-platform
-colorama.init(autoreset=True)
-
-# Initialize Rich console
-console = Console()
+
+# boto3, numpy, rich & colorama baru di-import pas beneran dipake biar
+# --help/--version dan scan satu resource type start-nya cepet
+if TYPE_CHECKING:
+    import boto3
+    from rich.console import Console
+
+_console_asli: Optional[Console] = None
+
+
+def _konsol(stderr: bool = False) -> Console:
+    """
+    Console Rich yang asli, baru dibikin (sekalian init colorama) pas pertama kali dipake
+    
+    Args:
+        stderr: Tulis ke stderr, cuma ngaruh di pemanggilan pertama (--output json/ndjson)
+    """
+    global _console_asli
+    if _console_asli is None:
+        import colorama
+        from rich.console import Console
+        
+        # Initialize colorama buat warna-warni cross-platform
+        colorama.init(autoreset=True)
+        _console_asli = Console(stderr=stderr)
+    return _console_asli
+
+
+class _ConsoleMalas:
+    """Stand-in buat Console Rich, semua atribut diterusin ke console asli"""
+    
+    def __getattr__(self, nama: str):
+        return getattr(_konsol(), nama)
+
+
+# Initialize Rich console (lazy)
+console = _ConsoleMalas()
+
+# Penanda scanner udah kelar di antrian hasil scan streaming
+_SCAN_SELESAI = object()
+
+# Penanda thread produser udah kelar di jembatan thread -> asyncio
+_ASYNC_SELESAI = object()
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket per (service, operation) yang ngatur kecepatan panggilan API AWS
+    
+    Rate tiap bucket naik pelan-pelan tiap kali sukses (additive increase) dan
+    langsung dipotong setengah pas kena throttling (multiplicative decrease),
+    jadi scan & delete jalan secepet yang diizinin account-nya.
+    """
+    
+    # Error code yang artinya kita kena throttling
+    THROTTLE_CODES = {
+        'Throttling', 'ThrottlingException', 'ThrottledException', 'RequestLimitExceeded',
+        'RequestThrottled', 'RequestThrottledException', 'TooManyRequestsException',
+        'SlowDown', 'EC2ThrottledException', 'PriorRequestNotComplete', 'BandwidthLimitExceeded'
+    }
+    
+    DEFAULT_RATE = 10.0      # request/detik awal per operation
+    DEFAULT_MAX_RATE = 50.0  # batas atas pas ramp-up
+    DEFAULT_MIN_RATE = 0.5   # batas bawah pas backoff
+    RAMP_UP_STEP = 0.5       # tambahan rate tiap panggilan sukses
+    BACKOFF_FACTOR = 0.5     # pengali rate tiap kena throttling
+    
+    def __init__(self, rate: float = DEFAULT_RATE, max_rate: float = DEFAULT_MAX_RATE,
+                 min_rate: float = DEFAULT_MIN_RATE, overrides: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            rate: Rate awal (request/detik) buat tiap operation
+            max_rate: Rate maksimal yang boleh dicapai pas ramp-up
+            min_rate: Rate minimal pas backoff
+            overrides: Rate awal khusus per 'service' atau 'service.Operation', contoh {'ec2.DescribeSnapshots': 5}
+        """
+        self.rate = max(rate, min_rate)
+        self.max_rate = max(max_rate, self.rate)
+        self.min_rate = min_rate
+        self.overrides = overrides or {}
+        self._buckets: Dict[Tuple, Dict] = {}
+        self._lock = threading.Lock()
+        self.throttle_events = 0
+    
+    def _rate_awal(self, service: str, operation: str) -> float:
+        """Rate awal buat operation, ngecek override paling spesifik dulu"""
+        return self.overrides.get(f"{service}.{operation}", self.overrides.get(service, self.rate))
+    
+    def _bucket(self, key: Tuple) -> Dict:
+        """Ambil bucket buat key, dibikin kalo belum ada (harus dipanggil sambil megang lock)"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate = self._rate_awal(key[-2], key[-1])
+            bucket = {'rate': rate, 'max_rate': max(rate, self.max_rate), 'tokens': 1.0, 'last': time.monotonic()}
+            self._buckets[key] = bucket
+        return bucket
+    
+    def acquire(self, key: Tuple) -> None:
+        """Tunggu sampe ada token buat key (scope, region, service, operation)"""
+        while True:
+            with self._lock:
+                bucket = self._bucket(key)
+                sekarang = time.monotonic()
+                # Kapasitas bucket = rate per detik, jadi burst maksimal sedetik
+                kapasitas = max(1.0, bucket['rate'])
+                bucket['tokens'] = min(kapasitas, bucket['tokens'] + (sekarang - bucket['last']) * bucket['rate'])
+                bucket['last'] = sekarang
+                if bucket['tokens'] >= 1.0 - 1e-9:  # toleransi pembulatan float
+                    bucket['tokens'] -= 1.0
+                    return
+                tunggu = (1.0 - bucket['tokens']) / bucket['rate']
+            time.sleep(tunggu)
+    
+    def on_success(self, key: Tuple) -> None:
+        """Panggilan sukses, naikin rate dikit"""
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket['rate'] = min(bucket['max_rate'], bucket['rate'] + self.RAMP_UP_STEP)
+    
+    def on_throttle(self, key: Tuple) -> None:
+        """Kena throttling, potong rate dan kosongin token biar langsung ngerem"""
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket['rate'] = max(self.min_rate, bucket['rate'] * self.BACKOFF_FACTOR)
+            bucket['tokens'] = 0.0
+            self.throttle_events += 1
+    
+    def pasang(self, events, scope: Optional[str] = None) -> None:
+        """
+        Pasang limiter ke event system session boto3
+        
+        Args:
+            events: Event emitter dari session (session.events)
+            scope: Pembeda bucket antar account, karena limit API AWS itu per account
+        """
+        def kunci(event_name: str, context: Dict) -> Tuple:
+            # Format event: 'before-call.ec2.DescribeVolumes'
+            _, service, operation = event_name.split('.', 2)
+            return (scope, context.get('client_region'), service, operation)
+        
+        def sebelum_call(event_name: str, context: Dict, **kwargs) -> None:
+            self.acquire(kunci(event_name, context))
+        
+        def cek_response(event_name: str, request_dict: Dict, response=None, **kwargs) -> None:
+            if response is None:
+                return
+            key = kunci(event_name, request_dict.get('context', {}))
+            http_response, parsed = response
+            error_code = parsed.get('Error', {}).get('Code') if isinstance(parsed, dict) else None
+            if error_code in self.THROTTLE_CODES or getattr(http_response, 'status_code', None) == 429:
+                self.on_throttle(key)
+            elif not error_code:
+                self.on_success(key)
+        
+        events.register('before-call', sebelum_call)
+        events.register('needs-retry', cek_response)
+
+
+class MetrikAPI:
+    """
+    Instrumentasi panggilan API AWS per service/operation plus waktu tiap scanner
+    
+    Dipasang ke event system session boto3 kayak rate limiter: jumlah call,
+    histogram latency, retry, throttling dan error dicatet per operation.
+    Hasilnya bisa ditampilin, ikut di laporan, atau ditulis jadi textfile Prometheus.
+    """
+    
+    # Batas bucket histogram latency (detik), ngikutin default client Prometheus
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self):
+        self._operasi: Dict[Tuple[str, str], Dict] = {}
+        self._scanner: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+    
+    def _entry_operasi(self, key: Tuple[str, str]) -> Dict:
+        """Ambil entry operation, dibikin kalo belum ada (harus dipanggil sambil megang lock)"""
+        entry = self._operasi.get(key)
+        if entry is None:
+            entry = {
+                'calls': 0, 'errors': 0, 'retries': 0, 'throttles': 0,
+                'total_s': 0.0, 'max_s': 0.0, 'buckets': [0] * (len(self.LATENCY_BUCKETS) + 1)
+            }
+            self._operasi[key] = entry
+        return entry
+    
+    def catat_call(self, key: Tuple[str, str], durasi: float, retries: int = 0, error: bool = False) -> None:
+        """Catet satu panggilan API yang udah kelar (termasuk semua retry-nya)"""
+        posisi = next((i for i, batas in enumerate(self.LATENCY_BUCKETS) if durasi <= batas),
+                      len(self.LATENCY_BUCKETS))
+        with self._lock:
+            entry = self._entry_operasi(key)
+            entry['calls'] += 1
+            entry['retries'] += retries
+            entry['errors'] += int(error)
+            entry['total_s'] += durasi
+            entry['max_s'] = max(entry['max_s'], durasi)
+            entry['buckets'][posisi] += 1
+    
+    def catat_throttle(self, key: Tuple[str, str]) -> None:
+        """Catet satu attempt yang kena throttling"""
+        with self._lock:
+            self._entry_operasi(key)['throttles'] += 1
+    
+    def catat_scanner(self, resource_type: str, durasi: float, jumlah: int) -> None:
+        """Catet waktu satu scanner (satu resource type di satu account/region)"""
+        with self._lock:
+            entry = self._scanner.setdefault(resource_type, {'runs': 0, 'resources': 0, 'total_s': 0.0, 'max_s': 0.0})
+            entry['runs'] += 1
+            entry['resources'] += jumlah
+            entry['total_s'] += durasi
+            entry['max_s'] = max(entry['max_s'], durasi)
+    
+    def pasang(self, events) -> None:
+        """
+        Pasang instrumentasi ke event system session boto3
+        
+        Pasang setelah rate limiter biar waktu nunggu token kagak ikut keitung di latency.
+        """
+        def sebelum_call(model, context: Dict, **kwargs) -> None:
+            context['metrik_key'] = (model.service_model.service_name, model.name)
+            context['metrik_mulai'] = time.perf_counter()
+        
+        def sesudah_call(context: Dict, parsed=None, **kwargs) -> None:
+            if 'metrik_key' not in context:
+                return
+            parsed = parsed if isinstance(parsed, dict) else {}
+            self.catat_call(
+                context['metrik_key'],
+                time.perf_counter() - context['metrik_mulai'],
+                retries=parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0),
+                error='Error' in parsed
+            )
+        
+        def sesudah_call_error(context: Dict, **kwargs) -> None:
+            if 'metrik_key' in context:
+                self.catat_call(context['metrik_key'], time.perf_counter() - context['metrik_mulai'], error=True)
+        
+        def cek_response(request_dict: Dict, response=None, **kwargs) -> None:
+            key = request_dict.get('context', {}).get('metrik_key')
+            if response is None or key is None:
+                return
+            http_response, parsed = response
+            error_code = parsed.get('Error', {}).get('Code') if isinstance(parsed, dict) else None
+            if error_code in AdaptiveRateLimiter.THROTTLE_CODES or getattr(http_response, 'status_code', None) == 429:
+                self.catat_throttle(key)
+        
+        events.register('before-call', sebelum_call)
+        events.register('after-call', sesudah_call)
+        events.register('after-call-error', sesudah_call_error)
+        events.register('needs-retry', cek_response)
+    
+    def _persentil(self, entry: Dict, persen: float) -> float:
+        """Estimasi persentil latency dari histogram (batas atas bucket-nya)"""
+        target = entry['calls'] * persen
+        kumulatif = 0
+        for batas, jumlah in zip(self.LATENCY_BUCKETS, entry['buckets']):
+            kumulatif += jumlah
+            if kumulatif >= target:
+                return batas
+        return entry['max_s']
+    
+    def ringkasan_operasi(self) -> List[Tuple[str, Dict]]:
+        """Daftar (service.Operation, metrik) diurutin dari total waktu paling gede"""
+        with self._lock:
+            operasi = {f"{service}.{operation}": dict(entry, buckets=list(entry['buckets']))
+                       for (service, operation), entry in self._operasi.items()}
+        for entry in operasi.values():
+            entry['avg_s'] = entry['total_s'] / entry['calls'] if entry['calls'] else 0.0
+            entry['p95_s'] = self._persentil(entry, 0.95) if entry['calls'] else 0.0
+        return sorted(operasi.items(), key=lambda item: item[1]['total_s'], reverse=True)
+    
+    def ringkasan_scanner(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {resource_type: dict(entry) for resource_type, entry in self._scanner.items()}
+    
+    def ke_dict(self) -> Dict:
+        """Versi dict buat laporan JSON"""
+        operasi = {}
+        for nama, entry in self.ringkasan_operasi():
+            kumulatif, histogram = 0, {}
+            for batas, jumlah in zip(list(self.LATENCY_BUCKETS) + ['+Inf'], entry.pop('buckets')):
+                kumulatif += jumlah
+                histogram[str(batas)] = kumulatif
+            operasi[nama] = dict(entry, latency_histogram=histogram)
+        return {'operations': operasi, 'scanners': self.ringkasan_scanner()}
+    
+    @staticmethod
+    def _label(**labels) -> str:
+        isi = ','.join(
+            f'{nama}="{str(nilai).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), " ")}"'
+            for nama, nilai in labels.items()
+        )
+        return '{' + isi + '}'
+    
+    def format_prometheus(self, statistik: Dict) -> str:
+        """Render semua metrik dalam format textfile Prometheus (buat node exporter)"""
+        baris = []
+        
+        def metrik(nama: str, jenis: str, bantuan: str, nilai: List[Tuple[str, float]]) -> None:
+            baris.append(f"# HELP {nama} {bantuan}")
+            baris.append(f"# TYPE {nama} {jenis}")
+            baris.extend(f"{nama}{label} {angka}" for label, angka in nilai)
+        
+        operasi = self.ringkasan_operasi()
+        label_op = {nama: self._label(service=nama.split('.', 1)[0], operation=nama.split('.', 1)[1])
+                    for nama, _ in operasi}
+        for field, nama, bantuan in (
+            ('calls', 'aws_cleaner_api_calls_total', 'Jumlah panggilan API AWS'),
+            ('errors', 'aws_cleaner_api_errors_total', 'Jumlah panggilan API yang error'),
+            ('retries', 'aws_cleaner_api_retries_total', 'Jumlah retry yang dilakuin botocore'),
+            ('throttles', 'aws_cleaner_api_throttles_total', 'Jumlah attempt yang kena throttling'),
+        ):
+            metrik(nama, 'counter', bantuan, [(label_op[op], entry[field]) for op, entry in operasi])
+        
+        baris.append("# HELP aws_cleaner_api_latency_seconds Latency panggilan API AWS termasuk retry")
+        baris.append("# TYPE aws_cleaner_api_latency_seconds histogram")
+        for op, entry in operasi:
+            service, operation = op.split('.', 1)
+            kumulatif = 0
+            for batas, jumlah in zip(list(self.LATENCY_BUCKETS) + ['+Inf'], entry['buckets']):
+                kumulatif += jumlah
+                baris.append(f"aws_cleaner_api_latency_seconds_bucket"
+                             f"{self._label(service=service, operation=operation, le=batas)} {kumulatif}")
+            baris.append(f"aws_cleaner_api_latency_seconds_sum{label_op[op]} {entry['total_s']}")
+            baris.append(f"aws_cleaner_api_latency_seconds_count{label_op[op]} {entry['calls']}")
+        
+        scanner = self.ringkasan_scanner()
+        metrik('aws_cleaner_scanner_duration_seconds', 'gauge', 'Total waktu scanner per resource type',
+               [(self._label(resource_type=rt), entry['total_s']) for rt, entry in scanner.items()])
+        metrik('aws_cleaner_scanner_resources', 'gauge', 'Jumlah unused resource yang ketemu per resource type',
+               [(self._label(resource_type=rt), entry['resources']) for rt, entry in scanner.items()])
+        
+        for field, nama, bantuan in (
+            ('unused_resources', 'aws_cleaner_unused_resources', 'Jumlah unused resource hasil scan terakhir'),
+            ('deleted_resources', 'aws_cleaner_deleted_resources', 'Jumlah resource yang sukses dihapus'),
+            ('failed_deletions', 'aws_cleaner_failed_deletions', 'Jumlah penghapusan yang gagal'),
+            ('total_savings', 'aws_cleaner_estimated_monthly_cost_dollars', 'Estimasi biaya bulanan unused resource'),
+            ('actual_savings', 'aws_cleaner_actual_monthly_savings_dollars', 'Penghematan bulanan dari resource yang dihapus'),
+        ):
+            metrik(nama, 'gauge', bantuan, [('', statistik.get(field, 0))])
+        metrik('aws_cleaner_last_run_timestamp_seconds', 'gauge', 'Waktu run terakhir selesai',
+               [('', round(time.time(), 3))])
+        return '\n'.join(baris) + '\n'
+
+
+def _direktori_cache() -> str:
+    """Folder cache lokal tool ini (ngikutin XDG_CACHE_HOME kalo di-set)"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'aws_resource_cleaner')
+
+
+class _PembacaJSONStreaming:
+    """
+    Pembaca JSON incremental buat file gede (Price List bisa bergiga-giga)
+    
+    Object di level atas diiterasi key per key, cuma value yang emang dibutuhin
+    yang di-decode utuh. Sisanya dilewatin member per member biar memory-nya kecil.
+    """
+    
+    UKURAN_CHUNK = 1 << 20
+    # Karakter yang masih bisa jadi lanjutan angka JSON
+    LANJUTAN_ANGKA = '0123456789+-.eE'
+    
+    def __init__(self, f):
+        self._f = f
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+    
+    def _isi(self) -> bool:
+        """Tambah chunk berikutnya ke buffer, False kalo file udah abis"""
+        chunk = self._f.read(self.UKURAN_CHUNK)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def _intip(self) -> str:
+        """Karakter berikutnya (lewatin whitespace), belom dikonsumsi"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._isi():
+                raise ValueError("File JSON kepotong")
+    
+    def _harus(self, karakter: str) -> None:
+        if self._intip() != karakter:
+            raise ValueError(f"JSON kagak valid: harusnya '{karakter}' di posisi {self._pos}")
+        self._pos += 1
+    
+    def value(self):
+        """Decode satu value utuh mulai dari posisi sekarang"""
+        self._intip()
+        while True:
+            try:
+                obj, akhir = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._isi():
+                    raise
+                continue
+            # Angka di ujung buffer bisa aja masih kepotong ("12" dari "123", atau "12"
+            # dari "12." / "1e" yang sisanya belom kebaca), pastiin dulu
+            angka = isinstance(obj, (int, float)) and not isinstance(obj, bool)
+            if angka and not self._eof and not self._buf[akhir:].strip(self.LANJUTAN_ANGKA) and self._isi():
+                continue
+            self._pos = akhir
+            return obj
+    
+    def members(self) -> Iterator[str]:
+        """
+        Iterasi key sebuah object satu-satu
+        
+        Tiap abis dapet key, value-nya wajib dikonsumsi dulu (value(), members(),
+        atau lewati()) sebelum lanjut ke key berikutnya.
+        """
+        self._harus('{')
+        if self._intip() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self._harus(':')
+            yield key
+            pemisah = self._intip()
+            self._pos += 1
+            if pemisah == '}':
+                return
+            if pemisah != ',':
+                raise ValueError(f"JSON kagak valid di posisi {self._pos}")
+    
+    def lewati(self) -> None:
+        """Lewatin satu value; object dilewatin per member biar kagak kebaca semua"""
+        if self._intip() == '{':
+            for _ in self.members():
+                self.lewati()
+        else:
+            self.value()
+
+
+class IndeksHarga:
+    """
+    Index harga offline dari file AWS Price List (bulk offer JSON)
+    
+    File offer (AmazonEC2, AmazonRDS, AWSELB) di-parse streaming sekali aja
+    jadi tabel SQLite kecil dengan key region, service, volume type / instance class.
+    Run berikutnya tinggal lookup (plus memo di memory), kagak perlu parse ulang
+    atau akses network. File offer baru di-parse lagi kalo ukuran/mtime-nya berubah.
+    """
+    
+    JAM_PER_BULAN = 730
+    
+    # Engine di describe_db_instances -> databaseEngine di Price List
+    ENGINE_RDS = {
+        'aurora': 'Aurora MySQL',
+        'aurora-mysql': 'Aurora MySQL',
+        'aurora-postgresql': 'Aurora PostgreSQL',
+        'mysql': 'MySQL',
+        'postgres': 'PostgreSQL',
+        'mariadb': 'MariaDB',
+        'oracle': 'Oracle',
+        'sqlserver': 'SQL Server',
+        'db2': 'Db2'
+    }
+    
+    # productFamily Price List -> jenis ELB di key index
+    JENIS_ELB = {
+        'Load Balancer': 'classic',
+        'Load Balancer-Application': 'application',
+        'Load Balancer-Network': 'network',
+        'Load Balancer-Gateway': 'gateway'
+    }
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Lokasi file index SQLite (default: ~/.cache/aws_resource_cleaner/pricing.sqlite3)
+        """
+        self.path = path or os.path.join(_direktori_cache(), 'pricing.sqlite3')
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._memo: Dict[str, Optional[Tuple[float, str]]] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS harga (key TEXT PRIMARY KEY, usd REAL, unit TEXT)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS sumber (path TEXT PRIMARY KEY, size INTEGER, mtime REAL)")
+    
+    @property
+    def kosong(self) -> bool:
+        """True kalo index belom punya harga sama sekali"""
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM harga LIMIT 1").fetchone() is None
+    
+    def bangun(self, offer_files: List[str]) -> int:
+        """
+        Index file offer yang belom/berubah sejak terakhir di-index
+        
+        Returns:
+            Jumlah harga yang ditulis ke index
+        """
+        total = 0
+        for offer_file in offer_files:
+            info = os.stat(offer_file)
+            sumber = os.path.abspath(offer_file)
+            with self._lock:
+                row = self._db.execute("SELECT size, mtime FROM sumber WHERE path = ?", (sumber,)).fetchone()
+            if row == (info.st_size, info.st_mtime):
+                continue
+            
+            console.print(f"[cyan]💲 Indexing Price List {offer_file} (cuma sekali)...[/cyan]")
+            with open(offer_file, 'r', encoding='utf-8') as f:
+                daftar_harga = self._parse_offer(f)
+            with self._lock, self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO harga VALUES (?, ?, ?)",
+                    [(key, usd, unit) for key, (usd, unit) in daftar_harga.items()]
+                )
+                self._db.execute("INSERT OR REPLACE INTO sumber VALUES (?, ?, ?)",
+                                 (sumber, info.st_size, info.st_mtime))
+            self._memo.clear()
+            total += len(daftar_harga)
+        return total
+    
+    @classmethod
+    def _parse_offer(cls, f) -> Dict[str, Tuple[float, str]]:
+        """Parse satu file offer secara streaming jadi mapping key -> (USD, unit)"""
+        pembaca = _PembacaJSONStreaming(f)
+        sku_ke_key: Dict[str, str] = {}
+        daftar_harga: Dict[str, Tuple[float, str]] = {}
+        
+        # Di file offer AWS, 'products' selalu muncul sebelum 'terms'
+        for bagian in pembaca.members():
+            if bagian == 'products':
+                for sku in pembaca.members():
+                    key = cls._key_produk(pembaca.value())
+                    if key:
+                        sku_ke_key[sku] = key
+            elif bagian == 'terms':
+                for jenis_term in pembaca.members():
+                    if jenis_term != 'OnDemand':
+                        pembaca.lewati()
+                        continue
+                    for sku in pembaca.members():
+                        terms = pembaca.value()
+                        key = sku_ke_key.get(sku)
+                        harga = cls._harga_ondemand(terms) if key else None
+                        # Satu key bisa punya beberapa SKU (license/edition beda), ambil yang termurah
+                        if harga and (key not in daftar_harga or harga[0] < daftar_harga[key][0]):
+                            daftar_harga[key] = harga
+            else:
+                pembaca.lewati()
+        return daftar_harga
+    
+    @classmethod
+    def _key_produk(cls, produk: Dict) -> Optional[str]:
+        """Key index buat produk Price List yang relevan, None kalo kagak dipake"""
+        atribut = produk.get('attributes', {})
+        region = atribut.get('regionCode')
+        if not region:
+            return None
+        family = produk.get('productFamily', '')
+        usagetype = atribut.get('usagetype', '')
+        
+        if family == 'Storage' and atribut.get('volumeApiName'):
+            return f"ebs|{region}|{atribut['volumeApiName']}"
+        if family == 'Storage Snapshot' and usagetype.endswith('EBS:SnapshotUsage'):
+            return f"snapshot|{region}|standard"
+        if family == 'IP Address' and 'IdleAddress' in usagetype:
+            return f"eip|{region}|idle"
+        if family == 'NAT Gateway' and 'NatGateway-Hours' in usagetype:
+            return f"nat|{region}|hours"
+        if family in cls.JENIS_ELB and 'LoadBalancerUsage' in usagetype:
+            return f"elb|{region}|{cls.JENIS_ELB[family]}"
+        if family == 'Database Instance' and atribut.get('deploymentOption') in ('Single-AZ', 'Multi-AZ'):
+            return (f"rds|{region}|{atribut.get('instanceType')}|"
+                    f"{atribut.get('databaseEngine')}|{atribut['deploymentOption']}")
+        return None
+    
+    @staticmethod
+    def _harga_ondemand(terms: Dict) -> Optional[Tuple[float, str]]:
+        """Ambil harga tier pertama (beginRange 0) dari term OnDemand sebuah SKU"""
+        for term in terms.values():
+            for dimensi in term.get('priceDimensions', {}).values():
+                if dimensi.get('beginRange', '0') != '0':
+                    continue
+                usd = float(dimensi.get('pricePerUnit', {}).get('USD', 0) or 0)
+                if usd > 0:
+                    return usd, dimensi.get('unit', '')
+        return None
+    
+    @classmethod
+    def key_resource(cls, resource_type: str, region: str, raw: Dict) -> Optional[str]:
+        """Key index buat resource hasil describe_*, None kalo kagak ada harganya"""
+        if resource_type == 'ebs':
+            return f"ebs|{region}|{raw.get('VolumeType', 'gp2')}"
+        if resource_type == 'snapshot':
+            return f"snapshot|{region}|standard"
+        if resource_type == 'eip':
+            return f"eip|{region}|idle"
+        if resource_type == 'nat':
+            return f"nat|{region}|hours"
+        if resource_type == 'elb':
+            return f"elb|{region}|{raw.get('Type', 'classic')}"
+        if resource_type == 'rds':
+            engine = raw.get('Engine', '').lower()
+            nama_engine = cls.ENGINE_RDS.get(engine) or cls.ENGINE_RDS.get(engine.split('-')[0])
+            if not nama_engine:
+                return None
+            deployment = 'Multi-AZ' if raw.get('MultiAZ') else 'Single-AZ'
+            return f"rds|{region}|{raw.get('DBInstanceClass')}|{nama_engine}|{deployment}"
+        return None
+    
+    def harga(self, key: str) -> Optional[Tuple[float, str]]:
+        """Lookup (USD, unit) buat satu key, hasilnya di-memo"""
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        with self._lock:
+            row = self._db.execute("SELECT usd, unit FROM harga WHERE key = ?", (key,)).fetchone()
+        self._memo[key] = hasil = (row[0], row[1]) if row else None
+        return hasil
+
+
+class PoolClientAWS:
+    """
+    Factory client boto3 yang di-cache per account, region & service
+    
+    Semua client dibikin pake satu botocore Config: pool koneksi HTTP seukuran
+    concurrency yang dipake, TCP keep-alive nyala, dan retry standard/adaptive.
+    Client botocore aman dipake bareng banyak thread, cuma pembuatannya
+    (lewat session) yang kudu dikunci.
+    """
+    
+    # Pool HTTP bawaan botocore cuma 10 koneksi per client
+    MIN_POOL_CONNECTIONS = 10
+    DEFAULT_RETRY_MODE = 'standard'
+    DEFAULT_MAX_ATTEMPTS = 5
+    RETRY_MODES = ('legacy', 'standard', 'adaptive')
+    
+    def __init__(self, max_pool_connections: Optional[int] = None,
+                 retry_mode: str = DEFAULT_RETRY_MODE, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Args:
+            max_pool_connections: Koneksi HTTP per client, samain sama jumlah thread yang make
+                (None = ditentuin pemakainya sebelum client pertama dibikin)
+            retry_mode: Mode retry botocore: legacy, standard atau adaptive
+            max_attempts: Total percobaan per request termasuk yang pertama
+        """
+        self.max_pool_connections = max_pool_connections
+        self.retry_mode = retry_mode
+        self.max_attempts = max(1, max_attempts)
+        self._clients: Dict[Tuple[Optional[str], str, str], object] = {}
+        self._lock = threading.Lock()
+        self._config = None
+    
+    def config(self):
+        """botocore Config yang dipake semua client, baru dibikin pas pertama kali butuh"""
+        if self._config is None:
+            from botocore.config import Config
+            
+            self._config = Config(
+                max_pool_connections=max(self.MIN_POOL_CONNECTIONS, self.max_pool_connections or 0),
+                tcp_keepalive=True,
+                retries={'mode': self.retry_mode, 'total_max_attempts': self.max_attempts}
+            )
+        return self._config
+    
+    def ambil(self, session, service: str, region: str, account_id: Optional[str] = None):
+        """Ambil client dari cache, atau bikin dari session kalo belom ada"""
+        key = (account_id, region, service)
+        client = self._clients.get(key)
+        if client is None:
+            # Session boto3 kagak thread-safe, jadi pembuatan client dikunci
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = session.client(service, region_name=region, config=self.config())
+                    self._clients[key] = client
+        return client
+    
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+class InventoryCache:
+    """
+    Cache hasil describe_* di SQLite lokal, biar run berikutnya (misal abis --dry-run
+    terus lanjut --batch) kagak perlu scan ulang dari nol
+    
+    Key-nya gabungan account, region, service, operation dan parameter API.
+    Entry baru dianggap valid kalo semua page-nya udah kelar ditulis dan umurnya
+    masih di bawah TTL.
+    """
+    
+    DEFAULT_TTL = 900  # detik
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL, refresh: bool = False):
+        """
+        Args:
+            path: Lokasi file SQLite (default: ~/.cache/aws_resource_cleaner/inventory.sqlite3)
+            ttl: Umur maksimal entry cache (detik)
+            refresh: Kalo True, cache lama kagak dibaca tapi hasil baru tetep ditulis
+        """
+        if not path:
+            path = os.path.join(_direktori_cache(), 'inventory.sqlite3')
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        self.path = path
+        self.ttl = ttl
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " cache_key TEXT PRIMARY KEY, account TEXT, region TEXT, operation TEXT,"
+                " created REAL, complete INTEGER)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " cache_key TEXT, page_no INTEGER, body TEXT, PRIMARY KEY (cache_key, page_no))"
+            )
+            # Sekalian buang entry yang udah kadaluarsa
+            expired = time.time() - self.ttl
+            self._db.execute(
+                "DELETE FROM pages WHERE cache_key IN (SELECT cache_key FROM entries WHERE created < ?)", (expired,)
+            )
+            self._db.execute("DELETE FROM entries WHERE created < ?", (expired,))
+    
+    @staticmethod
+    def bikin_key(account: str, region: str, service: str, operation: str, params: Dict) -> str:
+        """Bikin cache key yang stabil dari lokasi, operation dan parameter"""
+        mentah = json.dumps([account, region, service, operation, params], sort_keys=True, default=str)
+        return hashlib.sha256(mentah.encode()).hexdigest()
+    
+    @staticmethod
+    def _encode(obj):
+        if isinstance(obj, datetime):
+            return {'__dt__': obj.isoformat()}
+        return str(obj)
+    
+    @staticmethod
+    def _decode(obj: Dict):
+        if len(obj) == 1 and '__dt__' in obj:
+            return datetime.fromisoformat(obj['__dt__'])
+        return obj
+    
+    def ambil(self, cache_key: str) -> Optional[Iterator[Dict]]:
+        """Ambil page yang ke-cache, None kalo kagak ada/kadaluarsa/lagi refresh"""
+        if self.refresh:
+            self.misses += 1
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT created FROM entries WHERE cache_key = ? AND complete = 1", (cache_key,)
+            ).fetchone()
+        if not row or time.time() - row[0] > self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._baca_pages(cache_key)
+    
+    def _baca_pages(self, cache_key: str) -> Iterator[Dict]:
+        """Baca page satu-satu biar memory tetep kecil"""
+        page_no = 0
+        while True:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT body FROM pages WHERE cache_key = ? AND page_no = ?", (cache_key, page_no)
+                ).fetchone()
+            if row is None:
+                return
+            yield json.loads(row[0], object_hook=self._decode)
+            page_no += 1
+    
+    def mulai(self, cache_key: str, account: str, region: str, operation: str) -> None:
+        """Siapin entry baru (belom complete) sebelum page-nya ditulis"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM pages WHERE cache_key = ?", (cache_key,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, 0)",
+                (cache_key, account, region, operation, time.time())
+            )
+    
+    def tulis_page(self, cache_key: str, page_no: int, page: Dict) -> None:
+        """Simpen satu page hasil describe"""
+        page = {k: v for k, v in page.items() if k != 'ResponseMetadata'}
+        body = json.dumps(page, default=self._encode)
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?)", (cache_key, page_no, body))
+    
+    def selesai(self, cache_key: str) -> None:
+        """Tandain entry udah lengkap, baru abis ini boleh dibaca"""
+        with self._lock, self._db:
+            self._db.execute("UPDATE entries SET complete = 1 WHERE cache_key = ?", (cache_key,))
+    
+    def invalidasi(self, account: str, region: str) -> None:
+        """Buang semua cache buat account & region tertentu (dipanggil abis ada yang dihapus)"""
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM pages WHERE cache_key IN"
+                " (SELECT cache_key FROM entries WHERE account = ? AND region = ?)", (account, region)
+            )
+            self._db.execute("DELETE FROM entries WHERE account = ? AND region = ?", (account, region))
+
+
+class FilterResource:
+    """
+    Ekspresi --filter yang dikompil jadi parameter Filters API, sisanya baru dicek di client
+    
+    Format: FIELD OP NILAI digabung pake 'and', contoh
+    "tag:env=dev,staging and age>90 and type!=io2". NILAI yang dipisah koma artinya
+    salah satu cocok, dan boleh pake wildcard * buat operator = atau !=.
+    Cukup "tag:KEY" aja berarti tag-nya harus ada.
+    """
+    
+    FIELDS = {'tag', 'id', 'type', 'size', 'age', 'vpc', 'az', 'engine', 'region', 'account'}
+    FIELD_ANGKA = {'size', 'age'}
+    FIELD_LOKASI = {'region', 'account'}
+    
+    # Predikat '=' yang bisa dititipin ke server: resource type -> field -> nama filter API
+    FILTER_SERVER = {
+        'eip': {'tag': 'tag:{key}', 'id': 'allocation-id'},
+        'ebs': {'tag': 'tag:{key}', 'id': 'volume-id', 'type': 'volume-type', 'size': 'size',
+                'az': 'availability-zone'},
+        'snapshot': {'tag': 'tag:{key}', 'id': 'snapshot-id', 'size': 'volume-size'},
+        'eni': {'tag': 'tag:{key}', 'id': 'network-interface-id', 'vpc': 'vpc-id', 'az': 'availability-zone'},
+        'nat': {'tag': 'tag:{key}', 'id': 'nat-gateway-id', 'vpc': 'vpc-id'},
+        'rds': {'id': 'db-instance-id', 'engine': 'engine'}
+    }
+    # describe_nat_gateways namain parameternya 'Filter', sisanya 'Filters'
+    PARAM_FILTER = {'nat': 'Filter'}
+    # Filter RDS kagak ngerti wildcard
+    TANPA_WILDCARD = {'rds'}
+    
+    # Key di response describe_* buat tiap field
+    KEY_ID = {
+        'eip': 'AllocationId', 'ebs': 'VolumeId', 'snapshot': 'SnapshotId', 'eni': 'NetworkInterfaceId',
+        'nat': 'NatGatewayId', 'rds': 'DBInstanceIdentifier', 'elb': 'LoadBalancerName'
+    }
+    KEY_WAKTU = ('CreateTime', 'StartTime', 'InstanceCreateTime', 'CreatedTime')
+    KEY_SIZE = ('Size', 'VolumeSize', 'AllocatedStorage')
+    KEY_TYPE = ('VolumeType', 'DBInstanceClass', 'Type', 'InterfaceType', 'ConnectivityType')
+    
+    def __init__(self, ekspresi: Iterable[str]):
+        """
+        Args:
+            ekspresi: Satu atau lebih ekspresi --filter, semuanya digabung pake 'and'
+        
+        Raises:
+            ValueError: Kalo ada predikat yang kagak valid
+        """
+        self.ekspresi = [teks for teks in ekspresi if teks.strip()]
+        # Tiap predikat: (field, tag key, operator, daftar nilai)
+        self.predikat: List[Tuple[str, Optional[str], Optional[str], List]] = []
+        for teks in self.ekspresi:
+            # Split di 'and' yang kagak ada di dalem tanda kutip
+            for klausa in re.split(r'\s+and\s+(?=(?:[^"\']*["\'][^"\']*["\'])*[^"\']*$)', teks.strip(),
+                                   flags=re.IGNORECASE):
+                self.predikat.append(self._parse_klausa(klausa))
+        self._cache_server: Dict[str, Tuple[List[Dict], List[Tuple]]] = {}
+    
+    def _parse_klausa(self, klausa: str) -> Tuple[str, Optional[str], Optional[str], List]:
+        cocok = re.fullmatch(r'\s*([A-Za-z]+)(?::([^=!<>]+?))?\s*(?:(!=|>=|<=|=|>|<)\s*(.*?))?\s*', klausa)
+        if not cocok:
+            raise ValueError(f"Filter '{klausa}' kagak valid")
+        field, tag_key, operator, nilai = cocok.groups()
+        field = field.lower()
+        if field not in self.FIELDS or (field == 'tag') != bool(tag_key):
+            raise ValueError(f"Field '{field}' kagak dikenal, pilih: tag:KEY, {', '.join(sorted(self.FIELDS - {'tag'}))}")
+        if operator is None:
+            if field != 'tag':
+                raise ValueError(f"Filter '{klausa}' kagak ada operator-nya")
+            return field, tag_key.strip(), None, []
+        
+        values = [v.strip().strip('"\'') for v in nilai.split(',') if v.strip()]
+        if not values:
+            raise ValueError(f"Filter '{klausa}' kagak ada nilainya")
+        if field in self.FIELD_ANGKA:
+            try:
+                values = [float(v) for v in values]
+            except ValueError:
+                raise ValueError(f"Nilai '{field}' harus angka: '{klausa}'") from None
+        elif operator not in ('=', '!='):
+            raise ValueError(f"Operator '{operator}' cuma bisa buat {'/'.join(sorted(self.FIELD_ANGKA))}: '{klausa}'")
+        if operator in ('>', '>=', '<', '<=') and len(values) != 1:
+            raise ValueError(f"Operator '{operator}' cuma nerima satu nilai: '{klausa}'")
+        return field, tag_key.strip() if tag_key else None, operator, values
+    
+    def _nama_filter_server(self, resource_type: str, predikat: Tuple) -> Optional[Tuple[str, List[str]]]:
+        """(nama filter API, values) kalo predikat ini bisa dikerjain server, None kalo kagak"""
+        field, tag_key, operator, values = predikat
+        mapping = self.FILTER_SERVER.get(resource_type, {})
+        if field not in mapping:
+            return None
+        if operator is None:
+            return 'tag-key', [tag_key]
+        if operator != '=':
+            return None
+        if field in self.FIELD_ANGKA:
+            if not all(v.is_integer() for v in values):
+                return None
+            values = [str(int(v)) for v in values]
+        elif resource_type in self.TANPA_WILDCARD and any('*' in v or '?' in v for v in values):
+            return None
+        return mapping[field].format(key=tag_key), values
+    
+    def kompil(self, resource_type: str) -> Tuple[List[Dict], List[Tuple]]:
+        """(Filters buat API, predikat sisa yang dicek di client) buat satu resource type"""
+        if resource_type not in self._cache_server:
+            filters, sisa = [], []
+            for predikat in self.predikat:
+                if predikat[0] in self.FIELD_LOKASI:
+                    continue
+                server = self._nama_filter_server(resource_type, predikat)
+                if server:
+                    filters.append({'Name': server[0], 'Values': server[1]})
+                else:
+                    sisa.append(predikat)
+            self._cache_server[resource_type] = (filters, sisa)
+        return self._cache_server[resource_type]
+    
+    def params_server(self, resource_type: str) -> Tuple[str, List[Dict]]:
+        """Nama parameter filter & isinya buat API describe_* resource type ini"""
+        return self.PARAM_FILTER.get(resource_type, 'Filters'), self.kompil(resource_type)[0]
+    
+    def cocok_lokasi(self, region: str, account: Callable[[], str]) -> bool:
+        """Cek predikat region/account, biar lokasi yang kagak cocok kagak usah di-scan sama sekali"""
+        for field, _, operator, values in self.predikat:
+            if field in self.FIELD_LOKASI and not self._cek(operator, region if field == 'region' else account(), values):
+                return False
+        return True
+    
+    def pakai_tag(self, resource_type: str) -> bool:
+        """True kalo ada predikat tag yang mesti dicek di client buat resource type ini"""
+        return any(predikat[0] == 'tag' for predikat in self.kompil(resource_type)[1])
+    
+    def cocok(self, resource_type: str, raw: Dict, tags: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Cek predikat sisa (yang kagak bisa dikerjain server) ke item response describe_*
+        
+        Args:
+            resource_type: Resource type item-nya
+            raw: Item response describe_*
+            tags: Tags dari luar response (index tag:GetResources), None = baca dari raw
+        """
+        for field, tag_key, operator, values in self.kompil(resource_type)[1]:
+            if not self._cek(operator, self._nilai(field, tag_key, resource_type, raw, tags), values):
+                return False
+        return True
+    
+    def _nilai(self, field: str, tag_key: Optional[str], resource_type: str, raw: Dict,
+               tags: Optional[Dict[str, str]] = None):
+        if field == 'tag':
+            if tags is not None:
+                return tags.get(tag_key)
+            daftar_tag = raw.get('Tags') or raw.get('TagSet') or raw.get('TagList') or []
+            return next((t.get('Value', '') for t in daftar_tag if t.get('Key') == tag_key), None)
+        if field == 'id':
+            return raw.get(self.KEY_ID.get(resource_type, ''))
+        if field == 'type':
+            nilai = next((raw[key] for key in self.KEY_TYPE if raw.get(key)), None)
+            # Classic ELB kagak punya field Type
+            return nilai or ('classic' if resource_type == 'elb' else None)
+        if field == 'size':
+            return next((raw[key] for key in self.KEY_SIZE if raw.get(key) is not None), None)
+        if field == 'age':
+            waktu = next((raw[key] for key in self.KEY_WAKTU if raw.get(key)), None)
+            if waktu is None:
+                return None
+            if waktu.tzinfo is None:
+                waktu = waktu.replace(tzinfo=timezone.utc)
+            return (datetime.now(timezone.utc) - waktu).total_seconds() / 86400
+        if field == 'vpc':
+            return raw.get('VpcId') or raw.get('VPCId') or raw.get('DBSubnetGroup', {}).get('VpcId')
+        if field == 'az':
+            return raw.get('AvailabilityZone')
+        return raw.get('Engine')
+    
+    @staticmethod
+    def _cek(operator: Optional[str], nilai, values: List) -> bool:
+        if operator is None:
+            return nilai is not None
+        if nilai is None:
+            # Yang kagak punya field-nya dianggap beda sama semua nilai
+            return operator == '!='
+        if isinstance(values[0], float):
+            nilai = float(nilai)
+            if operator in ('=', '!='):
+                return any(nilai == v for v in values) == (operator == '=')
+            return {'>': nilai > values[0], '>=': nilai >= values[0],
+                    '<': nilai < values[0], '<=': nilai <= values[0]}[operator]
+        return any(fnmatch.fnmatchcase(str(nilai), v) for v in values) == (operator == '=')
+
+
+class AturanProteksi:
+    """
+    Aturan --protect-tag yang dikompil sekali, resource yang cocok kagak bakal dihapus
+    
+    Format: KEY=NILAI, NILAI yang dipisah koma artinya salah satu cocok dan boleh
+    pake wildcard *, contoh "keep=true" atau "team=payments,platform-*".
+    Cukup "KEY" aja berarti asal tag-nya ada. Aturan yang diulang digabung pake 'or'.
+    Key & nilai kagak peduli huruf gede/kecil, mending kelebihan dilindungin.
+    """
+    
+    def __init__(self, aturan: Iterable[str]):
+        """
+        Args:
+            aturan: Satu atau lebih aturan --protect-tag
+        
+        Raises:
+            ValueError: Kalo ada aturan yang kagak valid
+        """
+        self.aturan = [teks.strip() for teks in aturan if teks.strip()]
+        # Tag key (lowercase) -> regex nilai yang dilindungin (None = nilai apa aja)
+        self._pola: Dict[str, Optional[re.Pattern]] = {}
+        nilai_per_key: Dict[str, Optional[List[str]]] = {}
+        for teks in self.aturan:
+            key, sama_dengan, nilai = teks.partition('=')
+            key = key.strip().lower()
+            if not key:
+                raise ValueError(f"Aturan '{teks}' kagak ada tag key-nya")
+            if not sama_dengan:
+                nilai_per_key[key] = None
+                continue
+            values = [v.strip() for v in nilai.split(',') if v.strip()]
+            if not values:
+                raise ValueError(f"Aturan '{teks}' kagak ada nilainya")
+            if key in nilai_per_key and nilai_per_key[key] is None:
+                continue
+            nilai_per_key.setdefault(key, []).extend(values)
+        for key, values in nilai_per_key.items():
+            self._pola[key] = None if values is None else re.compile(
+                '|'.join(fnmatch.translate(v) for v in values), re.IGNORECASE
+            )
+    
+    def cocok(self, tags: Optional[Dict[str, str]]) -> Optional[str]:
+        """Balikin 'KEY=NILAI' tag yang bikin resource dilindungin, None kalo kagak ada"""
+        if not tags:
+            return None
+        for key, nilai in tags.items():
+            key_kecil = key.lower()
+            if key_kecil not in self._pola:
+                continue
+            pola = self._pola[key_kecil]
+            if pola is None or pola.match(nilai or ''):
+                return f"{key}={nilai}"
+        return None
+    
+    def butuh_tag(self, key: str) -> bool:
+        """True kalo tag key ini dicek sama salah satu aturan"""
+        return key.lower() in self._pola
+
+
+class UnusedResource:
+    """
+    Record ringkes buat satu unused resource hasil scan
+    
+    Cuma nyimpen field yang dipake buat tampilan, laporan dan penghapusan, bukan
+    seluruh response boto (tags, attachments, block device mappings, dll).
+    Response mentahnya baru ikut disimpen di `raw` kalo pake --keep-raw.
+    """
+    
+    __slots__ = (
+        'resource_type', 'resource_id', 'region', 'account_id', 'estimated_cost',
+        'size_gb', 'label', 'arn', 'unused_reason', 'protected_by', 'associated_eips', 'tags', 'raw'
+    )
+    
+    def __init__(self, resource_type: str, resource_id: str, region: str,
+                 account_id: Optional[str] = None, estimated_cost: float = 0.0,
+                 size_gb: Optional[int] = None, label: Optional[str] = None,
+                 arn: Optional[str] = None, unused_reason: Optional[str] = None,
+                 tags: Optional[Dict[str, str]] = None, raw: Optional[Dict] = None,
+                 protected_by: Optional[str] = None,
+                 associated_eips: Optional[List[Dict[str, str]]] = None):
+        """
+        Args:
+            resource_type: Key di SUPPORTED_RESOURCES (eip, ebs, dll)
+            resource_id: ID yang dipake buat hapus (AllocationId, VolumeId, nama LB, dll)
+            region: Region tempat resource-nya
+            account_id: Account hasil AssumeRole (None = kredensial utama)
+            estimated_cost: Estimasi biaya per bulan
+            size_gb: Ukuran dalam GB (cuma EBS & Snapshot)
+            label: Nama buat ditampilin kalo beda sama ID-nya (contoh: Public IP buat EIP)
+            arn: ARN, dipake buat bedain ALB/NLB dari Classic ELB
+            unused_reason: Alasan kenapa dianggap unused
+            tags: Tag resource (Key -> Value), cuma key yang dipake --rollup-tag/--protect-tag
+            raw: Response boto mentah, cuma diisi kalo --keep-raw
+            protected_by: Aturan --protect-tag yang cocok, resource-nya kagak bakal dihapus
+            associated_eips: EIP yang nempel di NAT (allocation_id & public_ip), ikut
+                dilepas abis NAT-nya kehapus
+        """
+        self.resource_type = resource_type
+        self.resource_id = resource_id
+        self.region = region
+        self.account_id = account_id
+        self.estimated_cost = estimated_cost
+        self.size_gb = size_gb
+        self.label = label
+        self.arn = arn
+        self.unused_reason = unused_reason
+        self.protected_by = protected_by
+        self.associated_eips = associated_eips
+        self.tags = tags
+        self.raw = raw
+    
+    def ke_dict(self) -> Dict:
+        """Versi dict buat laporan JSON, field yang kosong kagak diikutin"""
+        return {
+            field: getattr(self, field) for field in self.__slots__
+            if getattr(self, field) is not None
+        }
+    
+    def __repr__(self) -> str:
+        return f"UnusedResource({self.resource_type}, {self.resource_id}, {self.region})"
+
+
+class RollupBiaya:
+    """
+    Agregasi biaya & ukuran resource hasil scan dalam bentuk kolom NumPy
+    
+    Array cost/size dan kode kategori (type, region, account) dibangun sekali per
+    scan, terus ringkasan per dimensi dihitung pake bincount. Abis itu semua
+    tampilan & laporan tinggal ambil dari dict, kagak ada loop grouping ulang.
+    Penghematan aktual dicatet per resource yang beneran sukses dihapus.
+    """
+    
+    DIMENSI = ('resource_type', 'region', 'account_id')
+    TANPA_TAG = '(untagged)'
+    
+    def __init__(self, resources: List[UnusedResource], region_default: str):
+        """
+        Args:
+            resources: Hasil scan yang mau diagregasi
+            region_default: Region pengganti kalo resource kagak punya region
+        """
+        import numpy as np
+        
+        self.resources = resources
+        jumlah = len(resources)
+        self.cost = np.fromiter((r.estimated_cost for r in resources), dtype=np.float64, count=jumlah)
+        self.size = np.fromiter((r.size_gb or 0 for r in resources), dtype=np.float64, count=jumlah)
+        self.kehapus = np.zeros(jumlah, dtype=bool)
+        self.total_cost = float(self.cost.sum())
+        self.total_size_gb = float(self.size.sum())
+        self.penghematan_aktual = 0.0
+        
+        self._posisi = {id(r): i for i, r in enumerate(resources)}
+        self._lock = threading.Lock()
+        self._kode: Dict[str, np.ndarray] = {}
+        self._label: Dict[str, List[str]] = {}
+        self._ringkasan: Dict[str, Dict[str, Dict]] = {}
+        self._kelompok: Dict[str, Dict[str, List[UnusedResource]]] = {}
+        
+        default = {'resource_type': 'unknown', 'region': region_default, 'account_id': 'default'}
+        for field in self.DIMENSI:
+            self._encode(field, (getattr(r, field) or default[field] for r in resources))
+        for field in self.DIMENSI:
+            self._ringkasan[field] = self._hitung_ringkasan(field)
+    
+    def _encode(self, field: str, nilai: Iterable[str]) -> None:
+        """Ubah nilai kategori jadi kode integer, urutannya ngikutin kemunculan pertama"""
+        import numpy as np
+        
+        label_ke_kode: Dict[str, int] = {}
+        kode = np.fromiter(
+            (label_ke_kode.setdefault(v, len(label_ke_kode)) for v in nilai),
+            dtype=np.int64, count=len(self.resources)
+        )
+        self._kode[field] = kode
+        self._label[field] = list(label_ke_kode)
+    
+    def _hitung_ringkasan(self, field: str) -> Dict[str, Dict]:
+        """Jumlah, cost, size dan breakdown per type buat tiap nilai field"""
+        import numpy as np
+        
+        kode, label = self._kode[field], self._label[field]
+        kode_type, label_type = self._kode['resource_type'], self._label['resource_type']
+        n, n_type = len(label), len(label_type)
+        
+        jumlah = np.bincount(kode, minlength=n)
+        cost = np.bincount(kode, weights=self.cost, minlength=n)
+        size = np.bincount(kode, weights=self.size, minlength=n)
+        per_type = np.bincount(kode * n_type + kode_type, minlength=n * n_type).reshape(n, n_type)
+        
+        return {
+            label[i]: {
+                'count': int(jumlah[i]),
+                'total_cost': float(cost[i]),
+                'total_size_gb': float(size[i]),
+                'types': {label_type[j]: int(per_type[i, j]) for j in np.flatnonzero(per_type[i])}
+            }
+            for i in range(n)
+        }
+    
+    def ringkasan(self, field: str) -> Dict[str, Dict]:
+        """Rollup per resource_type, region, account_id, atau 'tag:<Key>'"""
+        if field not in self._ringkasan and field.startswith('tag:'):
+            key = field[4:]
+            with self._lock:
+                self._encode(field, ((r.tags or {}).get(key, self.TANPA_TAG) for r in self.resources))
+                self._ringkasan[field] = self._hitung_ringkasan(field)
+        return self._ringkasan[field]
+    
+    def kelompok(self, field: str) -> Dict[str, List[UnusedResource]]:
+        """Resource dikelompokin per nilai field, urutan di dalem grup tetap"""
+        if field not in self._kelompok:
+            import numpy as np
+            
+            kode = self._kode[field]
+            urutan = np.argsort(kode, kind='stable')
+            batas = np.cumsum(np.bincount(kode, minlength=len(self._label[field])))[:-1]
+            self._kelompok[field] = {
+                label: [self.resources[i] for i in indeks]
+                for label, indeks in zip(self._label[field], np.split(urutan, batas))
+            }
+        return self._kelompok[field]
+    
+    def tandai_kehapus(self, resource: UnusedResource) -> bool:
+        """
+        Catet resource yang sukses dihapus biar penghematan aktualnya pas
+        
+        Returns:
+            False kalo resource-nya kagak ada di rollup ini
+        """
+        posisi = self._posisi.get(id(resource))
+        if posisi is None:
+            return False
+        with self._lock:
+            if not self.kehapus[posisi]:
+                self.kehapus[posisi] = True
+                self.penghematan_aktual += float(self.cost[posisi])
+        return True
+
+
+class LaporanStreaming:
+    """
+    Laporan NDJSON yang ditulis sambil scan jalan, satu baris per resource
+    
+    Baris pertama header (info run), terus satu baris per resource begitu ketemu,
+    dan baris terakhir trailer berisi statistik + ringkasan yang dihitung running.
+    Jadi kagak perlu nahan semua resource di memory cuma buat bikin laporan.
+    """
+    
+    def __init__(self, nama_file: str, header: Dict, compress: bool = False, file=None):
+        """
+        Args:
+            nama_file: Path file laporan
+            header: Info run yang ditulis di baris pertama
+            compress: Tulis pake gzip
+            file: File yang udah kebuka (contoh sys.stdout), kagak ikut ditutup
+        """
+        self.nama_file = nama_file
+        self._tutup_file = file is None
+        if file is not None:
+            self._file = file
+        elif compress:
+            self._file = gzip.open(nama_file, 'wt', encoding='utf-8')
+        else:
+            self._file = open(nama_file, 'w', encoding='utf-8')
+        self.jumlah = 0
+        self.total_cost = 0.0
+        self._ringkasan: Dict[str, Dict[str, Dict]] = {'resource_type': {}, 'region': {}, 'account_id': {}}
+        self._tulis_baris({'record': 'header', **header})
+    
+    def _tulis_baris(self, data: Dict) -> None:
+        self._file.write(json.dumps(data, default=str))
+        self._file.write('\n')
+    
+    def tulis_resource(self, resource: UnusedResource) -> None:
+        """Tulis satu resource sekaligus update ringkasan running"""
+        self._tulis_baris({'record': 'resource', **resource.ke_dict()})
+        self.jumlah += 1
+        self.total_cost += resource.estimated_cost
+        for field, ringkasan in self._ringkasan.items():
+            nilai = getattr(resource, field) or 'default'
+            entry = ringkasan.setdefault(nilai, {'count': 0, 'total_cost': 0.0, 'types': {}})
+            entry['count'] += 1
+            entry['total_cost'] += resource.estimated_cost
+            entry['types'][resource.resource_type] = entry['types'].get(resource.resource_type, 0) + 1
+    
+    def tutup(self, statistik: Dict, lengkap: bool = True, api_metrics: Optional[Dict] = None) -> None:
+        """Tulis trailer ringkasan terus tutup file-nya"""
+        self._tulis_baris({
+            'record': 'summary',
+            'complete': lengkap,
+            'statistik': statistik,
+            'resource_summary': {
+                resource_type: {'count': entry['count'], 'total_cost': entry['total_cost']}
+                for resource_type, entry in self._ringkasan['resource_type'].items()
+            },
+            'region_summary': self._ringkasan['region'],
+            'account_summary': self._ringkasan['account_id'],
+            'total_potential_savings': {
+                'monthly': self.total_cost,
+                'yearly': self.total_cost * 12
+            },
+            'api_metrics': api_metrics
+        })
+        if self._tutup_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class LaporanStreamingJSON(LaporanStreaming):
+    """
+    Varian satu dokumen JSON dari LaporanStreaming
+    
+    Resource tetep ditulis satu-satu begitu ketemu, cuma dibungkus array
+    'resources', terus ringkasannya jadi field 'summary' di akhir dokumen.
+    """
+    
+    def _tulis_baris(self, data: Dict) -> None:
+        record = data.pop('record')
+        if record == 'header':
+            self._file.write('{"info": ' + json.dumps(data, default=str) + ', "resources": [')
+        elif record == 'resource':
+            self._file.write((',\n' if self.jumlah else '\n') + json.dumps(data, default=str))
+        else:
+            self._file.write('\n], "summary": ' + json.dumps(data, default=str) + '}\n')
+
+
+class JournalHapus:
+    """
+    Write-ahead journal buat batch delete, append-only format NDJSON
+    
+    Isinya header (info run + statistik scan), satu baris 'plan' per resource
+    yang mau dihapus, terus 'mulai' sebelum API delete dipanggil dan 'hasil'
+    abis kelar. 'mulai' satu gelombang dispatch ditulis bareng terus di-fsync sekali
+    sebelum API-nya dipanggil, fsync 'hasil' digabung per interval. Kalo run-nya mati di tengah, --resume tinggal baca ulang
+    journal ini: resource yang udah ada hasilnya dilewatin, sisanya dilanjutin tanpa
+    scan ulang. Journal di folder default yang semua resource-nya udah ada hasilnya
+    langsung dihapus pas ditutup.
+    """
+    
+    VERSI = 1
+    FSYNC_INTERVAL = 1.0  # detik
+    # Kode 'error' hasil buat resource yang sengaja kagak dihapus (dilindungin --protect-tag)
+    DILEWATIN = 'Dilewatin'
+    
+    def __init__(self, nama_file: str):
+        """
+        Args:
+            nama_file: Path file journal
+        """
+        self.nama_file = nama_file
+        self.header: Dict = {}
+        self.resources: List[UnusedResource] = []
+        # Nomor plan -> (sukses, kode error)
+        self.hasil: Dict[int, Tuple[bool, Optional[str]]] = {}
+        # Nomor plan yang udah pernah dicoba di run sebelumnya tapi belom ada hasilnya
+        self.kepotong: Set[int] = set()
+        # (type, ID, region, account) -> nomor plan
+        self._nomor: Dict[Tuple, int] = {}
+        self._file = None
+        self._lock = threading.Lock()
+        self._fsync_terakhir = 0.0
+    
+    @staticmethod
+    def folder_default() -> str:
+        """Folder journal default di dalem folder cache"""
+        return os.path.join(_direktori_cache(), 'journal')
+    
+    @classmethod
+    def nama_default(cls) -> str:
+        """Path journal default di folder cache, pake timestamp"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return os.path.join(cls.folder_default(), f"hapus_{timestamp}.ndjson")
+    
+    @classmethod
+    def baru(cls, nama_file: str, header: Dict, resources: List[UnusedResource]) -> 'JournalHapus':
+        """Bikin journal baru, header & plan semua resource langsung di-fsync"""
+        folder = os.path.dirname(os.path.abspath(nama_file))
+        os.makedirs(folder, exist_ok=True)
+        journal = cls(nama_file)
+        journal.header = {'record': 'header', 'versi': cls.VERSI, **header}
+        journal._file = open(nama_file, 'xb')
+        journal._tulis(journal.header)
+        for resource in resources:
+            journal._tulis_plan(resource)
+        journal._sync(paksa=True)
+        return journal
+    
+    @classmethod
+    def buka(cls, nama_file: str) -> 'JournalHapus':
+        """
+        Baca ulang journal yang udah ada terus buka buat ditambahin
+        
+        Baris terakhir yang kepotong (proses mati pas lagi nulis) dibuang.
+        
+        Raises:
+            ValueError: Kalo file-nya bukan journal atau ada baris rusak di tengah
+        """
+        journal = cls(nama_file)
+        dimulai: Set[int] = set()
+        panjang_valid = 0
+        with open(nama_file, 'rb') as f:
+            for nomor_baris, baris in enumerate(f, 1):
+                try:
+                    data = json.loads(baris)
+                except ValueError:
+                    # Cuma baris terakhir yang boleh kepotong
+                    if f.read(1):
+                        raise ValueError(f"journal rusak di baris {nomor_baris}")
+                    break
+                panjang_valid += len(baris)
+                jenis = data.get('record')
+                if jenis == 'header':
+                    journal.header = data
+                elif jenis == 'plan':
+                    journal._tambah_plan(UnusedResource(**data['resource']))
+                elif jenis == 'mulai':
+                    dimulai.add(data['n'])
+                elif jenis == 'hasil':
+                    journal.hasil[data['n']] = (data['ok'], data.get('error'))
+        if journal.header.get('versi') != cls.VERSI:
+            raise ValueError(f"{nama_file} bukan journal penghapusan (versi {cls.VERSI})")
+        journal.kepotong = dimulai - set(journal.hasil)
+        
+        # Binary biar offset truncate/seek-nya sama persis kayak panjang byte yang dibaca
+        journal._file = open(nama_file, 'r+b')
+        journal._file.truncate(panjang_valid)
+        journal._file.seek(panjang_valid)
+        journal._tulis({'record': 'resume', 'timestamp': datetime.now().isoformat()})
+        journal._sync(paksa=True)
+        return journal
+    
+    @staticmethod
+    def _kunci(resource: UnusedResource) -> Tuple:
+        """Identitas resource di plan, tetep sama walaupun record-nya dibikin ulang"""
+        return resource.resource_type, resource.resource_id, resource.region, resource.account_id
+    
+    def _tambah_plan(self, resource: UnusedResource) -> None:
+        self._nomor[self._kunci(resource)] = len(self.resources)
+        self.resources.append(resource)
+    
+    def _tulis_plan(self, resource: UnusedResource) -> None:
+        self._tambah_plan(resource)
+        data = resource.ke_dict()
+        data.pop('raw', None)
+        self._tulis({'record': 'plan', 'n': len(self.resources) - 1, 'resource': data})
+    
+    def tambah(self, resource: UnusedResource) -> None:
+        """Tambahin resource ke plan di tengah run (misalnya EIP bekas NAT)"""
+        with self._lock:
+            self._tulis_plan(resource)
+            self._sync(paksa=True)
+    
+    def _tulis(self, *data: Dict) -> None:
+        self._file.write(b''.join(json.dumps(d, default=str).encode('utf-8') + b'\n' for d in data))
+        self._file.flush()
+    
+    def _sync(self, paksa: bool = False) -> None:
+        """fsync ke disk, kecuali fsync terakhir belom lewat FSYNC_INTERVAL"""
+        sekarang = time.monotonic()
+        if paksa or sekarang - self._fsync_terakhir >= self.FSYNC_INTERVAL:
+            os.fsync(self._file.fileno())
+            self._fsync_terakhir = sekarang
+    
+    def catat_mulai(self, resources: List[UnusedResource]) -> None:
+        """
+        Catet niat hapus satu gelombang sebelum API delete-nya dipanggil
+        
+        Semua baris 'mulai'-nya ditulis dulu, terus di-fsync sekali di luar lock
+        biar catat_hasil dari thread lain kagak ikut ketahan.
+        """
+        with self._lock:
+            self._tulis(*({'record': 'mulai', 'n': self._nomor[self._kunci(r)]} for r in resources))
+            fd = self._file.fileno()
+        # Kalo mati abis API-nya kepanggil, --resume mesti tau resource ini udah dicoba
+        os.fsync(fd)
+        self._fsync_terakhir = time.monotonic()
+    
+    def catat_hasil(self, resource: UnusedResource, sukses: bool, error: Optional[str] = None) -> None:
+        """Catet hasil akhir penghapusan satu resource"""
+        n = self._nomor[self._kunci(resource)]
+        with self._lock:
+            self.hasil[n] = (sukses, error)
+            self._tulis({'record': 'hasil', 'n': n, 'ok': sukses, 'error': error})
+            self._sync()
+    
+    def pernah_dicoba(self, resource: UnusedResource) -> bool:
+        """True kalo run sebelumnya udah manggil API delete tapi kagak sempet nyatet hasilnya"""
+        return self._nomor.get(self._kunci(resource)) in self.kepotong
+    
+    def sisa(self) -> List[UnusedResource]:
+        """Resource yang belom ada hasil akhirnya, urutannya sama kayak plan"""
+        return [r for n, r in enumerate(self.resources) if n not in self.hasil]
+    
+    def kelar(self) -> bool:
+        """True kalo semua resource di plan udah ada hasil akhirnya"""
+        return len(self.hasil) == len(self.resources)
+    
+    def beresin(self) -> bool:
+        """
+        Tutup journal, yang udah kelar & ada di folder default sekalian dihapus
+        
+        Journal yang path-nya dikasih sendiri (--journal) kagak pernah dihapus.
+        
+        Returns:
+            True kalo file journal-nya dihapus
+        """
+        self.tutup()
+        folder = os.path.dirname(os.path.abspath(self.nama_file))
+        if not self.kelar() or folder != os.path.abspath(self.folder_default()):
+            return False
+        try:
+            os.remove(self.nama_file)
+        except OSError:
+            return False
+        return True
+    
+    def tutup(self) -> None:
+        """fsync terakhir terus tutup file-nya"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._sync(paksa=True)
+            self._file.close()
+            self._file = None
+
 
 class AWSResourceCleanerBetawi:
     """Kelas Manager AWS Resources yang Kece Pake Bahasa Betawi"""
@@ -88,80 +1615,395 @@ class AWSResourceCleanerBetawi:
         }
     }
     
-    def __init__(self, profile: Optional[str] = None, region: Optional[str] = None):
+    # Prefix detail resource buat tampilan
+    DETAIL_PREFIX = {
+        'eip': 'IP',
+        'elb': 'LB',
+        'ebs': 'Volume',
+        'snapshot': 'Snapshot',
+        'rds': 'RDS',
+        'nat': 'NAT',
+        'eni': 'ENI'
+    }
+    
+    # Jumlah worker default buat scan paralel (satu worker per resource type)
+    DEFAULT_SCAN_WORKERS = 7
+    
+    # Page size default buat paginator describe_*
+    DEFAULT_PAGE_SIZE = 1000
+    
+    # Umur minimal snapshot (hari) biar dianggap lama
+    DEFAULT_SNAPSHOT_AGE_DAYS = 30
+    
+    # Jumlah maksimal cek health target/instance LB yang jalan barengan
+    DEFAULT_HEALTH_CHECK_WORKERS = 8
+    
+    # Look-back (hari) buat nentuin RDS/LB/NAT idle dari metrik CloudWatch
+    DEFAULT_IDLE_DAYS = 14
+    
+    # GetMetricData nerima maksimal 500 query per call
+    CLOUDWATCH_BATCH_SIZE = 500
+    # Hasil _ambil_metrik kalo metriknya gagal diambil: kagak ketauan, jadi kagak dianggep idle
+    METRIK_GAGAL = object()
+    
+    # Metrik idle per jenis: (namespace, metric, statistic) - nol selama window berarti idle
+    METRIK_IDLE = {
+        'rds': ('AWS/RDS', 'DatabaseConnections', 'Maximum'),
+        'alb': ('AWS/ApplicationELB', 'RequestCount', 'Sum'),
+        'nlb': ('AWS/NetworkELB', 'NewFlowCount', 'Sum'),
+        'clb': ('AWS/ELB', 'RequestCount', 'Sum'),
+        'nat': ('AWS/NATGateway', 'BytesOutToDestination', 'Sum')
+    }
+    
+    # Nama role default yang di-assume di tiap member account
+    DEFAULT_ROLE_NAME = 'OrganizationAccountAccessRole'
+    
+    # Resource type di Resource Groups Tagging API & bagian resource dari ARN-nya.
+    # Index tag cuma di-sweep buat type yang response describe_*-nya kagak bawa tag
+    TAG_RESOURCE_TYPE = {
+        'eip': ('ec2:elastic-ip', 'elastic-ip/{}'),
+        'ebs': ('ec2:volume', 'volume/{}'),
+        'snapshot': ('ec2:snapshot', 'snapshot/{}'),
+        'nat': ('ec2:natgateway', 'natgateway/{}'),
+        'eni': ('ec2:network-interface', 'network-interface/{}'),
+        'elb': ('elasticloadbalancing:loadbalancer', 'loadbalancer/{}'),
+        'rds': ('rds:db', 'db:{}')
+    }
+    TAG_DI_DESCRIBE = {'eip', 'ebs', 'snapshot', 'nat', 'eni', 'rds'}
+    
+    # Format --output: table & summary lewat Rich, sisanya buat mesin langsung ke stdout
+    FORMAT_OUTPUT = ('table', 'summary', 'json', 'ndjson')
+    FORMAT_MESIN = ('json', 'ndjson')
+    DEFAULT_MAX_ROWS = 50
+    
+    # Durasi kredensial AssumeRole (detik), di-refresh otomatis sebelum expired
+    ASSUME_ROLE_DURATION = 3600
+    
+    # Urutan hapus berdasarkan dependency: tier pertama harus kelar duluan
+    DELETE_TIERS = [
+        ('nat', 'elb', 'rds'),
+        ('eni', 'eip', 'ebs', 'snapshot')
+    ]
+    
+    # Jumlah maksimal penghapusan barengan per resource type
+    DEFAULT_DELETE_CONCURRENCY = {
+        'snapshot': 8,
+        'ebs': 8,
+        'eip': 4,
+        'eni': 4,
+        'nat': 2,
+        'elb': 2,
+        'rds': 1
+    }
+    
+    # Error delete yang sifatnya sementara, dicoba lagi pake backoff. Snapshot yang dipake
+    # AMI atau volume yang ke-attach lagi kagak bakal beres sendiri, jadi langsung gagal
+    RETRYABLE_DELETE_ERRORS = {
+        'DependencyViolation', 'InvalidNetworkInterface.InUse', 'InvalidIPAddress.InUse',
+        'IncorrectState', 'ResourceInUse', 'InvalidDBInstanceState', 'Throttling',
+        'RequestLimitExceeded'
+    }
+    MAX_DELETE_ATTEMPTS = 6
+    
+    # Error delete yang artinya resource-nya udah kagak ada, pas --resume dianggep sukses
+    # kalo run sebelumnya sempet manggil API delete-nya
+    NOT_FOUND_DELETE_ERRORS = {
+        'InvalidAllocationID.NotFound', 'InvalidVolume.NotFound', 'InvalidSnapshot.NotFound',
+        'InvalidNetworkInterfaceID.NotFound', 'NatGatewayNotFound', 'DBInstanceNotFound',
+        'LoadBalancerNotFound'
+    }
+    DELETE_BACKOFF_BASE = 2.0   # detik, dobel tiap percobaan
+    DELETE_BACKOFF_MAX = 60.0
+    
+    # Nungguin NAT Gateway sampe statusnya 'deleted'
+    NAT_DELETE_TIMEOUT = 600
+    NAT_DELETE_POLL_INTERVAL = 15
+    
+    # Operation yang hasilnya nentuin resource dianggap unused/dilindungin atau kagak, jadi
+    # selalu ditanya langsung ke AWS, kagak lewat cache inventory
+    OPERASI_TANPA_CACHE = {'describe_target_health', 'describe_instance_health', 'get_resources'}
+    
+    # Batas page size (min, max) per service atau per service.operation
+    PAGE_SIZE_LIMITS = {
+        'resourcegroupstaggingapi': (1, 100),
+        'ec2': (5, 1000),
+        'ec2.describe_route_tables': (5, 100),
+        'rds': (20, 100),
+        'elbv2': (1, 400),
+        'elb': (1, 400)
+    }
+    
+    def __init__(self, profile: Optional[str] = None, region: Optional[str] = None,
+                 scan_workers: int = DEFAULT_SCAN_WORKERS, page_size: int = DEFAULT_PAGE_SIZE,
+                 snapshot_age_days: int = DEFAULT_SNAPSHOT_AGE_DAYS,
+                 health_check_workers: int = DEFAULT_HEALTH_CHECK_WORKERS,
+                 idle_days: int = DEFAULT_IDLE_DAYS,
+                 regions: Optional[List[str]] = None, accounts: Optional[List[str]] = None,
+                 role_name: str = DEFAULT_ROLE_NAME, external_id: Optional[str] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 delete_concurrency: Optional[Dict[str, int]] = None,
+                 inventory_cache: Optional[InventoryCache] = None,
+                 keep_raw: bool = False,
+                 rollup_tags: Optional[List[str]] = None,
+                 pricing: Optional[IndeksHarga] = None,
+                 metrik_api: Optional[MetrikAPI] = None,
+                 console: Optional[Console] = None,
+                 filter_resource: Optional[FilterResource] = None,
+                 pool_client: Optional[PoolClientAWS] = None,
+                 output: str = 'table', max_rows: int = DEFAULT_MAX_ROWS,
+                 proteksi: Optional[AturanProteksi] = None):
         """
         Inisialisasi Manager AWS Resources
         
         Args:
             profile: Profile AWS yang mau dipake
             region: Region AWS yang mau dioperasiin
+            scan_workers: Jumlah maksimal scanner yang jalan barengan
+            page_size: Jumlah item per page waktu manggil API describe_*
+            snapshot_age_days: Snapshot yang lebih tua dari ini (hari) dianggap lama
+            health_check_workers: Jumlah maksimal cek health LB yang jalan barengan
+            idle_days: Look-back (hari) metrik CloudWatch buat nentuin RDS/LB/NAT idle
+            regions: Daftar region yang mau di-scan, atau ['all'] buat semua region yang enabled
+            accounts: Daftar account ID atau role ARN yang mau di-scan lewat AssumeRole
+            role_name: Nama role yang di-assume kalo yang dikasih cuma account ID
+            external_id: ExternalId buat AssumeRole (kalo role-nya minta)
+            rate_limiter: Limiter adaptif yang dipake bareng semua panggilan API
+            delete_concurrency: Override jumlah penghapusan barengan per resource type
+            inventory_cache: Cache hasil describe_* di disk (None = kagak pake cache)
+            keep_raw: Simpen response boto mentah di tiap record (makan memory lebih banyak)
+            rollup_tags: Tag key yang ikut dirollup di tampilan & laporan
+            pricing: Index harga offline (None = pake estimasi di SUPPORTED_RESOURCES)
+            metrik_api: Instrumentasi API (default: bikin baru)
+            console: Console Rich buat output (default: console global, Console(quiet=True) = diem)
+            filter_resource: Ekspresi --filter yang udah di-parse (None = semua resource)
+            pool_client: Factory client (default: pool seukuran concurrency scan/health check/delete)
+            output: Format hasil: table, summary, json atau ndjson (json/ndjson ke stdout tanpa Rich)
+            max_rows: Baris maksimal per resource type di tabel, diambil yang paling mahal (0 = semua)
+            proteksi: Aturan --protect-tag, resource yang cocok kagak ikut hasil scan
         """
         self.profile = profile
         self.region = region or os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
+        self.scan_workers = max(1, scan_workers)
+        self.page_size = max(1, page_size)
+        self.snapshot_age_days = max(0, snapshot_age_days)
+        self.health_check_workers = max(1, health_check_workers)
+        self.idle_days = max(1, idle_days)
+        self._cache_metrik: Dict[Tuple, Optional[float]] = {}
+        self._cache_metrik_lock = threading.Lock()
+        self._jendela_metrik: Optional[Tuple[datetime, datetime]] = None
+        self.regions = [self.region]
+        # None = account dari kredensial default (tanpa AssumeRole)
+        self.accounts: List[Optional[str]] = [None]
+        self.role_name = role_name
+        self.external_id = external_id
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.delete_concurrency = {**self.DEFAULT_DELETE_CONCURRENCY, **(delete_concurrency or {})}
+        self.inventory_cache = inventory_cache
+        self.keep_raw = keep_raw
+        self.laporan_streaming: Optional[LaporanStreaming] = None
+        self.journal: Optional[JournalHapus] = None
+        self.output = output
+        self.max_rows = max(0, max_rows)
+        self.output_streaming: Optional[LaporanStreaming] = None
+        self.proteksi = proteksi
+        # (account_id, region) -> bagian resource ARN -> tags, dari sweep tag:GetResources
+        self._index_tag: Dict[Tuple, Dict[str, Dict[str, str]]] = {}
+        self._index_tag_lock = threading.Lock()
+        self._index_tag_lock_lokasi: Dict[Tuple, threading.Lock] = {}
+        self._tipe_index_tag: List[str] = []
+        self.rollup_tags = rollup_tags or []
+        self.rollup: Optional[RollupBiaya] = None
+        self.pricing = pricing
+        self.metrik_api = metrik_api or MetrikAPI()
+        self._console = console
+        self.filter_resource = filter_resource
+        self._account_default: Optional[str] = None
+        self._account_default_lock = threading.Lock()
         self.session = None
-        self.clients = {}
+        self.account_sessions = {}
+        # Account ID -> role ARN yang berhasil di-assume, disimpen di journal buat --resume
+        self.role_arns: Dict[str, str] = {}
+        self.pool_client = pool_client if pool_client is not None else PoolClientAWS()
+        if self.pool_client.max_pool_connections is None:
+            self.pool_client.max_pool_connections = self.ukuran_pool_koneksi()
         self.selected_resources = set()
         self.statistik = {
             'total_resources': 0,
             'unused_resources': 0,
             'deleted_resources': 0,
             'failed_deletions': 0,
-            'total_savings': 0.0
+            'total_savings': 0.0,
+            'actual_savings': 0.0,
+            'protected_resources': 0
         }
+        self._statistik_lock = threading.Lock()
+        self._hemat_di_luar_rollup = 0.0
         
         self._setup_logging()
         self._inisialisasi_clients_aws()
+        if regions:
+            self.regions = self._resolve_regions(regions)
+        if accounts:
+            self._siapin_sessions_akun(accounts)
+    
+    @property
+    def console(self) -> Console:
+        """Console Rich yang dipake instance ini"""
+        return self._console if self._console is not None else _konsol()
     
     def _setup_logging(self) -> None:
         """Setup logging yang kece pake Rich handler"""
+        from rich.logging import RichHandler
+        
         logging.basicConfig(
             level=logging.INFO,
             format="%(message)s",
             datefmt="[%X]",
-            handlers=[RichHandler(console=console, rich_tracebacks=True)]
+            handlers=[RichHandler(console=self.console, rich_tracebacks=True)]
         )
         self.logger = logging.getLogger("AWS_Resource_Cleaner_Betawi")
     
     def _inisialisasi_clients_aws(self) -> None:
-        """Inisialisasi clients AWS dengan error handling yang mantap"""
+        """
+        Siapin session AWS dengan error handling yang mantap
+        
+        Client per service baru dibikin pas pertama kali dipake, dan kredensial
+        baru kevalidasi di API call beneran pertama (kagak ada probe lagi).
+        """
+        import boto3
+        
         try:
             # Bikin session pake profile kalo ada
             if self.profile:
                 self.session = boto3.Session(profile_name=self.profile)
-                console.print(f"[green]✓[/green] Pake profile AWS: [bold cyan]{self.profile}[/bold cyan]")
+                self.console.print(f"[green]✓[/green] Pake profile AWS: [bold cyan]{self.profile}[/bold cyan]")
             else:
                 self.session = boto3.Session()
-                console.print("[green]✓[/green] Pake kredensial AWS default nih")
-            
-            # Inisialisasi berbagai clients
-            self.clients = {
-                'ec2': self.session.client('ec2', region_name=self.region),
-                'elbv2': self.session.client('elbv2', region_name=self.region),
-                'elb': self.session.client('elb', region_name=self.region),
-                'rds': self.session.client('rds', region_name=self.region)
-            }
-            
-            # Test kredensial dengan panggil API sederhana
-            self.clients['ec2'].describe_regions(RegionNames=[self.region])
-            console.print(f"[green]✓[/green] Udah konek ke region AWS: [bold cyan]{self.region}[/bold cyan]")
+                self.console.print("[green]✓[/green] Pake kredensial AWS default nih")
+            self.rate_limiter.pasang(self.session.events)
+            self.metrik_api.pasang(self.session.events)
+            self.console.print(f"[green]✓[/green] Region utama: [bold cyan]{self.region}[/bold cyan]")
             
         except ProfileNotFound as e:
-            console.print(f"[red]✗[/red] Profile AWS '{self.profile}' kagak ketemu, Bos!")
+            self.console.print(f"[red]✗[/red] Profile AWS '{self.profile}' kagak ketemu, Bos!")
             sys.exit(1)
-        except (NoCredentialsError, PartialCredentialsError):
-            console.print("[red]✗[/red] Kredensial AWS kagak ada atau kurang lengkap nih!")
-            console.print("Tolong setting kredensial AWS pake:")
-            console.print("  • aws configure")
-            console.print("  • Environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)")
-            console.print("  • IAM roles (buat instance EC2)")
-            sys.exit(1)
-        except ClientError as e:
-            console.print(f"[red]✗[/red] Error konek ke AWS: {e}")
+    
+    @property
+    def multi_account(self) -> bool:
+        """True kalo scan-nya lewat AssumeRole ke member accounts"""
+        return any(self.accounts)
+    
+    def ukuran_pool_koneksi(self) -> int:
+        """
+        Jumlah thread paling banyak yang bisa make satu client barengan
+        
+        Scanner (plus cek health LB) bisa numpuk di client yang sama, begitu juga
+        penghapusan satu tier, contoh snapshot+ebs+eip+eni semuanya lewat client ec2.
+        """
+        tier_terbesar = max(sum(self.delete_concurrency.get(rt, 1) for rt in tier) for tier in self.DELETE_TIERS)
+        return max(self.scan_workers + self.health_check_workers, tier_terbesar)
+    
+    def _client(self, service: str, region: Optional[str] = None, account_id: Optional[str] = None):
+        """Ambil client AWS per account, region & service, dibikin sekali terus di-cache"""
+        session = self.account_sessions[account_id] if account_id else self.session
+        return self.pool_client.ambil(session, service, region or self.region, account_id)
+    
+    def _role_arn(self, entry: str) -> Tuple[str, str]:
+        """Terjemahin entry account (ID 12 digit atau role ARN) jadi (account_id, role_arn)"""
+        entry = entry.strip()
+        if entry.startswith('arn:'):
+            # Format: arn:aws:iam::123456789012:role/NamaRole
+            return entry.split(':')[4], entry
+        return entry, f"arn:aws:iam::{entry}:role/{self.role_name}"
+    
+    def _bikin_session_assume_role(self, role_arn: str) -> boto3.Session:
+        """Bikin session dari AssumeRole yang kredensialnya di-refresh otomatis sebelum expired"""
+        import boto3
+        from botocore.credentials import RefreshableCredentials
+        from botocore.session import get_session as get_botocore_session
+        
+        sts = self._client('sts')
+        
+        def ambil_kredensial() -> Dict:
+            params = {
+                'RoleArn': role_arn,
+                'RoleSessionName': 'aws-resource-cleaner-betawi',
+                'DurationSeconds': self.ASSUME_ROLE_DURATION
+            }
+            if self.external_id:
+                params['ExternalId'] = self.external_id
+            kredensial = sts.assume_role(**params)['Credentials']
+            return {
+                'access_key': kredensial['AccessKeyId'],
+                'secret_key': kredensial['SecretAccessKey'],
+                'token': kredensial['SessionToken'],
+                'expiry_time': kredensial['Expiration'].isoformat()
+            }
+        
+        # Assume sekali di sini, abis itu botocore yang refresh pas udah mau expired
+        kredensial = RefreshableCredentials.create_from_metadata(
+            metadata=ambil_kredensial(),
+            refresh_using=ambil_kredensial,
+            method='sts-assume-role'
+        )
+        botocore_session = get_botocore_session()
+        botocore_session._credentials = kredensial
+        botocore_session.set_config_variable('region', self.region)
+        session = boto3.Session(botocore_session=botocore_session)
+        self.rate_limiter.pasang(session.events, scope=role_arn.split(':')[4])
+        self.metrik_api.pasang(session.events)
+        return session
+    
+    def _siapin_sessions_akun(self, accounts: List[str]) -> None:
+        """Assume role ke tiap account barengan, account yang gagal dilewatin"""
+        daftar_role = dict(self._role_arn(entry) for entry in accounts if entry.strip())
+        
+        def assume(item: Tuple[str, str]) -> Tuple[str, Optional[boto3.Session], Optional[Exception]]:
+            account_id, role_arn = item
+            try:
+                return account_id, self._bikin_session_assume_role(role_arn), None
+            except (ClientError, BotoCoreError) as e:
+                return account_id, None, e
+        
+        berhasil = []
+        for _, (account_id, session, error) in self._map_terbatas(assume, daftar_role.items(), self.scan_workers):
+            if error is not None:
+                self.console.print(f"[yellow]⚠[/yellow] Gagal assume role di account {account_id}, dilewatin: {error}")
+                continue
+            self.account_sessions[account_id] = session
+            self.role_arns[account_id] = daftar_role[account_id]
+            berhasil.append(account_id)
+        
+        if not berhasil:
+            self.console.print("[red]✗[/red] Kagak ada satupun account yang bisa di-assume!")
             sys.exit(1)
+        
+        self.accounts = berhasil
+        self.console.print(f"[green]✓[/green] Bakal scan {len(berhasil)} account lewat AssumeRole")
+    
+    def _resolve_regions(self, regions: List[str]) -> List[str]:
+        """Terjemahin pilihan region, 'all' = semua region yang enabled di account ini"""
+        if any(r.lower() == 'all' for r in regions):
+            try:
+                response = self._client('ec2').describe_regions(
+                    Filters=[{'Name': 'opt-in-status', 'Values': ['opt-in-not-required', 'opted-in']}]
+                )
+            except ClientError as e:
+                self.console.print(f"[red]✗[/red] Gagal ambil daftar region: {e}")
+                sys.exit(1)
+            hasil = sorted(r['RegionName'] for r in response.get('Regions', []))
+        else:
+            # Buang duplikat tapi urutan tetep dijaga
+            hasil = list(dict.fromkeys(r.strip() for r in regions if r.strip()))
+        
+        self.console.print(f"[green]✓[/green] Bakal scan {len(hasil)} region: [bold cyan]{', '.join(hasil)}[/bold cyan]")
+        return hasil or [self.region]
     
     def tampilkan_menu_resource(self) -> None:
         """Tampilkan menu pemilihan resource types"""
-        console.print("\n[bold blue]🎯 Pilih Resource Types yang Mau Dicek[/bold blue]")
+        from rich.table import Table
+        
+        self.console.print("\n[bold blue]🎯 Pilih Resource Types yang Mau Dicek[/bold blue]")
         
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("No", justify="center", style="cyan", width=4)
@@ -188,10 +2030,12 @@ class AWSResourceCleanerBetawi:
             "[bold green]HEMAT MAX![/bold green]"
         )
         
-        console.print(table)
+        self.console.print(table)
     
     def pilih_resources(self) -> Set[str]:
         """Interactive resource selection"""
+        from rich.prompt import Confirm, Prompt
+        
         self.tampilkan_menu_resource()
         
         while True:
@@ -212,7 +2056,7 @@ class AWSResourceCleanerBetawi:
                         selected_numbers.append(int(item))
                 
                 if not selected_numbers:
-                    console.print("[red]Input kagak valid, coba lagi dong![/red]")
+                    self.console.print("[red]Input kagak valid, coba lagi dong![/red]")
                     continue
                 
                 # Convert numbers to resource keys
@@ -223,235 +2067,790 @@ class AWSResourceCleanerBetawi:
                     if 1 <= num <= len(resource_keys):
                         selected_resources.add(resource_keys[num - 1])
                     else:
-                        console.print(f"[red]Nomor {num} kagak valid![/red]")
+                        self.console.print(f"[red]Nomor {num} kagak valid![/red]")
                         continue
                 
                 if selected_resources:
                     # Tampilkan konfirmasi
-                    console.print("\n[green]✓[/green] Resource yang dipilih:")
+                    self.console.print("\n[green]✓[/green] Resource yang dipilih:")
                     for resource in selected_resources:
                         info = self.SUPPORTED_RESOURCES[resource]
-                        console.print(f"  {info['icon']} {info['name']}")
+                        self.console.print(f"  {info['icon']} {info['name']}")
                     
                     if Confirm.ask("\nLanjut dengan pilihan ini?", default=True):
                         return selected_resources
                 
             except KeyboardInterrupt:
-                console.print("\n[yellow]Operasi dibatalin oleh user[/yellow]")
+                self.console.print("\n[yellow]Operasi dibatalin oleh user[/yellow]")
                 sys.exit(0)
             except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
+                self.console.print(f"[red]Error: {e}[/red]")
                 continue
     
-    def scan_elastic_ips(self) -> List[Dict]:
-        """Scan unused Elastic IPs"""
-        console.print("[cyan]🌐 Scanning Elastic IPs...[/cyan]")
-        try:
-            response = self.clients['ec2'].describe_addresses()
-            eips = response.get('Addresses', [])
-            
-            unused_eips = []
-            for eip in eips:
-                if not (eip.get('InstanceId') or eip.get('NetworkInterfaceId')):
-                    eip['resource_type'] = 'eip'
-                    eip['estimated_cost'] = self.SUPPORTED_RESOURCES['eip']['cost_monthly']
-                    unused_eips.append(eip)
-            
-            console.print(f"[green]✓[/green] Ketemu {len(unused_eips)} unused Elastic IPs")
-            return unused_eips
-            
-        except ClientError as e:
-            self.logger.error(f"Gagal scan EIPs: {e}")
-            return []
+    def _cache_account(self, account_id: Optional[str]) -> str:
+        """
+        Identitas kredensial buat cache key, diturunin lokal tanpa call STS
+        
+        Account member udah jelas dari role ARN-nya. Kredensial utama dibedain pake
+        nama profile, atau hash access key kalo kredensialnya dari environment.
+        """
+        if account_id:
+            return account_id
+        profile = self.profile or os.environ.get('AWS_PROFILE')
+        access_key = os.environ.get('AWS_ACCESS_KEY_ID')
+        if not self.profile and access_key:
+            # Environment variable menang dari profile default di credential chain boto3
+            return f"key:{hashlib.sha256(access_key.encode()).hexdigest()[:16]}"
+        return f"profile:{profile or 'default'}"
+    
+    def _account_asli(self, account_id: Optional[str]) -> str:
+        """Account ID beneran buat predikat --filter account=, kredensial utama dicek sekali lewat STS"""
+        if account_id:
+            return account_id
+        with self._account_default_lock:
+            if self._account_default is None:
+                try:
+                    self._account_default = self._client('sts').get_caller_identity()['Account']
+                except (ClientError, BotoCoreError):
+                    self._account_default = self._cache_account(None)
+        return self._account_default
+    
+    def _pages(self, service: str, operation: str, region: Optional[str] = None,
+               account_id: Optional[str] = None, **params) -> Iterator[Dict]:
+        """
+        Iterasi page mentah hasil API describe_*, lewat cache inventory kalo aktif
+        
+        Args:
+            service: Nama service client (ec2, elbv2, elb, rds)
+            operation: Nama method client, contoh 'describe_volumes'
+            region: Region yang mau di-query (default: region utama)
+            account_id: Account hasil AssumeRole (default: kredensial utama)
+            **params: Parameter tambahan buat API-nya
+        """
+        region = region or self.region
+        client = self._client(service, region, account_id)
+        bisa_paginate = client.can_paginate(operation)
+        
+        if bisa_paginate:
+            # Clamp page size sesuai limit API biar kagak kena ValidationError
+            min_size, max_size = self.PAGE_SIZE_LIMITS.get(
+                f"{service}.{operation}", self.PAGE_SIZE_LIMITS.get(service, (1, 1000))
+            )
+            page_size = min(max(self.page_size, min_size), max_size)
+            halaman = lambda: client.get_paginator(operation).paginate(  # noqa: E731
+                **params, PaginationConfig={'PageSize': page_size}
+            )
+        else:
+            # Ada API yang kagak punya paginator (contoh: describe_addresses), panggil sekali aja
+            halaman = lambda: [getattr(client, operation)(**params)]  # noqa: E731
+        
+        cache = self.inventory_cache
+        if cache is None or operation in self.OPERASI_TANPA_CACHE:
+            yield from halaman()
+            return
+        
+        account = self._cache_account(account_id)
+        cache_key = cache.bikin_key(account, region, service, operation, params)
+        dari_cache = cache.ambil(cache_key)
+        if dari_cache is not None:
+            yield from dari_cache
+            return
+        
+        cache.mulai(cache_key, account, region, operation)
+        for page_no, page in enumerate(halaman()):
+            cache.tulis_page(cache_key, page_no, page)
+            yield page
+        cache.selesai(cache_key)
+    
+    def _paginate(self, service: str, operation: str, result_key: str,
+                  region: Optional[str] = None, account_id: Optional[str] = None,
+                  **params) -> Iterator[Dict]:
+        """
+        Iterasi item hasil API describe_* page demi page pake paginator botocore
+        
+        Args:
+            service: Nama service client (ec2, elbv2, elb, rds)
+            operation: Nama method client, contoh 'describe_volumes'
+            result_key: Key list item di response, contoh 'Volumes'
+            region: Region yang mau di-query (default: region utama)
+            account_id: Account hasil AssumeRole (default: kredensial utama)
+            **params: Parameter tambahan buat API-nya
+        """
+        for page in self._pages(service, operation, region, account_id, **params):
+            yield from page.get(result_key, [])
+    
+    def _paginate_resource(self, resource_type: str, service: str, operation: str, result_key: str,
+                           region: str, account_id: Optional[str], **params) -> Iterator[Dict]:
+        """
+        _paginate buat listing utama scanner: predikat --filter yang bisa dititipin ke
+        parameter Filters API dikerjain server, sisanya baru dicek di client
+        """
+        saring = self.filter_resource
+        if saring is None:
+            yield from self._paginate(service, operation, result_key, region=region, account_id=account_id, **params)
+            return
+        if not saring.cocok_lokasi(region, lambda: self._account_asli(account_id)):
+            return
+        
+        nama_param, filters = saring.params_server(resource_type)
+        if filters:
+            params[nama_param] = params.get(nama_param, []) + filters
+        # Response describe Load Balancer kagak bawa tag, ambil dari index tag:GetResources
+        tag_dari_index = resource_type not in self.TAG_DI_DESCRIBE and saring.pakai_tag(resource_type)
+        for item in self._paginate(service, operation, result_key, region=region, account_id=account_id, **params):
+            tags = None
+            if tag_dari_index:
+                kunci = self._kunci_index_tag(resource_type, item.get(FilterResource.KEY_ID[resource_type]),
+                                              item.get('LoadBalancerArn'))
+                tags = self._ambil_index_tag(region, account_id).get(kunci, {})
+            if saring.cocok(resource_type, item, tags):
+                yield item
+    
+    def _panggil(self, service: str, operation: str, region: Optional[str] = None,
+                 account_id: Optional[str] = None, **params) -> Dict:
+        """Panggil API describe_* sekali (tanpa paginasi), lewat cache inventory kalo aktif"""
+        # Habisin generator-nya biar entry cache sempet ditandain complete
+        pages = list(self._pages(service, operation, region, account_id, **params))
+        return pages[0] if pages else {}
+    
+    def _estimasi_biaya(self, resource_type: str, region: str, raw: Dict,
+                        size_gb: Optional[int] = None) -> float:
+        """Estimasi biaya bulanan: index harga kalo ada, fallback ke konstanta SUPPORTED_RESOURCES"""
+        if self.pricing is not None:
+            key = IndeksHarga.key_resource(resource_type, region, raw)
+            harga = self.pricing.harga(key) if key else None
+            if harga is not None:
+                usd, unit = harga
+                if unit == 'GB-Mo':
+                    return usd * (size_gb or 0)
+                return usd * IndeksHarga.JAM_PER_BULAN
+        
+        cost_monthly = self.SUPPORTED_RESOURCES[resource_type]['cost_monthly']
+        if resource_type in ('ebs', 'snapshot'):
+            # Konstantanya per 100GB
+            return ((size_gb or 0) / 100) * cost_monthly
+        if resource_type == 'rds' and 'aurora' in raw.get('Engine', '').lower():
+            return cost_monthly * 2  # Aurora lebih mahal
+        return cost_monthly
+    
+    def _bikin_record(self, resource_type: str, raw: Dict, resource_id: str, region: str,
+                      account_id: Optional[str], estimated_cost: float, **extra) -> UnusedResource:
+        """Bikin UnusedResource dari response boto, raw-nya cuma ikut kalo --keep-raw"""
+        # EC2 pake Tags/TagSet, RDS pake TagList
+        daftar_tag = raw.get('Tags') or raw.get('TagSet') or raw.get('TagList')
+        return UnusedResource(
+            resource_type, resource_id, region, account_id, estimated_cost,
+            tags=self._saring_tag((t['Key'], t.get('Value', '')) for t in daftar_tag) if daftar_tag else None,
+            raw=raw if self.keep_raw else None, **extra
+        )
+    
+    def _saring_tag(self, pasangan: Iterable[Tuple[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Sisain tag yang dipake --rollup-tag atau --protect-tag doang, None kalo kagak ada yang make
+        
+        Predikat --filter tag: udah dicek ke response mentah sebelum record-nya dibikin.
+        """
+        if not self.rollup_tags and self.proteksi is None:
+            return None
+        tags = {
+            key: nilai for key, nilai in pasangan
+            if key in self.rollup_tags or (self.proteksi is not None and self.proteksi.butuh_tag(key))
+        }
+        return tags or None
+    
+    def scan_elastic_ips(self, region: Optional[str] = None,
+                         account_id: Optional[str] = None) -> Iterator[UnusedResource]:
+        """Scan unused Elastic IPs"""
+        region = region or self.region
+        lokasi = self._label_lokasi(region, account_id)
+        self.console.print(f"[cyan]🌐 Scanning Elastic IPs di {lokasi}...[/cyan]")
+        jumlah = 0
+        try:
+            for eip in self._paginate_resource('eip', 'ec2', 'describe_addresses', 'Addresses',
+                                               region, account_id):
+                if not (eip.get('InstanceId') or eip.get('NetworkInterfaceId')):
+                    jumlah += 1
+                    yield self._bikin_record(
+                        'eip', eip, eip['AllocationId'], region, account_id,
+                        self._estimasi_biaya('eip', region, eip),
+                        label=eip.get('PublicIp')
+                    )
+            
+            self.console.print(f"[green]✓[/green] Ketemu {jumlah} unused Elastic IPs di {lokasi}")
+            
+        except ClientError as e:
+            self.logger.error(f"Gagal scan EIPs di {lokasi}: {e}")
+    
+    def _map_terbatas(self, fungsi: Callable, items: Iterable, jumlah_worker: int) -> Iterator[Tuple]:
+        """
+        Jalanin fungsi ke tiap item barengan, hasilnya di-yield sesuai urutan input
+        
+        Jumlah task yang lagi jalan dibatesin biar kagak numpuk di memory.
+        """
+        jumlah_worker = max(1, jumlah_worker)
+        with ThreadPoolExecutor(max_workers=jumlah_worker, thread_name_prefix="health") as executor:
+            antrian_future: deque = deque()
+            for item in items:
+                antrian_future.append((item, executor.submit(fungsi, item)))
+                if len(antrian_future) >= jumlah_worker * 2:
+                    item_lama, future = antrian_future.popleft()
+                    yield item_lama, future.result()
+            while antrian_future:
+                item_lama, future = antrian_future.popleft()
+                yield item_lama, future.result()
+    
+    def _jendela_idle(self) -> Tuple[datetime, datetime]:
+        """Rentang look-back CloudWatch, dikunci sekali per scan biar cache metriknya konsisten"""
+        with self._cache_metrik_lock:
+            if self._jendela_metrik is None:
+                akhir = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+                self._jendela_metrik = (akhir - timedelta(days=self.idle_days), akhir)
+            return self._jendela_metrik
+    
+    def _reset_cache_metrik(self) -> None:
+        """Buang cache metrik CloudWatch, dipanggil tiap mulai scan baru"""
+        with self._cache_metrik_lock:
+            self._cache_metrik.clear()
+            self._jendela_metrik = None
+    
+    def _ambil_metrik(self, specs: List[Tuple[str, Tuple]], region: str,
+                      account_id: Optional[str]) -> List[Optional[float]]:
+        """
+        Ambil agregat metrik idle lewat GetMetricData, dipak max 500 query per call
+        
+        Args:
+            specs: List (jenis di METRIK_IDLE, dimensions sebagai tuple (nama, nilai))
+            region: Region yang mau di-query
+            account_id: Account hasil AssumeRole (default: kredensial utama)
+        
+        Returns:
+            Sum/Maximum tiap spec selama window, None kalo kagak ada datapoint sama sekali,
+            atau METRIK_GAGAL kalo call-nya error / hasilnya kagak Complete
+        """
+        mulai, akhir = self._jendela_idle()
+        lokasi = (account_id, region)
+        with self._cache_metrik_lock:
+            belum = [spec for spec in dict.fromkeys(specs) if (lokasi, spec) not in self._cache_metrik]
+        # Yang gagal kagak di-cache, biar dicoba lagi di scan berikutnya
+        gagal: Set[Tuple] = set()
+        
+        for awal in range(0, len(belum), self.CLOUDWATCH_BATCH_SIZE):
+            batch = belum[awal:awal + self.CLOUDWATCH_BATCH_SIZE]
+            queries = []
+            for n, (jenis, dimensi) in enumerate(batch):
+                namespace, metric, stat = self.METRIK_IDLE[jenis]
+                queries.append({
+                    'Id': f"m{n}",
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': namespace,
+                            'MetricName': metric,
+                            'Dimensions': [{'Name': nama, 'Value': nilai} for nama, nilai in dimensi]
+                        },
+                        'Period': 86400,
+                        'Stat': stat
+                    },
+                    'ReturnData': True
+                })
+            
+            # Datapoint satu query bisa kepotong ke beberapa page (NextToken), digabung per Id.
+            # StatusCode yang dipake punya page terakhir: PartialData berarti masih ada lanjutannya
+            values: Dict[str, List[float]] = {}
+            status: Dict[str, str] = {}
+            paginator = self._client('cloudwatch', region, account_id).get_paginator('get_metric_data')
+            try:
+                for page in paginator.paginate(MetricDataQueries=queries, StartTime=mulai, EndTime=akhir):
+                    for hasil in page.get('MetricDataResults', []):
+                        values.setdefault(hasil['Id'], []).extend(hasil.get('Values', []))
+                        status[hasil['Id']] = hasil.get('StatusCode')
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                self.console.print(
+                    f"[yellow]⚠[/yellow] Gagal ambil metrik CloudWatch di {self._label_lokasi(region, account_id)} "
+                    f"({error_code}), {len(batch)} resource dianggep kagak idle"
+                )
+                self.logger.warning(f"GetMetricData gagal di {region}: {e}")
+                gagal.update(batch)
+                continue
+            
+            with self._cache_metrik_lock:
+                for n, spec in enumerate(batch):
+                    if status.get(f"m{n}") != 'Complete':
+                        # Query-nya kagak dijawab atau kagak lengkap, bukan berarti kagak ada traffic
+                        gagal.add(spec)
+                        continue
+                    nilai = values.get(f"m{n}")
+                    stat = self.METRIK_IDLE[spec[0]][2]
+                    self._cache_metrik[(lokasi, spec)] = (
+                        None if not nilai else max(nilai) if stat == 'Maximum' else sum(nilai)
+                    )
+        
+        with self._cache_metrik_lock:
+            return [
+                self.METRIK_GAGAL if spec in gagal else self._cache_metrik[(lokasi, spec)]
+                for spec in specs
+            ]
+    
+    def _saring_idle(self, items: Iterable, spec_idle: Callable[[object], Optional[Tuple]],
+                     region: str, account_id: Optional[str]) -> Iterator[Tuple[object, bool]]:
+        """
+        Tandain item yang idle menurut CloudWatch, dicek per batch biar satu call nanggung 500 resource
+        
+        Item yang kagak perlu dicek langsung di-yield, sisanya ditampung sampe batch-nya penuh.
+        
+        Args:
+            items: Item yang mau dicek
+            spec_idle: Fungsi item -> (jenis, dimensions, waktu dibikin), None = kagak perlu dicek
+            region: Region yang mau di-query
+            account_id: Account hasil AssumeRole (default: kredensial utama)
+        
+        Yields:
+            (item, idle) - idle True kalo metriknya nol atau kagak ada datapoint selama window,
+            metrik yang gagal diambil dianggep kagak idle
+        """
+        mulai, _ = self._jendela_idle()
+        batch: List[Tuple[object, Tuple]] = []
+        
+        def proses() -> Iterator[Tuple[object, bool]]:
+            nilai = self._ambil_metrik([spec for _, spec in batch], region, account_id)
+            for (item, _), agregat in zip(batch, nilai):
+                yield item, agregat is not self.METRIK_GAGAL and not agregat
+            batch.clear()
+        
+        for item in items:
+            spec = spec_idle(item)
+            dibikin = spec[2] if spec else None
+            if dibikin is not None and dibikin.tzinfo is None:
+                dibikin = dibikin.replace(tzinfo=timezone.utc)
+            # Resource yang umurnya belom nyampe window belom bisa dinilai idle
+            if spec is None or (dibikin is not None and dibikin > mulai):
+                yield item, False
+                continue
+            batch.append((item, spec[:2]))
+            if len(batch) >= self.CLOUDWATCH_BATCH_SIZE:
+                yield from proses()
+        if batch:
+            yield from proses()
+    
+    def _bangun_index_target_group(self, region: str, account_id: Optional[str]) -> Dict[str, List[str]]:
+        """Mapping LB ARN -> target group ARNs dari satu sweep describe_target_groups"""
+        index: Dict[str, List[str]] = {}
+        for tg in self._paginate('elbv2', 'describe_target_groups', 'TargetGroups',
+                                 region=region, account_id=account_id):
+            for lb_arn in tg.get('LoadBalancerArns', []):
+                index.setdefault(lb_arn, []).append(tg['TargetGroupArn'])
+        return index
+    
+    def _ada_target_sehat(self, target_group_arns: List[str], region: str,
+                          account_id: Optional[str]) -> bool:
+        """Cek target group satu-satu, langsung berhenti begitu ketemu target yang healthy"""
+        for tg_arn in target_group_arns:
+            health_response = self._panggil('elbv2', 'describe_target_health', region, account_id,
+                                            TargetGroupArn=tg_arn)
+            if any(target['TargetHealth']['State'] == 'healthy'
+                   for target in health_response.get('TargetHealthDescriptions', [])):
+                return True
+        return False
     
-    def scan_load_balancers(self) -> List[Dict]:
+    def _ada_instance_sehat(self, lb_name: str, region: str, account_id: Optional[str]) -> bool:
+        """Cek apakah Classic ELB punya minimal satu instance yang InService"""
+        health_response = self._panggil('elb', 'describe_instance_health', region, account_id,
+                                        LoadBalancerName=lb_name)
+        return any(state.get('State') == 'InService'
+                   for state in health_response.get('InstanceStates', []))
+    
+    def scan_load_balancers(self, region: Optional[str] = None,
+                            account_id: Optional[str] = None) -> Iterator[UnusedResource]:
         """Scan unused Load Balancers"""
-        console.print("[cyan]⚖️ Scanning Load Balancers...[/cyan]")
-        unused_lbs = []
+        region = region or self.region
+        lokasi = self._label_lokasi(region, account_id)
+        self.console.print(f"[cyan]⚖️ Scanning Load Balancers di {lokasi}...[/cyan]")
+        jumlah = 0
         
         try:
-            # Scan ALB/NLB
-            response = self.clients['elbv2'].describe_load_balancers()
-            for lb in response.get('LoadBalancers', []):
-                # Cek target groups
-                targets_response = self.clients['elbv2'].describe_target_groups(
-                    LoadBalancerArn=lb['LoadBalancerArn']
-                )
-                
-                has_healthy_targets = False
-                for tg in targets_response.get('TargetGroups', []):
-                    health_response = self.clients['elbv2'].describe_target_health(
-                        TargetGroupArn=tg['TargetGroupArn']
-                    )
-                    if any(target['TargetHealth']['State'] == 'healthy' 
-                          for target in health_response.get('TargetHealthDescriptions', [])):
-                        has_healthy_targets = True
-                        break
-                
+            # Scan ALB/NLB - target groups diambil sekali buat semua LB
+            index_tg: Optional[Dict[str, List[str]]] = None
+            
+            def cek_lb_v2(lb: Dict) -> bool:
+                return self._ada_target_sehat(index_tg.get(lb['LoadBalancerArn'], []), region, account_id)
+            
+            def lb_v2_dengan_index() -> Iterator[Dict]:
+                nonlocal index_tg
+                for lb in self._paginate_resource('elb', 'elbv2', 'describe_load_balancers', 'LoadBalancers',
+                                                  region, account_id):
+                    if index_tg is None:
+                        index_tg = self._bangun_index_target_group(region, account_id)
+                    yield lb
+            
+            # LB yang target-nya sehat masih dicek traffic-nya di CloudWatch
+            def spec_lb_v2(hasil: Tuple[Dict, bool]) -> Optional[Tuple]:
+                lb, has_healthy_targets = hasil
+                jenis = {'application': 'alb', 'network': 'nlb'}.get(lb.get('Type'))
+                if not has_healthy_targets or not jenis:
+                    return None
+                dimensi = (('LoadBalancer', lb['LoadBalancerArn'].split(':loadbalancer/', 1)[1]),)
+                return jenis, dimensi, lb.get('CreatedTime')
+            
+            for (lb, has_healthy_targets), idle in self._saring_idle(
+                self._map_terbatas(cek_lb_v2, lb_v2_dengan_index(), self.health_check_workers),
+                spec_lb_v2, region, account_id
+            ):
                 if not has_healthy_targets:
-                    lb['resource_type'] = 'elb'
-                    lb['estimated_cost'] = self.SUPPORTED_RESOURCES['elb']['cost_monthly']
-                    unused_lbs.append(lb)
+                    alasan = 'kagak ada target yang healthy'
+                elif idle:
+                    alasan = f'kagak ada traffic {self.idle_days} hari terakhir'
+                else:
+                    continue
+                jumlah += 1
+                yield self._bikin_record(
+                    'elb', lb, lb['LoadBalancerName'], region, account_id,
+                    self._estimasi_biaya('elb', region, lb),
+                    arn=lb['LoadBalancerArn'], unused_reason=alasan
+                )
             
-            # Scan Classic ELB
-            response = self.clients['elb'].describe_load_balancers()
-            for lb in response.get('LoadBalancerDescriptions', []):
+            # Scan Classic ELB - yang punya instance dicek health-nya barengan
+            def cek_lb_classic(lb: Dict) -> Optional[str]:
                 if not lb.get('Instances'):
-                    lb['resource_type'] = 'elb'
-                    lb['estimated_cost'] = self.SUPPORTED_RESOURCES['elb']['cost_monthly']
-                    unused_lbs.append(lb)
+                    return 'kagak ada instance'
+                if not self._ada_instance_sehat(lb['LoadBalancerName'], region, account_id):
+                    return 'semua instance unhealthy'
+                return None
+            
+            def spec_lb_classic(hasil: Tuple[Dict, Optional[str]]) -> Optional[Tuple]:
+                lb, alasan = hasil
+                if alasan:
+                    return None
+                return 'clb', (('LoadBalancerName', lb['LoadBalancerName']),), lb.get('CreatedTime')
+            
+            for (lb, alasan), idle in self._saring_idle(
+                self._map_terbatas(
+                    cek_lb_classic,
+                    self._paginate_resource('elb', 'elb', 'describe_load_balancers', 'LoadBalancerDescriptions',
+                                            region, account_id),
+                    self.health_check_workers
+                ),
+                spec_lb_classic, region, account_id
+            ):
+                if not alasan and idle:
+                    alasan = f'kagak ada request {self.idle_days} hari terakhir'
+                if alasan:
+                    jumlah += 1
+                    yield self._bikin_record(
+                        'elb', lb, lb['LoadBalancerName'], region, account_id,
+                        self._estimasi_biaya('elb', region, lb), unused_reason=alasan
+                    )
             
-            console.print(f"[green]✓[/green] Ketemu {len(unused_lbs)} unused Load Balancers")
-            return unused_lbs
+            self.console.print(f"[green]✓[/green] Ketemu {jumlah} unused Load Balancers di {lokasi}")
             
         except ClientError as e:
-            self.logger.error(f"Gagal scan Load Balancers: {e}")
-            return []
+            self.logger.error(f"Gagal scan Load Balancers di {lokasi}: {e}")
     
-    def scan_ebs_volumes(self) -> List[Dict]:
+    def scan_ebs_volumes(self, region: Optional[str] = None,
+                         account_id: Optional[str] = None) -> Iterator[UnusedResource]:
         """Scan unused EBS Volumes"""
-        console.print("[cyan]💾 Scanning EBS Volumes...[/cyan]")
+        region = region or self.region
+        lokasi = self._label_lokasi(region, account_id)
+        self.console.print(f"[cyan]💾 Scanning EBS Volumes di {lokasi}...[/cyan]")
+        jumlah = 0
         try:
-            response = self.clients['ec2'].describe_volumes(
-                Filters=[{'Name': 'state', 'Values': ['available']}]
-            )
-            
-            unused_volumes = []
-            for volume in response.get('Volumes', []):
+            for volume in self._paginate_resource('ebs', 'ec2', 'describe_volumes', 'Volumes',
+                                                  region, account_id,
+                                                  Filters=[{'Name': 'state', 'Values': ['available']}]):
                 # Volume yang available = tidak attached
-                volume['resource_type'] = 'ebs'
-                # Hitung cost berdasarkan size (per GB)
+                # Hitung cost berdasarkan size & volume type
                 size_gb = volume.get('Size', 0)
-                volume['estimated_cost'] = (size_gb / 100) * self.SUPPORTED_RESOURCES['ebs']['cost_monthly']
-                unused_volumes.append(volume)
+                jumlah += 1
+                yield self._bikin_record(
+                    'ebs', volume, volume['VolumeId'], region, account_id,
+                    self._estimasi_biaya('ebs', region, volume, size_gb),
+                    size_gb=size_gb
+                )
             
-            console.print(f"[green]✓[/green] Ketemu {len(unused_volumes)} unused EBS Volumes")
-            return unused_volumes
+            self.console.print(f"[green]✓[/green] Ketemu {jumlah} unused EBS Volumes di {lokasi}")
             
         except ClientError as e:
-            self.logger.error(f"Gagal scan EBS Volumes: {e}")
-            return []
+            self.logger.error(f"Gagal scan EBS Volumes di {lokasi}: {e}")
     
-    def scan_snapshots(self) -> List[Dict]:
+    def _bangun_index_snapshot_ami(self, region: str, account_id: Optional[str]) -> Set[str]:
+        """Kumpulin semua snapshot ID yang dipake AMI milik sendiri dalam satu sweep"""
+        snapshot_dipake = set()
+        for image in self._paginate('ec2', 'describe_images', 'Images',
+                                    region=region, account_id=account_id, Owners=['self']):
+            for mapping in image.get('BlockDeviceMappings', []):
+                snapshot_id = mapping.get('Ebs', {}).get('SnapshotId')
+                if snapshot_id:
+                    snapshot_dipake.add(snapshot_id)
+        return snapshot_dipake
+    
+    def scan_snapshots(self, region: Optional[str] = None,
+                       account_id: Optional[str] = None) -> Iterator[UnusedResource]:
         """Scan old/unused EBS Snapshots"""
-        console.print("[cyan]📸 Scanning EBS Snapshots...[/cyan]")
+        region = region or self.region
+        lokasi = self._label_lokasi(region, account_id)
+        self.console.print(f"[cyan]📸 Scanning EBS Snapshots di {lokasi}...[/cyan]")
+        jumlah = 0
         try:
-            # Ambil snapshots yang owned by account ini
-            response = self.clients['ec2'].describe_snapshots(OwnerIds=['self'])
+            # Filter snapshots yang udah lama dan orphaned
+            cutoff_date = datetime.now() - timedelta(days=self.snapshot_age_days)
+            # Index snapshot yang dipake AMI, baru dibikin pas ada snapshot lama pertama
+            snapshot_dipake_ami: Optional[Set[str]] = None
             
-            # Filter snapshots yang udah lama (> 30 hari) dan orphaned
-            cutoff_date = datetime.now() - timedelta(days=30)
-            unused_snapshots = []
-            
-            for snapshot in response.get('Snapshots', []):
+            # Ambil snapshots yang owned by account ini
+            for snapshot in self._paginate_resource('snapshot', 'ec2', 'describe_snapshots', 'Snapshots',
+                                                    region, account_id, OwnerIds=['self']):
                 start_time = snapshot.get('StartTime')
                 if start_time and start_time.replace(tzinfo=None) < cutoff_date:
                     # Cek apakah masih dipake buat AMI
-                    ami_response = self.clients['ec2'].describe_images(
-                        Filters=[
-                            {'Name': 'block-device-mapping.snapshot-id', 'Values': [snapshot['SnapshotId']]}
-                        ]
-                    )
+                    if snapshot_dipake_ami is None:
+                        snapshot_dipake_ami = self._bangun_index_snapshot_ami(region, account_id)
                     
-                    if not ami_response.get('Images'):
-                        snapshot['resource_type'] = 'snapshot'
+                    if snapshot['SnapshotId'] not in snapshot_dipake_ami:
                         # Hitung cost berdasarkan size
                         size_gb = snapshot.get('VolumeSize', 0)
-                        snapshot['estimated_cost'] = (size_gb / 100) * self.SUPPORTED_RESOURCES['snapshot']['cost_monthly']
-                        unused_snapshots.append(snapshot)
+                        jumlah += 1
+                        yield self._bikin_record(
+                            'snapshot', snapshot, snapshot['SnapshotId'], region, account_id,
+                            self._estimasi_biaya('snapshot', region, snapshot, size_gb),
+                            size_gb=size_gb
+                        )
             
-            console.print(f"[green]✓[/green] Ketemu {len(unused_snapshots)} old/unused Snapshots")
-            return unused_snapshots
+            self.console.print(f"[green]✓[/green] Ketemu {jumlah} old/unused Snapshots di {lokasi}")
             
         except ClientError as e:
-            self.logger.error(f"Gagal scan Snapshots: {e}")
-            return []
+            self.logger.error(f"Gagal scan Snapshots di {lokasi}: {e}")
     
-    def scan_rds_instances(self) -> List[Dict]:
+    def scan_rds_instances(self, region: Optional[str] = None,
+                           account_id: Optional[str] = None) -> Iterator[UnusedResource]:
         """Scan unused/idle RDS instances"""
-        console.print("[cyan]🗄️ Scanning RDS Instances...[/cyan]")
+        region = region or self.region
+        lokasi = self._label_lokasi(region, account_id)
+        self.console.print(f"[cyan]🗄️ Scanning RDS Instances di {lokasi}...[/cyan]")
+        jumlah = 0
         try:
-            response = self.clients['rds'].describe_db_instances()
-            
-            # Untuk demo, anggap RDS yang stopped sebagai unused
-            unused_rds = []
-            for db in response.get('DBInstances', []):
-                if db.get('DBInstanceStatus') in ['stopped', 'available']:
-                    # Bisa ditambah logic untuk cek connection metrics
-                    db['resource_type'] = 'rds'
-                    db['estimated_cost'] = self.SUPPORTED_RESOURCES['rds']['cost_monthly']
-                    
-                    # Cek kalo Aurora
-                    if 'aurora' in db.get('Engine', '').lower():
-                        db['estimated_cost'] *= 2  # Aurora lebih mahal
-                    
-                    unused_rds.append(db)
+            # DB yang available baru dianggap idle kalo kagak ada koneksi sama sekali selama window
+            def spec_db(db: Dict) -> Optional[Tuple]:
+                if db.get('DBInstanceStatus') != 'available':
+                    return None
+                dimensi = (('DBInstanceIdentifier', db['DBInstanceIdentifier']),)
+                return 'rds', dimensi, db.get('InstanceCreateTime')
+            
+            for db, idle in self._saring_idle(
+                self._paginate_resource('rds', 'rds', 'describe_db_instances', 'DBInstances',
+                                        region, account_id),
+                spec_db, region, account_id
+            ):
+                if db.get('DBInstanceStatus') == 'stopped':
+                    alasan = 'DB lagi stopped'
+                elif idle:
+                    alasan = f'kagak ada koneksi {self.idle_days} hari terakhir'
+                else:
+                    continue
+                jumlah += 1
+                yield self._bikin_record(
+                    'rds', db, db['DBInstanceIdentifier'], region, account_id,
+                    self._estimasi_biaya('rds', region, db), unused_reason=alasan
+                )
             
-            console.print(f"[green]✓[/green] Ketemu {len(unused_rds)} potentially unused RDS instances")
-            return unused_rds
+            self.console.print(f"[green]✓[/green] Ketemu {jumlah} potentially unused RDS instances di {lokasi}")
             
         except ClientError as e:
-            self.logger.error(f"Gagal scan RDS: {e}")
-            return []
+            self.logger.error(f"Gagal scan RDS di {lokasi}: {e}")
+    
+    def _bangun_index_route_nat(self, region: str, account_id: Optional[str]) -> Dict[str, Dict]:
+        """
+        Bikin mapping NAT ID -> route tables & subnet yang nge-reference, dalam satu sweep
+        
+        Returns:
+            Dict NAT ID ke {'route_tables': [...], 'subnets': set(...), 'main': bool}
+        """
+        index: Dict[str, Dict] = {}
+        for route_table in self._paginate('ec2', 'describe_route_tables', 'RouteTables',
+                                          region=region, account_id=account_id,
+                                          Filters=[{'Name': 'route.nat-gateway-id', 'Values': ['nat-*']}]):
+            associations = route_table.get('Associations', [])
+            subnets = {a['SubnetId'] for a in associations if a.get('SubnetId')}
+            # Main route table otomatis kepake sama subnet yang kagak punya asosiasi explicit
+            is_main = any(a.get('Main') for a in associations)
+            
+            for route in route_table.get('Routes', []):
+                nat_id = route.get('NatGatewayId')
+                if not nat_id:
+                    continue
+                entry = index.setdefault(nat_id, {'route_tables': [], 'subnets': set(), 'main': False})
+                if route_table['RouteTableId'] not in entry['route_tables']:
+                    entry['route_tables'].append(route_table['RouteTableId'])
+                entry['subnets'].update(subnets)
+                entry['main'] = entry['main'] or is_main
+        return index
     
-    def scan_nat_gateways(self) -> List[Dict]:
+    def _eip_nempel_nat(self, nat: Dict, region: str, account_id: Optional[str]) -> List[Dict[str, str]]:
+        """
+        EIP yang nempel di NAT, dicatet pas scan biar keliatan di dry run & konfirmasi batch
+        
+        EIP yang dilindungin --protect-tag kagak diikutin. Kalo tag-nya kagak bisa
+        dicek, mending kagak ada EIP yang ikut dilepas.
+        
+        Returns:
+            List {'allocation_id', 'public_ip'}
+        """
+        alamat = [
+            {'allocation_id': a['AllocationId'], 'public_ip': a.get('PublicIp')}
+            for a in nat.get('NatGatewayAddresses', []) if a.get('AllocationId')
+        ]
+        if not alamat or self.proteksi is None:
+            return alamat
+        try:
+            addresses = self._client('ec2', region, account_id).describe_addresses(
+                AllocationIds=[a['allocation_id'] for a in alamat]
+            ).get('Addresses', [])
+        except ClientError as e:
+            self.logger.warning(f"Gagal cek tag EIP NAT {nat['NatGatewayId']}, EIP-nya kagak ikut dilepas: {e}")
+            return []
+        dilindungin = {
+            eip['AllocationId'] for eip in addresses
+            if self.proteksi.cocok({t['Key']: t.get('Value', '') for t in eip.get('Tags', [])}) is not None
+        }
+        return [a for a in alamat if a['allocation_id'] not in dilindungin]
+
+    def scan_nat_gateways(self, region: Optional[str] = None,
+                          account_id: Optional[str] = None) -> Iterator[UnusedResource]:
         """Scan unused NAT Gateways"""
-        console.print("[cyan]🚪 Scanning NAT Gateways...[/cyan]")
+        region = region or self.region
+        lokasi = self._label_lokasi(region, account_id)
+        self.console.print(f"[cyan]🚪 Scanning NAT Gateways di {lokasi}...[/cyan]")
+        jumlah = 0
         try:
-            response = self.clients['ec2'].describe_nat_gateways()
+            # Index route table baru dibikin pas ada NAT available pertama
+            index_route: Optional[Dict[str, Dict]] = None
             
-            unused_nats = []
-            for nat in response.get('NatGateways', []):
-                if nat.get('State') == 'available':
-                    # Cek route tables yang nge-reference NAT ini
-                    routes_response = self.clients['ec2'].describe_route_tables(
-                        Filters=[
-                            {'Name': 'route.nat-gateway-id', 'Values': [nat['NatGatewayId']]}
-                        ]
-                    )
+            def nat_dengan_alasan() -> Iterator[Tuple[Dict, Optional[str]]]:
+                nonlocal index_route
+                for nat in self._paginate_resource('nat', 'ec2', 'describe_nat_gateways', 'NatGateways',
+                                                   region, account_id):
+                    if nat.get('State') != 'available':
+                        continue
+                    if index_route is None:
+                        index_route = self._bangun_index_route_nat(region, account_id)
                     
-                    # Kalo kagak ada route atau route table kagak dipake, consider unused
-                    if not routes_response.get('RouteTables'):
-                        nat['resource_type'] = 'nat'
-                        nat['estimated_cost'] = self.SUPPORTED_RESOURCES['nat']['cost_monthly']
-                        unused_nats.append(nat)
+                    # Cek route tables yang nge-reference NAT ini
+                    referensi = index_route.get(nat['NatGatewayId'])
+                    if not referensi:
+                        yield nat, 'kagak ada route'
+                    elif not referensi['subnets'] and not referensi['main']:
+                        # Route-nya ada tapi route table-nya kagak nyambung ke subnet manapun
+                        yield nat, 'route table kagak nyambung ke subnet'
+                    else:
+                        yield nat, None
             
-            console.print(f"[green]✓[/green] Ketemu {len(unused_nats)} potentially unused NAT Gateways")
-            return unused_nats
+            # NAT yang route-nya kepake masih dicek ada traffic keluar apa kagak
+            def spec_nat(hasil: Tuple[Dict, Optional[str]]) -> Optional[Tuple]:
+                nat, alasan = hasil
+                if alasan:
+                    return None
+                return 'nat', (('NatGatewayId', nat['NatGatewayId']),), nat.get('CreateTime')
+            
+            for (nat, alasan), idle in self._saring_idle(nat_dengan_alasan(), spec_nat, region, account_id):
+                if not alasan and idle:
+                    alasan = f'kagak ada traffic {self.idle_days} hari terakhir'
+                if not alasan:
+                    continue
+                jumlah += 1
+                yield self._bikin_record(
+                    'nat', nat, nat['NatGatewayId'], region, account_id,
+                    self._estimasi_biaya('nat', region, nat), unused_reason=alasan,
+                    associated_eips=self._eip_nempel_nat(nat, region, account_id) or None
+                )
+            
+            self.console.print(f"[green]✓[/green] Ketemu {jumlah} potentially unused NAT Gateways di {lokasi}")
             
         except ClientError as e:
-            self.logger.error(f"Gagal scan NAT Gateways: {e}")
-            return []
+            self.logger.error(f"Gagal scan NAT Gateways di {lokasi}: {e}")
     
-    def scan_network_interfaces(self) -> List[Dict]:
+    def scan_network_interfaces(self, region: Optional[str] = None,
+                                account_id: Optional[str] = None) -> Iterator[UnusedResource]:
         """Scan unused Network Interfaces"""
-        console.print("[cyan]🔌 Scanning Network Interfaces...[/cyan]")
+        region = region or self.region
+        lokasi = self._label_lokasi(region, account_id)
+        self.console.print(f"[cyan]🔌 Scanning Network Interfaces di {lokasi}...[/cyan]")
+        jumlah = 0
         try:
-            response = self.clients['ec2'].describe_network_interfaces(
-                Filters=[{'Name': 'status', 'Values': ['available']}]
-            )
-            
-            unused_enis = []
-            for eni in response.get('NetworkInterfaces', []):
+            for eni in self._paginate_resource('eni', 'ec2', 'describe_network_interfaces', 'NetworkInterfaces',
+                                               region, account_id,
+                                               Filters=[{'Name': 'status', 'Values': ['available']}]):
                 # ENI yang available dan kagak attached ke instance apapun
                 if not eni.get('Attachment'):
-                    eni['resource_type'] = 'eni'
-                    eni['estimated_cost'] = self.SUPPORTED_RESOURCES['eni']['cost_monthly']
-                    unused_enis.append(eni)
+                    jumlah += 1
+                    yield self._bikin_record(
+                        'eni', eni, eni['NetworkInterfaceId'], region, account_id,
+                        self._estimasi_biaya('eni', region, eni)
+                    )
             
-            console.print(f"[green]✓[/green] Ketemu {len(unused_enis)} unused Network Interfaces")
-            return unused_enis
+            self.console.print(f"[green]✓[/green] Ketemu {jumlah} unused Network Interfaces di {lokasi}")
             
         except ClientError as e:
-            self.logger.error(f"Gagal scan Network Interfaces: {e}")
-            return []
+            self.logger.error(f"Gagal scan Network Interfaces di {lokasi}: {e}")
     
-    def scan_resources(self, resource_types: Set[str]) -> List[Dict]:
-        """Scan semua resource types yang dipilih"""
-        console.print(f"\n[bold blue]🔍 Mulai scanning {len(resource_types)} resource types...[/bold blue]")
+    def _ambil_index_tag(self, region: str, account_id: Optional[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Index bagian resource ARN -> tags buat satu account & region, dibikin sekali per scan
         
-        all_resources = []
-        scan_methods = {
+        Satu sweep tag:GetResources dipake bareng semua scanner di lokasi itu.
+        Scanner yang dateng pas sweep-nya masih jalan tinggal nunggu hasilnya.
+        """
+        key = (account_id, region)
+        with self._index_tag_lock:
+            lock = self._index_tag_lock_lokasi.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._index_tag:
+                index = {}
+                if self._tipe_index_tag:
+                    for item in self._paginate('resourcegroupstaggingapi', 'get_resources', 'ResourceTagMappingList',
+                                               region=region, account_id=account_id,
+                                               ResourceTypeFilters=self._tipe_index_tag):
+                        index[item['ResourceARN'].split(':', 5)[-1]] = {
+                            t['Key']: t.get('Value', '') for t in item.get('Tags', [])
+                        }
+                self._index_tag[key] = index
+            return self._index_tag[key]
+    
+    def _kunci_index_tag(self, resource_type: str, resource_id: str, arn: Optional[str] = None) -> str:
+        """Kunci index tag (bagian resource dari ARN) buat satu resource"""
+        if arn:
+            return arn.split(':', 5)[-1]
+        return self.TAG_RESOURCE_TYPE[resource_type][1].format(resource_id)
+    
+    def _lengkapi_tag(self, resource: UnusedResource, ulang: bool = False) -> None:
+        """
+        Isi tags resource yang response describe_*-nya kagak bawa tag dari index
+        
+        Args:
+            resource: Resource yang tags-nya mau dilengkapin
+            ulang: Tetep ambil dari index walaupun tags-nya udah ada, digabung sama
+                yang lama (--resume: journal cuma nyimpen key yang dipake run awalnya)
+        """
+        if not ulang and (resource.tags is not None or resource.resource_type in self.TAG_DI_DESCRIBE):
+            return
+        kunci = self._kunci_index_tag(resource.resource_type, resource.resource_id, resource.arn)
+        tags = self._ambil_index_tag(resource.region, resource.account_id).get(kunci) or {}
+        resource.tags = self._saring_tag({**(resource.tags or {}), **tags}.items())
+    
+    def _dilindungin(self, resource: UnusedResource) -> bool:
+        """Cek aturan --protect-tag, yang dilindungin ditandain di protected_by & dicatet di statistik"""
+        if self.proteksi is None:
+            return False
+        self._lengkapi_tag(resource)
+        alasan = self.proteksi.cocok(resource.tags)
+        if alasan is None:
+            return False
+        resource.protected_by = alasan
+        self.logger.debug(f"{resource.resource_type} {resource.resource_id} dilindungin tag {alasan}")
+        with self._statistik_lock:
+            self.statistik['protected_resources'] += 1
+        return True
+    
+    def _scan_methods(self) -> Dict[str, Callable[..., Iterator[UnusedResource]]]:
+        """Mapping resource type ke generator scanner-nya"""
+        return {
             'eip': self.scan_elastic_ips,
             'elb': self.scan_load_balancers,
             'ebs': self.scan_ebs_volumes,
@@ -460,67 +2859,346 @@ class AWSResourceCleanerBetawi:
             'nat': self.scan_nat_gateways,
             'eni': self.scan_network_interfaces
         }
+    
+    def _urutan_scan(self, resource_types: Set[str],
+                     lokasi: Optional[Iterable[Tuple[Optional[str], str]]] = None
+                     ) -> List[Tuple[str, Optional[str], str]]:
+        """Daftar (resource_type, account_id, region) yang mau di-scan, urutannya tetap"""
+        scan_methods = self._scan_methods()
+        if lokasi is None:
+            lokasi = [(account_id, region) for account_id in self.accounts for region in self.regions]
+        return [
+            (resource_type, account_id, region)
+            for resource_type in self.SUPPORTED_RESOURCES
+            if resource_type in resource_types and resource_type in scan_methods
+            for account_id, region in lokasi
+        ]
+    
+    def iter_scan_resources(self, resource_types: Set[str],
+                            on_scan_done: Optional[Callable[[str, Optional[str], str], None]] = None,
+                            lokasi: Optional[List[Tuple[Optional[str], str]]] = None
+                            ) -> Iterator[UnusedResource]:
+        """
+        Scan resource types di semua account & region secara streaming - tiap resource di-yield begitu ketemu
+        
+        Scanner jalan barengan di satu worker pool (jadi scan_workers itu batas global
+        buat semua account & region), hasilnya dilewatin antrian yang ukurannya
+        dibatesin biar memory tetep kecil walaupun account-nya gede.
+        
+        Args:
+            resource_types: Resource types yang mau di-scan
+            on_scan_done: Callback (resource_type, account_id, region) tiap satu scanner kelar
+            lokasi: Subset (account_id, region) yang mau di-scan (default: semua)
+        """
+        scan_methods = self._scan_methods()
+        urutan_scan = self._urutan_scan(resource_types, lokasi)
+        if not urutan_scan:
+            return
+        self._reset_cache_metrik()
+        # Tag baru perlu di-sweep kalo ada yang make: aturan proteksi, rollup per tag, atau --filter tag:
+        self._index_tag.clear()
+        butuh_tag = self.proteksi is not None or self.rollup_tags
+        self._tipe_index_tag = sorted({
+            self.TAG_RESOURCE_TYPE[rt][0] for rt in resource_types
+            if rt not in self.TAG_DI_DESCRIBE and (
+                butuh_tag or (self.filter_resource is not None and self.filter_resource.pakai_tag(rt))
+            )
+        })
+        
+        antrian: queue.Queue = queue.Queue(maxsize=self.page_size)
+        berhenti = threading.Event()
+        
+        def taruh(item) -> bool:
+            # Tunggu antrian ada tempat, tapi berhenti kalo consumer udah bubar
+            while not berhenti.is_set():
+                try:
+                    antrian.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def jalanin_scanner(resource_type: str, account_id: Optional[str], region: str) -> None:
+            error = None
+            mulai = time.perf_counter()
+            jumlah = 0
+            try:
+                for resource in scan_methods[resource_type](region, account_id):
+                    # Yang dilindungin tetep dilaporin, cuma kagak bakal dihapus
+                    self._dilindungin(resource)
+                    if self.rollup_tags:
+                        self._lengkapi_tag(resource)
+                    if not taruh(resource):
+                        return
+                    jumlah += 1
+            except Exception as e:  # diterusin ke consumer biar kagak ketelen
+                error = e
+            self.metrik_api.catat_scanner(resource_type, time.perf_counter() - mulai, jumlah)
+            taruh((_SCAN_SELESAI, resource_type, account_id, region, error))
+        
+        jumlah_worker = min(self.scan_workers, len(urutan_scan))
+        executor = ThreadPoolExecutor(max_workers=jumlah_worker, thread_name_prefix="scanner")
+        try:
+            for resource_type, account_id, region in urutan_scan:
+                executor.submit(jalanin_scanner, resource_type, account_id, region)
+            
+            sisa = len(urutan_scan)
+            while sisa:
+                item = antrian.get()
+                if isinstance(item, tuple) and item and item[0] is _SCAN_SELESAI:
+                    _, resource_type, account_id, region, error = item
+                    if error is not None:
+                        raise error
+                    sisa -= 1
+                    if on_scan_done:
+                        on_scan_done(resource_type, account_id, region)
+                    continue
+                yield item
+        finally:
+            berhenti.set()
+            executor.shutdown(wait=True)
+    
+    def scan_resources(self, resource_types: Set[str]) -> List[UnusedResource]:
+        """Scan semua resource types yang dipilih"""
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+        
+        self.console.print(
+            f"\n[bold blue]🔍 Mulai scanning {len(resource_types)} resource types "
+            f"di {len(self.regions)} region"
+            f"{f' x {len(self.accounts)} account' if self.multi_account else ''}...[/bold blue]"
+        )
+        
+        urutan_scan = self._urutan_scan(resource_types)
+        hasil_per_scan: Dict[Tuple, List[UnusedResource]] = {key: [] for key in urutan_scan}
+        with self._statistik_lock:
+            self.statistik['protected_resources'] = 0
+        if self.output in self.FORMAT_MESIN and self.output_streaming is None:
+            self.mulai_output_streaming()
         
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
+            console=self.console
         ) as progress:
             
-            task = progress.add_task("Scanning resources...", total=len(resource_types))
+            task = progress.add_task("Scanning resources...", total=len(urutan_scan))
             
-            for resource_type in resource_types:
-                if resource_type in scan_methods:
-                    progress.update(task, description=f"Scanning {resource_type.upper()}...")
-                    resources = scan_methods[resource_type]()
-                    all_resources.extend(resources)
-                    progress.advance(task)
-                    time.sleep(0.5)  # Delay dikit biar kagak kena rate limiting
+            def scan_kelar(resource_type: str, account_id: Optional[str], region: str) -> None:
+                lokasi = self._label_lokasi(region, account_id)
+                progress.update(task, description=f"Kelar scan {resource_type.upper()} di {lokasi}...")
+                progress.advance(task)
+            
+            for resource in self.iter_scan_resources(resource_types, on_scan_done=scan_kelar):
+                key = (resource.resource_type, resource.account_id, resource.region)
+                hasil_per_scan[key].append(resource)
+                if self.laporan_streaming:
+                    self.laporan_streaming.tulis_resource(resource)
+                if self.output_streaming:
+                    self.output_streaming.tulis_resource(resource)
+        
+        if self.statistik['protected_resources']:
+            self.console.print(
+                f"[green]🛡️[/green] {self.statistik['protected_resources']} resources dilindungin "
+                f"--protect-tag, tetep dilaporin tapi kagak bakal dihapus"
+            )
+        if self.inventory_cache and self.inventory_cache.hits:
+            self.console.print(
+                f"[dim]📦 {self.inventory_cache.hits} hasil describe diambil dari cache "
+                f"(TTL {self.inventory_cache.ttl:.0f}s, pake --refresh buat scan ulang)[/dim]"
+            )
+        
+        # Gabungin ngikutin urutan SUPPORTED_RESOURCES, account, lalu region biar hasilnya
+        # deterministik, kagak peduli scanner mana yang kelar duluan
+        all_resources = []
+        for key in urutan_scan:
+            all_resources.extend(hasil_per_scan[key])
         
         return all_resources
     
-    def tampilkan_hasil_scan(self, resources: List[Dict]) -> None:
-        """Tampilkan hasil scan dengan tabel yang cakep"""
-        if not resources:
-            console.print("[green]✨[/green] Kagak ada unused resources yang ketemu! AWS account udah clean nih!")
-            return
+    async def _iter_async(self, produser: Callable[[Callable[[object], bool], threading.Event], None]
+                          ) -> AsyncIterator:
+        """
+        Jalanin produser blocking di thread terus hasilnya di-yield ke event loop
         
-        # Group resources by type
-        grouped_resources = {}
-        total_cost = 0.0
+        Produser dikasih fungsi kirim(item) yang nge-block sampe antrian asyncio
+        ada tempat (backpressure) dan balikin False kalo consumer udah bubar,
+        plus Event yang di-set begitu consumer bubar biar kerjaan baru kagak dimulai.
+        """
+        import asyncio
         
-        for resource in resources:
-            resource_type = resource.get('resource_type', 'unknown')
-            if resource_type not in grouped_resources:
-                grouped_resources[resource_type] = []
-            grouped_resources[resource_type].append(resource)
-            total_cost += resource.get('estimated_cost', 0.0)
+        loop = asyncio.get_running_loop()
+        antrian: asyncio.Queue = asyncio.Queue(maxsize=self.page_size)
+        berhenti = threading.Event()
         
-        # Bikin tree view
-        tree = Tree("[bold blue]🗂️ Unused AWS Resources[/bold blue]")
+        def kirim(item) -> bool:
+            future = asyncio.run_coroutine_threadsafe(antrian.put(item), loop)
+            while not berhenti.is_set():
+                try:
+                    future.result(timeout=0.1)
+                    return True
+                except FutureTimeoutError:
+                    continue
+            future.cancel()
+            return False
         
-        for resource_type, resource_list in grouped_resources.items():
-            if resource_type in self.SUPPORTED_RESOURCES:
-                info = self.SUPPORTED_RESOURCES[resource_type]
-                type_cost = sum(r.get('estimated_cost', 0.0) for r in resource_list)
-                
-                type_node = tree.add(
-                    f"{info['icon']} [bold]{info['name']}[/bold] "
-                    f"([red]{len(resource_list)}[/red] items, "
-                    f"[yellow]${type_cost:.2f}/month[/yellow])"
+        def jalan() -> None:
+            error = None
+            try:
+                produser(kirim, berhenti)
+            except Exception as e:  # diterusin ke consumer di event loop
+                error = e
+            kirim((_ASYNC_SELESAI, error))
+        
+        tugas = loop.run_in_executor(None, jalan)
+        try:
+            while True:
+                item = await antrian.get()
+                if isinstance(item, tuple) and item and item[0] is _ASYNC_SELESAI:
+                    if item[1] is not None:
+                        raise item[1]
+                    return
+                yield item
+        finally:
+            berhenti.set()
+            await tugas
+    
+    async def scan_async(self, resource_types: Set[str]) -> AsyncIterator[UnusedResource]:
+        """
+        Versi asyncio dari iter_scan_resources, buat dipanggil dari service async
+        
+        Panggilan describe_* tetep jalan di worker pool scanner, jadi event loop
+        kagak pernah ke-block. Contoh: async for resource in cleaner.scan_async({'eip', 'ebs'})
+        
+        Args:
+            resource_types: Resource types yang mau di-scan
+        """
+        def produser(kirim: Callable[[object], bool], berhenti: threading.Event) -> None:
+            hasil = self.iter_scan_resources(resource_types)
+            try:
+                for resource in hasil:
+                    if not kirim(resource):
+                        return
+            finally:
+                hasil.close()
+        
+        async for resource in self._iter_async(produser):
+            yield resource
+    
+    def _label_lokasi(self, region: Optional[str], account_id: Optional[str]) -> str:
+        """Label lokasi resource buat ditampilin, contoh 'us-east-1' atau '123456789012/us-east-1'"""
+        region = region or self.region
+        return f"{account_id}/{region}" if account_id else region
+    
+    def _rollup(self, resources: List[UnusedResource]) -> RollupBiaya:
+        """Rollup biaya buat list resources ini, dibangun sekali terus dipake ulang"""
+        if self.rollup is None or self.rollup.resources is not resources:
+            self.rollup = RollupBiaya(resources, self.region)
+        return self.rollup
+    
+    def _tampilkan_tabel_rollup(self, resources: List[UnusedResource]) -> None:
+        """Tampilkan rollup per account dan per region kalo scan-nya lebih dari satu"""
+        from rich.table import Table
+        
+        rollup = self._rollup(resources)
+        rollups = []
+        if self.multi_account:
+            rollups.append(("👥 Rollup per Account", "Account", 'account_id'))
+        if len(self.regions) > 1:
+            rollups.append(("🌍 Rollup per Region", "Region", 'region'))
+        for tag_key in self.rollup_tags:
+            rollups.append((f"🏷️ Rollup per Tag {tag_key}", tag_key, f"tag:{tag_key}"))
+        
+        for judul, nama_kolom, field in rollups:
+            table = Table(title=judul, show_header=True, header_style="bold magenta")
+            table.add_column(nama_kolom, style="cyan")
+            table.add_column("Items", justify="right")
+            table.add_column("Resource Types", style="dim")
+            table.add_column("Est. Cost/Month", style="yellow", justify="right")
+            
+            for nilai, entry in sorted(rollup.ringkasan(field).items()):
+                table.add_row(
+                    nilai,
+                    str(entry['count']),
+                    ", ".join(f"{rt}={n}" for rt, n in entry['types'].items()),
+                    f"${entry['total_cost']:.2f}"
                 )
-                
-                # Tambah detail items (max 5 buat readability)
-                for i, resource in enumerate(resource_list[:5]):
-                    detail = self._get_resource_detail(resource)
-                    type_node.add(f"[dim]{detail}[/dim]")
-                
-                if len(resource_list) > 5:
-                    type_node.add(f"[dim]... dan {len(resource_list) - 5} lainnya[/dim]")
+            
+            self.console.print(table)
+    
+    def _paling_mahal(self, resources: List[UnusedResource], n: int) -> List[UnusedResource]:
+        """n resource paling mahal, urut dari yang termahal (n=0 = semua, urutan aslinya)"""
+        if not n:
+            return resources
+        return heapq.nlargest(n, resources, key=lambda r: r.estimated_cost)
+    
+    def _tampilkan_tabel_per_type(self, rollup: RollupBiaya) -> None:
+        """Tabel jumlah & biaya per resource type, buat --output summary"""
+        from rich.table import Table
+        
+        table = Table(title="🗂️ Unused AWS Resources", show_header=True, header_style="bold blue")
+        table.add_column("Resource Type", style="cyan")
+        table.add_column("Items", justify="right")
+        table.add_column("Est. Cost/Month", style="yellow", justify="right")
+        for resource_type, entry in rollup.ringkasan('resource_type').items():
+            info = self.SUPPORTED_RESOURCES.get(resource_type, {'icon': '', 'name': resource_type})
+            table.add_row(f"{info['icon']} {info['name']}", str(entry['count']), f"${entry['total_cost']:.2f}")
+        self.console.print(table)
+    
+    def tampilkan_hasil_scan(self, resources: List[UnusedResource]) -> None:
+        """
+        Tampilkan hasil scan sesuai --output
+        
+        table nampilin 5 resource paling mahal per type, summary cuma angka per type,
+        json/ndjson kagak nampilin apa-apa (resource-nya udah ditulis ke stdout pas scan).
+        """
+        from rich.panel import Panel
+        from rich.tree import Tree
+        
+        rollup = self._rollup(resources)
+        total_cost = rollup.total_cost
+        self.statistik['total_resources'] = len(resources)
+        self.statistik['unused_resources'] = len(resources)
+        self.statistik['total_savings'] = total_cost
+        
+        if self.output in self.FORMAT_MESIN:
+            return
+        
+        if not resources:
+            self.console.print("[green]✨[/green] Kagak ada unused resources yang ketemu! AWS account udah clean nih!")
+            return
         
-        console.print(tree)
+        if self.output == 'summary':
+            self._tampilkan_tabel_per_type(rollup)
+        else:
+            ringkasan_type = rollup.ringkasan('resource_type')
+            tree = Tree("[bold blue]🗂️ Unused AWS Resources[/bold blue]")
+            
+            for resource_type, resource_list in rollup.kelompok('resource_type').items():
+                if resource_type in self.SUPPORTED_RESOURCES:
+                    info = self.SUPPORTED_RESOURCES[resource_type]
+                    type_cost = ringkasan_type[resource_type]['total_cost']
+                    
+                    type_node = tree.add(
+                        f"{info['icon']} [bold]{info['name']}[/bold] "
+                        f"([red]{len(resource_list)}[/red] items, "
+                        f"[yellow]${type_cost:.2f}/month[/yellow])"
+                    )
+                    
+                    # Tambah detail items (5 yang paling mahal buat readability)
+                    for resource in self._paling_mahal(resource_list, 5):
+                        detail = self._get_resource_detail(resource)
+                        if len(self.regions) > 1 or self.multi_account:
+                            lokasi = self._label_lokasi(resource.region, resource.account_id)
+                            detail = f"{lokasi}: {detail}"
+                        type_node.add(f"[dim]{detail}[/dim]")
+                    
+                    if len(resource_list) > 5:
+                        type_node.add(f"[dim]... dan {len(resource_list) - 5} lainnya[/dim]")
+            
+            self.console.print(tree)
+        self._tampilkan_tabel_rollup(resources)
         
         # Panel ringkasan biaya
         panel_biaya = Panel(
@@ -531,127 +3209,429 @@ class AWSResourceCleanerBetawi:
             title="💰 Cost Impact",
             border_style="red"
         )
-        console.print(panel_biaya)
-        
-        # Update statistik
-        self.statistik['total_resources'] = len(resources)
-        self.statistik['unused_resources'] = len(resources)
-        self.statistik['total_savings'] = total_cost
+        self.console.print(panel_biaya)
     
-    def _get_resource_detail(self, resource: Dict) -> str:
+    def _get_resource_detail(self, resource: UnusedResource) -> str:
         """Get detail string for a resource"""
-        resource_type = resource.get('resource_type', 'unknown')
+        prefix = self.DETAIL_PREFIX.get(resource.resource_type, 'Resource')
+        alasan = f" - {resource.unused_reason}" if resource.unused_reason else ""
+        ukuran = f"{resource.size_gb}GB, " if resource.size_gb is not None else ""
+        proteksi = f" 🛡️ dilindungin {resource.protected_by}" if resource.protected_by else ""
+        return (
+            f"{prefix}: {resource.label or resource.resource_id}{alasan} "
+            f"({ukuran}${resource.estimated_cost:.2f}/month){proteksi}"
+        )
+    
+    def _yang_bisa_dihapus(self, resources: List[UnusedResource]) -> List[UnusedResource]:
+        """
+        Buang resource yang dilindungin --protect-tag sebelum masuk penghapusan
+        
+        List aslinya dibalikin apa adanya kalo kagak ada yang dilindungin, biar
+        rollup yang udah dibangun buat hasil scan tetep kepake.
+        """
+        bisa = [r for r in resources if r.protected_by is None]
+        if len(bisa) == len(resources):
+            return resources
+        self.console.print(
+            f"[green]🛡️[/green] {len(resources) - len(bisa)} resources dilindungin "
+            f"--protect-tag, dilewatin"
+        )
+        return bisa
+    
+    def _panggil_api_hapus(self, resource: UnusedResource) -> str:
+        """
+        Panggil API delete buat satu resource
+        
+        Returns:
+            Pesan sukses buat ditampilin
+        
+        Raises:
+            ClientError: Kalo API-nya nolak
+        """
+        resource_type = resource.resource_type
+        resource_id = resource.resource_id
+        region = resource.region
+        account_id = resource.account_id
         
         if resource_type == 'eip':
-            return f"IP: {resource.get('PublicIp', 'N/A')} (${resource.get('estimated_cost', 0):.2f}/month)"
+            self._client('ec2', region, account_id).release_address(AllocationId=resource_id)
+            return f"Deleted EIP: {resource.label or resource_id}"
+            
         elif resource_type == 'elb':
-            name = resource.get('LoadBalancerName') or resource.get('LoadBalancerArn', '').split('/')[-1]
-            return f"LB: {name} (${resource.get('estimated_cost', 0):.2f}/month)"
+            if resource.arn:  # ALB/NLB
+                self._client('elbv2', region, account_id).delete_load_balancer(LoadBalancerArn=resource.arn)
+            else:  # Classic ELB
+                self._client('elb', region, account_id).delete_load_balancer(LoadBalancerName=resource_id)
+            return f"Deleted ELB: {resource_id}"
+            
         elif resource_type == 'ebs':
-            return f"Volume: {resource.get('VolumeId', 'N/A')} ({resource.get('Size', 0)}GB, ${resource.get('estimated_cost', 0):.2f}/month)"
+            self._client('ec2', region, account_id).delete_volume(VolumeId=resource_id)
+            return f"Deleted EBS Volume: {resource_id}"
+            
         elif resource_type == 'snapshot':
-            return f"Snapshot: {resource.get('SnapshotId', 'N/A')} ({resource.get('VolumeSize', 0)}GB, ${resource.get('estimated_cost', 0):.2f}/month)"
+            self._client('ec2', region, account_id).delete_snapshot(SnapshotId=resource_id)
+            return f"Deleted Snapshot: {resource_id}"
+            
         elif resource_type == 'rds':
-            return f"RDS: {resource.get('DBInstanceIdentifier', 'N/A')} (${resource.get('estimated_cost', 0):.2f}/month)"
+            self._client('rds', region, account_id).delete_db_instance(
+                DBInstanceIdentifier=resource_id,
+                SkipFinalSnapshot=True,
+                DeleteAutomatedBackups=True
+            )
+            return f"Deleted RDS: {resource_id}"
+            
         elif resource_type == 'nat':
-            return f"NAT: {resource.get('NatGatewayId', 'N/A')} (${resource.get('estimated_cost', 0):.2f}/month)"
+            self._client('ec2', region, account_id).delete_nat_gateway(NatGatewayId=resource_id)
+            return f"Deleted NAT Gateway: {resource_id}"
+            
         elif resource_type == 'eni':
-            return f"ENI: {resource.get('NetworkInterfaceId', 'N/A')} (${resource.get('estimated_cost', 0):.2f}/month)"
-        else:
-            return f"Resource: {resource.get('id', 'N/A')}"
+            self._client('ec2', region, account_id).delete_network_interface(NetworkInterfaceId=resource_id)
+            return f"Deleted ENI: {resource_id}"
+        
+        return f"Resource type {resource_type} dilewatin"
+    
+    def _eip_bekas_nat(self, nat: UnusedResource) -> List[UnusedResource]:
+        """Record EIP yang ikut dilepas abis NAT-nya kehapus, dari associated_eips hasil scan"""
+        return [
+            UnusedResource(
+                'eip', eip['allocation_id'], nat.region, nat.account_id,
+                self._estimasi_biaya('eip', nat.region, {}),
+                label=eip.get('public_ip'), unused_reason=f"bekas {nat.resource_id}"
+            )
+            for eip in nat.associated_eips or []
+        ]
+    
+    def _eip_ikut_dilepas(self, resources: List[UnusedResource]) -> List[UnusedResource]:
+        """Semua EIP bekas NAT yang bakal ikut dilepas kalo resources-nya dihapus batch"""
+        return [
+            eip for resource in resources
+            if resource.resource_type == 'nat' and resource.protected_by is None
+            for eip in self._eip_bekas_nat(resource)
+        ]
     
-    def delete_resource(self, resource: Dict) -> bool:
+    def delete_resource(self, resource: UnusedResource) -> bool:
         """Delete specific resource"""
-        resource_type = resource.get('resource_type', 'unknown')
+        resource_type = resource.resource_type
         
         try:
-            if resource_type == 'eip':
-                self.clients['ec2'].release_address(AllocationId=resource['AllocationId'])
-                console.print(f"[green]✓[/green] Deleted EIP: {resource.get('PublicIp')}")
-                
-            elif resource_type == 'elb':
-                if 'LoadBalancerArn' in resource:  # ALB/NLB
-                    self.clients['elbv2'].delete_load_balancer(LoadBalancerArn=resource['LoadBalancerArn'])
-                else:  # Classic ELB
-                    self.clients['elb'].delete_load_balancer(LoadBalancerName=resource['LoadBalancerName'])
-                console.print(f"[green]✓[/green] Deleted ELB: {resource.get('LoadBalancerName', 'ALB/NLB')}")
-                
-            elif resource_type == 'ebs':
-                self.clients['ec2'].delete_volume(VolumeId=resource['VolumeId'])
-                console.print(f"[green]✓[/green] Deleted EBS Volume: {resource.get('VolumeId')}")
-                
-            elif resource_type == 'snapshot':
-                self.clients['ec2'].delete_snapshot(SnapshotId=resource['SnapshotId'])
-                console.print(f"[green]✓[/green] Deleted Snapshot: {resource.get('SnapshotId')}")
-                
-            elif resource_type == 'rds':
-                self.clients['rds'].delete_db_instance(
-                    DBInstanceIdentifier=resource['DBInstanceIdentifier'],
-                    SkipFinalSnapshot=True,
-                    DeleteAutomatedBackups=True
-                )
-                console.print(f"[green]✓[/green] Deleted RDS: {resource.get('DBInstanceIdentifier')}")
-                
-            elif resource_type == 'nat':
-                self.clients['ec2'].delete_nat_gateway(NatGatewayId=resource['NatGatewayId'])
-                console.print(f"[green]✓[/green] Deleted NAT Gateway: {resource.get('NatGatewayId')}")
-                
-            elif resource_type == 'eni':
-                self.clients['ec2'].delete_network_interface(NetworkInterfaceId=resource['NetworkInterfaceId'])
-                console.print(f"[green]✓[/green] Deleted ENI: {resource.get('NetworkInterfaceId')}")
-            
-            self.statistik['deleted_resources'] += 1
+            pesan = self._panggil_api_hapus(resource)
+            self.console.print(f"[green]✓[/green] {pesan}")
+            self._catat_kehapus(resource)
+            self._invalidasi_cache(resource)
             return True
             
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            console.print(f"[red]✗[/red] Failed to delete {resource_type}: {error_code}")
+            self.console.print(f"[red]✗[/red] Failed to delete {resource_type}: {error_code}")
             self.logger.error(f"Failed to delete {resource_type}: {e}")
-            self.statistik['failed_deletions'] += 1
+            with self._statistik_lock:
+                self.statistik['failed_deletions'] += 1
             return False
     
-    def mode_interaktif(self, resources: List[Dict]) -> None:
+    def _catat_kehapus(self, resource: UnusedResource) -> None:
+        """Update statistik & penghematan aktual abis resource sukses dihapus"""
+        # Resource di luar rollup (EIP bekas NAT) dihitung sendiri
+        di_rollup = self.rollup is not None and self.rollup.tandai_kehapus(resource)
+        with self._statistik_lock:
+            self.statistik['deleted_resources'] += 1
+            if not di_rollup:
+                self._hemat_di_luar_rollup += resource.estimated_cost
+            self.statistik['actual_savings'] = self._hemat_di_luar_rollup + (
+                self.rollup.penghematan_aktual if self.rollup is not None else 0.0
+            )
+    
+    def _invalidasi_cache(self, resource: UnusedResource) -> None:
+        """Buang cache inventory di lokasi resource yang barusan dihapus biar kagak basi"""
+        if self.inventory_cache is None:
+            return
+        self.inventory_cache.invalidasi(
+            self._cache_account(resource.account_id),
+            resource.region or self.region
+        )
+    
+    def _tunggu_nat_kehapus(self, nat_resources: List[UnusedResource]) -> List[UnusedResource]:
+        """
+        Tunggu sampe NAT Gateway yang dihapus beneran berstatus 'deleted'
+        
+        Error pas ngecek status cuma bikin NAT yang bersangkutan dianggep gagal,
+        yang lain tetep ditungguin.
+        
+        Returns:
+            NAT yang udah pasti kehapus
+        """
+        per_lokasi: Dict[Tuple, Dict[str, UnusedResource]] = {}
+        for nat in nat_resources:
+            key = (nat.account_id, nat.region)
+            per_lokasi.setdefault(key, {})[nat.resource_id] = nat
+        
+        kehapus = []
+        batas_waktu = time.monotonic() + self.NAT_DELETE_TIMEOUT
+        for (account_id, region), nats in per_lokasi.items():
+            client = self._client('ec2', region, account_id)
+            sisa = set(nats)
+            while sisa and time.monotonic() < batas_waktu:
+                try:
+                    response = client.describe_nat_gateways(NatGatewayIds=sorted(sisa))
+                    status = {nat['NatGatewayId']: nat.get('State') for nat in response.get('NatGateways', [])}
+                except ClientError:
+                    # Satu NAT yang bermasalah bikin satu call gagal, cek satu-satu biar ketauan yang mana
+                    status = {nat_id: self._status_nat(client, nat_id) for nat_id in sorted(sisa)}
+                
+                for nat_id in sorted(sisa):
+                    # NAT yang kagak muncul lagi di response udah lama ilangnya
+                    state = status.get(nat_id, 'deleted')
+                    if state == 'deleted':
+                        kehapus.append(nats[nat_id])
+                        sisa.discard(nat_id)
+                    elif state is None:
+                        sisa.discard(nat_id)
+                if sisa:
+                    time.sleep(self.NAT_DELETE_POLL_INTERVAL)
+            if sisa:
+                self.console.print(f"[yellow]⚠[/yellow] NAT {', '.join(sorted(sisa))} belom kelar dihapus, lanjut aja")
+        return kehapus
+    
+    def _status_nat(self, client, nat_id: str) -> Optional[str]:
+        """
+        Status satu NAT Gateway buat _tunggu_nat_kehapus
+        
+        Returns:
+            State NAT-nya, 'pending' kalo errornya sementara, atau None kalo
+            statusnya kagak bisa dicek (NAT-nya dianggep gagal)
+        """
+        try:
+            response = client.describe_nat_gateways(NatGatewayIds=[nat_id])
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code == 'NatGatewayNotFound':
+                return 'deleted'
+            if error_code in self.RETRYABLE_DELETE_ERRORS:
+                return 'pending'
+            self.console.print(f"[red]✗[/red] Gagal ngecek status NAT {nat_id}: {error_code}, EIP-nya kagak dilepas")
+            self.logger.error(f"Gagal ngecek status NAT {nat_id}: {e}")
+            return None
+        for nat in response.get('NatGateways', []):
+            return nat.get('State')
+        return 'deleted'
+    
+    def _hapus_paralel(self, resources: List[UnusedResource],
+                       on_done: Optional[Callable[[UnusedResource, bool], None]] = None,
+                       berhenti: Optional[threading.Event] = None) -> None:
+        """
+        Hapus resources barengan, diurutin per tier dependency
+        
+        Tier pertama (NAT, ELB, RDS) dihapus duluan. NAT ditungguin sampe beneran
+        'deleted' sebelum lanjut ke tier berikutnya (ENI, EIP, EBS, Snapshot),
+        soalnya ENI & EIP bekas NAT baru bisa dilepas abis NAT-nya ilang. EIP yang
+        nempel di NAT (associated_eips hasil scan) ikut dilepas di tier itu.
+        Error yang sifatnya sementara (DependencyViolation dkk) dimasukin lagi
+        ke antrian pake backoff, bukan langsung dihitung gagal.
+        
+        Args:
+            resources: Resources yang mau dihapus
+            on_done: Callback (resource, sukses) tiap resource kelar diproses
+            berhenti: Kalo di-set, kagak ada penghapusan baru yang dimulai; yang lagi jalan
+                ditungguin, sisanya (plus tier berikutnya) dilewatin
+        """
+        # EIP bekas NAT yang udah pasti kehapus, ikut dilepas di tier berikutnya
+        tambahan: List[UnusedResource] = []
+        for tier in self.DELETE_TIERS:
+            if berhenti is not None and berhenti.is_set():
+                return
+            items = [r for r in resources + tambahan if r.resource_type in tier]
+            if not items:
+                continue
+            
+            # Heap isinya (waktu_siap, urutan, percobaan, resource)
+            antrian: List[Tuple] = [(0.0, i, 1, r) for i, r in enumerate(items)]
+            heapq.heapify(antrian)
+            lagi_jalan: Dict = {}
+            jumlah_jalan: Dict[str, int] = {}
+            nat_kehapus = []
+            
+            total_worker = sum(self.delete_concurrency.get(rt, 1) for rt in tier)
+            with ThreadPoolExecutor(max_workers=total_worker, thread_name_prefix="deleter") as executor:
+                while antrian or lagi_jalan:
+                    if berhenti is not None and berhenti.is_set():
+                        antrian.clear()
+                        if not lagi_jalan:
+                            break
+                    sekarang = time.monotonic()
+                    ditunda = []
+                    siap = []
+                    # Jalanin semua item yang udah siap, selama slot per type masih ada
+                    while antrian and antrian[0][0] <= sekarang:
+                        item = heapq.heappop(antrian)
+                        resource_type = item[3].resource_type
+                        if jumlah_jalan.get(resource_type, 0) >= self.delete_concurrency.get(resource_type, 1):
+                            ditunda.append(item)
+                            continue
+                        jumlah_jalan[resource_type] = jumlah_jalan.get(resource_type, 0) + 1
+                        siap.append(item)
+                    if siap and self.journal is not None:
+                        # Niat hapus segelombang di-fsync sekali, baru API-nya dipanggil
+                        self.journal.catat_mulai([item[3] for item in siap])
+                    for item in siap:
+                        lagi_jalan[executor.submit(self._panggil_api_hapus, item[3])] = item
+                    for item in ditunda:
+                        heapq.heappush(antrian, item)
+                    
+                    if not lagi_jalan:
+                        jeda = max(0.0, antrian[0][0] - time.monotonic())
+                        if berhenti is not None:
+                            berhenti.wait(jeda)
+                        else:
+                            time.sleep(jeda)
+                        continue
+                    
+                    timeout = None
+                    if antrian and not ditunda:
+                        timeout = max(0.0, antrian[0][0] - time.monotonic())
+                    selesai, _ = wait(list(lagi_jalan), timeout=timeout, return_when=FIRST_COMPLETED)
+                    
+                    for future in selesai:
+                        waktu_siap, urutan, percobaan, resource = lagi_jalan.pop(future)
+                        resource_type = resource.resource_type
+                        jumlah_jalan[resource_type] -= 1
+                        try:
+                            pesan = future.result()
+                        except ClientError as e:
+                            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                            if (error_code in self.NOT_FOUND_DELETE_ERRORS and self.journal is not None
+                                    and self.journal.pernah_dicoba(resource)):
+                                # Run yang kepotong ternyata udah sempet ngehapus
+                                pesan = f"{resource_type} {resource.resource_id} udah kehapus di run sebelumnya"
+                            elif error_code in self.RETRYABLE_DELETE_ERRORS and percobaan < self.MAX_DELETE_ATTEMPTS:
+                                jeda = min(self.DELETE_BACKOFF_MAX, self.DELETE_BACKOFF_BASE * 2 ** (percobaan - 1))
+                                self.console.print(
+                                    f"[yellow]⟳[/yellow] {resource_type} {resource.resource_id} "
+                                    f"belom bisa dihapus ({error_code}), dicoba lagi dalam {jeda:.1f}s"
+                                )
+                                heapq.heappush(antrian, (time.monotonic() + jeda, urutan, percobaan + 1, resource))
+                                continue
+                            else:
+                                self.console.print(f"[red]✗[/red] Failed to delete {resource_type}: {error_code}")
+                                self.logger.error(f"Failed to delete {resource_type}: {e}")
+                                with self._statistik_lock:
+                                    self.statistik['failed_deletions'] += 1
+                                if self.journal is not None:
+                                    self.journal.catat_hasil(resource, False, error_code)
+                                if on_done:
+                                    on_done(resource, False)
+                                continue
+                        
+                        self.console.print(f"[green]✓[/green] {pesan}")
+                        if self.journal is not None:
+                            self.journal.catat_hasil(resource, True)
+                        self._catat_kehapus(resource)
+                        self._invalidasi_cache(resource)
+                        if resource_type == 'nat':
+                            eips = self._eip_bekas_nat(resource)
+                            nat_kehapus.append((resource, eips))
+                            if self.journal is not None:
+                                # Masuk plan sekarang biar --resume tetep ngelepas EIP-nya
+                                for eip in eips:
+                                    self.journal.tambah(eip)
+                        if on_done:
+                            on_done(resource, True)
+            
+            if nat_kehapus and not (berhenti is not None and berhenti.is_set()):
+                self.console.print(f"[cyan]⏳ Nungguin {len(nat_kehapus)} NAT Gateway beneran kehapus...[/cyan]")
+                eip_bekas_nat = {id(nat): eips for nat, eips in nat_kehapus}
+                for nat in self._tunggu_nat_kehapus([nat for nat, _ in nat_kehapus]):
+                    tambahan.extend(eip_bekas_nat[id(nat)])
+                if tambahan:
+                    self.console.print(f"[cyan]🌐 {len(tambahan)} EIP bekas NAT ikut dilepas[/cyan]")
+    
+    async def delete_async(self, resources: List[UnusedResource]
+                           ) -> AsyncIterator[Tuple[UnusedResource, bool]]:
+        """
+        Versi asyncio dari batch delete, yield (resource, sukses) tiap resource kelar
+        
+        Urutan tier, concurrency per type sama retry-nya sama persis kayak _hapus_paralel.
+        Kalo iterasinya distop di tengah, kagak ada penghapusan baru yang dimulai,
+        cuma yang udah terlanjur jalan yang diberesin dulu.
+        
+        Args:
+            resources: Resources yang mau dihapus, yang dilindungin --protect-tag dilewatin
+        """
+        resources = self._yang_bisa_dihapus(resources)
+        
+        def produser(kirim: Callable[[object], bool], berhenti: threading.Event) -> None:
+            def resource_kelar(resource: UnusedResource, sukses: bool) -> None:
+                if not kirim((resource, sukses)):
+                    berhenti.set()
+            self._hapus_paralel(resources, on_done=resource_kelar, berhenti=berhenti)
+        
+        async for hasil in self._iter_async(produser):
+            yield hasil
+    
+    def mode_interaktif(self, resources: List[UnusedResource]) -> None:
         """Mode interaktif buat delete resources satu-satu"""
-        console.print("\n[bold blue]🎯 Mode Interaktif[/bold blue]")
-        console.print("Review tiap unused resource terus pilih mau dihapus atau kagak.\n")
+        from rich.prompt import Confirm
         
+        self.console.print("\n[bold blue]🎯 Mode Interaktif[/bold blue]")
+        self.console.print("Review tiap unused resource terus pilih mau dihapus atau kagak.\n")
+        
+        resources = self._yang_bisa_dihapus(resources)
         if not resources:
-            console.print("[green]✨[/green] Kagak ada unused resources!")
+            self.console.print("[green]✨[/green] Kagak ada unused resources!")
             return
         
         for i, resource in enumerate(resources, 1):
             detail = self._get_resource_detail(resource)
-            resource_type = resource.get('resource_type', 'unknown')
+            resource_type = resource.resource_type
             
             if resource_type in self.SUPPORTED_RESOURCES:
                 info = self.SUPPORTED_RESOURCES[resource_type]
-                console.print(f"\n[bold]Resource {i}/{len(resources)}:[/bold]")
-                console.print(f"  {info['icon']} Type: [cyan]{info['name']}[/cyan]")
-                console.print(f"  Detail: [dim]{detail}[/dim]")
-                console.print(f"  Monthly Cost: [yellow]${resource.get('estimated_cost', 0):.2f}[/yellow]")
+                self.console.print(f"\n[bold]Resource {i}/{len(resources)}:[/bold]")
+                self.console.print(f"  {info['icon']} Type: [cyan]{info['name']}[/cyan]")
+                self.console.print(f"  Detail: [dim]{detail}[/dim]")
+                self.console.print(f"  Monthly Cost: [yellow]${resource.estimated_cost:.2f}[/yellow]")
                 
                 if Confirm.ask(f"  Mau hapus resource ini, Bos?", default=False):
                     self.delete_resource(resource)
                 else:
-                    console.print(f"  [dim]Dilewatin aja...[/dim]")
+                    self.console.print(f"  [dim]Dilewatin aja...[/dim]")
     
-    def mode_batch(self, resources: List[Dict], konfirmasi: bool = True) -> None:
-        """Mode batch buat delete semua unused resources"""
+    def mode_batch(self, resources: List[UnusedResource], konfirmasi: bool = True,
+                   journal: Optional[str] = None) -> None:
+        """
+        Mode batch buat delete semua unused resources
+        
+        Args:
+            resources: Resources yang mau dihapus
+            konfirmasi: Tanya dulu sebelum mulai hapus
+            journal: Path journal buat --resume (None = kagak pake journal)
+        """
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+        from rich.prompt import Confirm
+        
+        if self.rollup is None:
+            # Penghematan aktual dicatet ke rollup hasil scan (yang belom disaring)
+            self._rollup(resources)
+        resources = self._yang_bisa_dihapus(resources)
         if not resources:
-            console.print("[green]✨[/green] Kagak ada unused resources!")
+            self.console.print("[green]✨[/green] Kagak ada unused resources!")
             return
         
-        console.print(f"\n[bold red]🔥 Mode Batch[/bold red]")
-        console.print(f"Ketemu [bold]{len(resources)}[/bold] unused resources")
+        # EIP yang nempel di NAT ikut dilepas, jadi ikut diitung dari awal
+        eip_nat = self._eip_ikut_dilepas(resources)
+        ikut_eip = f" + {len(eip_nat)} EIP bekas NAT" if eip_nat else ""
+        
+        self.console.print(f"\n[bold red]🔥 Mode Batch[/bold red]")
+        self.console.print(f"Ketemu [bold]{len(resources)}[/bold] unused resources{ikut_eip}")
         
         if konfirmasi:
-            total_savings = sum(r.get('estimated_cost', 0) for r in resources)
+            # Jangan bikin rollup baru dari list yang udah disaring, penghematan aktualnya
+            # mesti nyatet ke rollup hasil scan yang dipake laporan
+            total_savings = sum(r.estimated_cost for r in resources + eip_nat)
             if not Confirm.ask(
-                f"Hapus SEMUA {len(resources)} unused resources? "
+                f"Hapus SEMUA {len(resources)} unused resources{ikut_eip}? "
                 f"(Ini bisa hemat ${total_savings:.2f}/month lho!)",
                 default=False
             ):
-                console.print("[yellow]⚠[/yellow] Operasi batch dibatalin")
+                self.console.print("[yellow]⚠[/yellow] Operasi batch dibatalin")
                 return
         
         # Delete resources pake progress bar
@@ -660,147 +3640,353 @@ class AWSResourceCleanerBetawi:
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
+            console=self.console
         ) as progress:
             
-            task = progress.add_task("Deleting resources...", total=len(resources))
+            task = progress.add_task("Deleting resources...", total=len(resources) + len(eip_nat))
             
-            for resource in resources:
-                resource_type = resource.get('resource_type', 'unknown')
-                progress.update(task, description=f"Deleting {resource_type}...")
-                self.delete_resource(resource)
+            def resource_kelar(resource: UnusedResource, sukses: bool) -> None:
+                progress.update(task, description=f"Deleting {resource.resource_type}...")
                 progress.advance(task)
-                time.sleep(0.5)  # Delay dikit biar kagak kena rate limiting
+            
+            if journal and self.journal is None:
+                self.mulai_journal(resources, journal)
+            try:
+                self._hapus_paralel(resources, on_done=resource_kelar)
+            except BaseException:
+                if self.journal is not None:
+                    progress.stop()
+                    self.console.print(
+                        f"[yellow]⚠[/yellow] Penghapusan kepotong, lanjutin pake: "
+                        f"[bold]--resume {self.journal.nama_file}[/bold]"
+                    )
+                raise
+            finally:
+                self.tutup_journal()
+    
+    def mulai_journal(self, resources: List[UnusedResource], nama_file: str) -> None:
+        """Bikin journal penghapusan buat resources yang mau dihapus"""
+        header = {
+            **self._info_laporan(),
+            'role_arns': self.role_arns,
+            'statistik': {
+                field: self.statistik[field]
+                for field in ('total_resources', 'unused_resources', 'total_savings', 'protected_resources')
+            }
+        }
+        self.journal = JournalHapus.baru(nama_file, header, resources)
+        self.console.print(f"[dim]📒 Journal penghapusan: {self.journal.nama_file}[/dim]")
+    
+    def tutup_journal(self) -> None:
+        """fsync & tutup journal yang lagi kebuka, yang udah kelar dibuang"""
+        if self.journal is None:
+            return
+        journal, self.journal = self.journal, None
+        if journal.beresin():
+            self.console.print(f"[dim]📒 Journal {journal.nama_file} udah kelar, dihapus[/dim]")
+    
+    def lanjutin_journal(self, nama_file: str, konfirmasi: bool = True) -> None:
+        """
+        Lanjutin batch delete yang kepotong dari journal-nya, tanpa scan ulang
+        
+        Resource yang udah ada hasilnya dilewatin, statistik dibangun ulang dari
+        journal biar ringkasan akhirnya sama persis kayak run yang kagak kepotong.
+        
+        Args:
+            nama_file: Path journal dari run sebelumnya
+            konfirmasi: Tanya dulu sebelum lanjut hapus
+        """
+        from rich.prompt import Confirm
+        
+        try:
+            journal = JournalHapus.buka(nama_file)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.console.print(f"[red]✗[/red] Journal {nama_file} kagak bisa dibaca: {e}")
+            sys.exit(1)
+        
+        # Statistik scan dari header, statistik hapus dari hasil yang udah kecatet
+        self.statistik.update(journal.header.get('statistik', {}))
+        self.rollup = RollupBiaya(journal.resources, self.region)
+        for n, (sukses, error) in journal.hasil.items():
+            if sukses:
+                self._catat_kehapus(journal.resources[n])
+            elif error != JournalHapus.DILEWATIN:
+                self.statistik['failed_deletions'] += 1
+        
+        sisa = journal.sisa()
+        self.console.print(
+            f"[green]✓[/green] Journal {nama_file}: {len(journal.resources) - len(sisa)}/"
+            f"{len(journal.resources)} resources udah beres, {len(sisa)} lagi"
+            + (f" ({len(journal.kepotong)} sempet dicoba pas kepotong)" if journal.kepotong else "")
+        )
+        if not sisa:
+            self.journal = journal
+            self.tutup_journal()
+            return
+        
+        # Account member di-assume ulang pake role yang sama kayak run awalnya
+        role_arns = journal.header.get('role_arns') or {}
+        akun_kurang = sorted({r.account_id for r in sisa if r.account_id} - set(self.account_sessions))
+        if akun_kurang:
+            self._siapin_sessions_akun([role_arns.get(a) or a for a in akun_kurang])
+        
+        # Aturan --protect-tag yang baru ditambahin pas resume tetep berlaku, tag-nya
+        # dicek ulang ke index soalnya journal cuma nyimpen key yang dipake run awalnya
+        if self.proteksi is not None:
+            self._tipe_index_tag = sorted({self.TAG_RESOURCE_TYPE[r.resource_type][0] for r in sisa})
+            try:
+                for resource in sisa:
+                    self._lengkapi_tag(resource, ulang=True)
+            except (ClientError, BotoCoreError) as e:
+                self.console.print(f"[yellow]⚠[/yellow] Tag terbaru kagak bisa diambil, pake tag dari journal: {e}")
+            for resource in sisa:
+                if self._dilindungin(resource):
+                    # Dicatet dilewatin biar journal-nya bisa kelar
+                    journal.catat_hasil(resource, False, JournalHapus.DILEWATIN)
+            sisa = self._yang_bisa_dihapus(sisa)
+            if not sisa:
+                self.journal = journal
+                self.tutup_journal()
+                return
+        
+        if konfirmasi:
+            eip_nat = self._eip_ikut_dilepas(sisa)
+            ikut_eip = f" + {len(eip_nat)} EIP bekas NAT" if eip_nat else ""
+            total = sum(r.estimated_cost for r in sisa + eip_nat)
+            if not Confirm.ask(f"Lanjut hapus {len(sisa)} resources sisanya{ikut_eip}? (${total:.2f}/month)",
+                               default=False):
+                self.console.print("[yellow]⚠[/yellow] Resume dibatalin")
+                journal.tutup()
+                return
+        
+        self.journal = journal
+        self.mode_batch(sisa, konfirmasi=False)
     
-    def mode_dry_run(self, resources: List[Dict]) -> None:
+    def mode_dry_run(self, resources: List[UnusedResource]) -> None:
         """Mode dry run - cuma liat apa yang bakal dihapus"""
-        console.print("\n[bold yellow]🧪 Mode Dry Run[/bold yellow]")
-        console.print("Analisis apa yang bakal dihapus (kagak bakal ada perubahan beneran)\n")
+        from rich.panel import Panel
+        from rich.table import Table
+        
+        if self.output in self.FORMAT_MESIN:
+            return
+        
+        self.console.print("\n[bold yellow]🧪 Mode Dry Run[/bold yellow]")
+        self.console.print("Analisis apa yang bakal dihapus (kagak bakal ada perubahan beneran)\n")
         
         if not resources:
-            console.print("[green]✨[/green] Kagak ada unused resources yang bakal dihapus!")
+            self.console.print("[green]✨[/green] Kagak ada unused resources yang bakal dihapus!")
             return
         
-        # Group by resource type
-        grouped = {}
-        total_savings = 0.0
+        rollup = self._rollup(resources)
+        total_savings = rollup.total_cost
+        ringkasan_type = rollup.ringkasan('resource_type')
         
-        for resource in resources:
-            resource_type = resource.get('resource_type', 'unknown')
-            if resource_type not in grouped:
-                grouped[resource_type] = []
-            grouped[resource_type].append(resource)
-            total_savings += resource.get('estimated_cost', 0.0)
-        
-        # Bikin tabel per resource type
-        for resource_type, resource_list in grouped.items():
-            if resource_type in self.SUPPORTED_RESOURCES:
+        # Bikin tabel per resource type (summary cukup rollup & panel di bawah)
+        for resource_type, resource_list in rollup.kelompok('resource_type').items():
+            if resource_type in self.SUPPORTED_RESOURCES and self.output != 'summary':
                 info = self.SUPPORTED_RESOURCES[resource_type]
-                type_savings = sum(r.get('estimated_cost', 0.0) for r in resource_list)
+                type_savings = ringkasan_type[resource_type]['total_cost']
                 
                 table = Table(
                     title=f"{info['icon']} {info['name']} yang Bakal Dihapus",
                     show_header=True,
                     header_style="bold yellow"
                 )
+                multi_region = len(self.regions) > 1 or self.multi_account
+                if multi_region:
+                    table.add_column("Lokasi", style="magenta", no_wrap=True)
                 table.add_column("Resource ID", style="cyan")
                 table.add_column("Detail", style="dim")
                 table.add_column("Monthly Savings", style="green", justify="right")
                 
-                for resource in resource_list:
+                # Cuma max_rows yang paling mahal, biar tabel 100k snapshot kagak nahan semua baris
+                baris = self._paling_mahal(resource_list, self.max_rows)
+                for resource in baris:
                     detail = self._get_resource_detail(resource)
+                    kolom_region = [
+                        self._label_lokasi(resource.region, resource.account_id)
+                    ] if multi_region else []
                     table.add_row(
-                        self._get_resource_id(resource),
+                        *kolom_region,
+                        resource.resource_id,
                         detail,
-                        f"${resource.get('estimated_cost', 0):.2f}"
+                        f"${resource.estimated_cost:.2f}"
+                    )
+                    if resource.protected_by is None:
+                        # EIP yang ikut dilepas abis NAT-nya kehapus
+                        for eip in self._eip_bekas_nat(resource):
+                            table.add_row(
+                                *([""] if multi_region else []),
+                                f"  ↳ {eip.resource_id}",
+                                f"EIP {eip.label} ikut dilepas",
+                                f"${eip.estimated_cost:.2f}"
+                            )
+                
+                sisa = len(resource_list) - len(baris)
+                if sisa > 0:
+                    biaya_tampil = sum(r.estimated_cost for r in baris)
+                    table.add_row(
+                        *([""] if multi_region else []),
+                        f"[dim]... dan {sisa} lainnya[/dim]",
+                        "[dim]naikin --max-rows atau pake --output json buat liat semua[/dim]",
+                        f"[dim]${type_savings - biaya_tampil:.2f}[/dim]"
                     )
                 
                 table.add_row(
+                    *([""] if multi_region else []),
                     "[bold]TOTAL[/bold]",
                     f"[bold]{len(resource_list)} items[/bold]",
                     f"[bold green]${type_savings:.2f}[/bold green]"
                 )
                 
-                console.print(table)
-                console.print()
+                self.console.print(table)
+                self.console.print()
+        
+        self._tampilkan_tabel_rollup(resources)
+        
+        # Yang dilindungin ikut ditampilin di tabel, tapi kagak diitung bakal dihapus
+        dilindungin = [r for r in resources if r.protected_by is not None]
+        biaya_dilindungin = sum(r.estimated_cost for r in dilindungin)
+        baris_proteksi = (
+            f"Dilindungin --protect-tag: [bold green]{len(dilindungin)}[/bold green] "
+            f"(${biaya_dilindungin:.2f}/month, kagak dihapus)\n"
+        ) if dilindungin else ""
+        total_savings -= biaya_dilindungin
+        eip_nat = self._eip_ikut_dilepas(resources)
+        total_savings += sum(r.estimated_cost for r in eip_nat)
+        baris_eip = (
+            f"EIP bekas NAT yang ikut dilepas: [bold yellow]{len(eip_nat)}[/bold yellow]\n"
+        ) if eip_nat else ""
         
         # Panel ringkasan total
         panel_ringkasan = Panel(
             f"[bold]Ringkasan Dry Run[/bold]\n\n"
-            f"Total resources yang bakal dihapus: [bold yellow]{len(resources)}[/bold yellow]\n"
+            f"Total resources yang bakal dihapus: "
+            f"[bold yellow]{len(resources) - len(dilindungin) + len(eip_nat)}[/bold yellow]\n"
+            f"{baris_eip}"
+            f"{baris_proteksi}"
             f"Total penghematan bulanan: [bold green]${total_savings:.2f}[/bold green]\n"
             f"Total penghematan tahunan: [bold green]${total_savings * 12:.2f}[/bold green]",
             title="💰 Potensi Penghematan",
             border_style="green"
         )
-        console.print(panel_ringkasan)
+        self.console.print(panel_ringkasan)
     
-    def _get_resource_id(self, resource: Dict) -> str:
-        """Get resource ID for display"""
-        resource_type = resource.get('resource_type', 'unknown')
+    def mode_serve(self, resource_types: Set[str], host: Optional[str] = None,
+                   port: Optional[int] = None, **jadwal) -> None:
+        """
+        Mode daemon read-only: scan terjadwal, hasilnya disajiin lewat HTTP lokal
         
-        if resource_type == 'eip':
-            return resource.get('AllocationId', 'N/A')
-        elif resource_type == 'elb':
-            return resource.get('LoadBalancerName') or resource.get('LoadBalancerArn', '').split('/')[-1]
-        elif resource_type == 'ebs':
-            return resource.get('VolumeId', 'N/A')
-        elif resource_type == 'snapshot':
-            return resource.get('SnapshotId', 'N/A')
-        elif resource_type == 'rds':
-            return resource.get('DBInstanceIdentifier', 'N/A')
-        elif resource_type == 'nat':
-            return resource.get('NatGatewayId', 'N/A')
-        elif resource_type == 'eni':
-            return resource.get('NetworkInterfaceId', 'N/A')
-        else:
-            return 'N/A'
+        Args:
+            resource_types: Resource types yang di-scan tiap putaran
+            host: Alamat HTTP (default: DaemonScan.DEFAULT_HOST)
+            port: Port HTTP (default: DaemonScan.DEFAULT_PORT, 0 = port acak)
+            **jadwal: interval & jitter buat DaemonScan
+        """
+        self.console.print("\n[bold blue]🛰️ Mode Serve[/bold blue]")
+        self.console.print("Kagak ada yang dihapus, cuma scan rutin & nyajiin hasilnya.\n")
+        DaemonScan(self, resource_types, **jadwal).jalanin(
+            DaemonScan.DEFAULT_HOST if host is None else host,
+            DaemonScan.DEFAULT_PORT if port is None else port
+        )
     
-    def ekspor_laporan(self, resources: List[Dict], nama_file: Optional[str] = None) -> None:
-        """Ekspor laporan detail ke file JSON"""
+    def _info_laporan(self) -> Dict:
+        """Info run yang ditaruh di awal laporan"""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "region": self.region,
+            "regions": self.regions,
+            "accounts": [a for a in self.accounts if a] or None,
+            "profile": self.profile,
+            "filter": self.filter_resource.ekspresi if self.filter_resource else None,
+            "protect_tag": self.proteksi.aturan if self.proteksi else None
+        }
+    
+    @staticmethod
+    def _nama_file_laporan(nama_file: Optional[str], ekstensi: str, compress: bool) -> str:
+        """Nama file laporan default pake timestamp, plus .gz kalo dikompres"""
         if not nama_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nama_file = f"laporan_aws_cleanup_{timestamp}.json"
+            nama_file = f"laporan_aws_cleanup_{timestamp}.{ekstensi}"
+        if compress and not nama_file.endswith('.gz'):
+            nama_file += '.gz'
+        return nama_file
+    
+    def mulai_laporan_streaming(self, nama_file: Optional[str] = None, compress: bool = False) -> None:
+        """Buka laporan NDJSON, tiap resource yang ketemu pas scan langsung ditulis ke situ"""
+        nama_file = self._nama_file_laporan(nama_file, 'ndjson', compress)
+        self.laporan_streaming = LaporanStreaming(nama_file, self._info_laporan(), compress=compress)
+    
+    def mulai_output_streaming(self) -> None:
+        """Buka output json/ndjson di stdout, tiap resource langsung ditulis pas ketemu"""
+        kelas = LaporanStreamingJSON if self.output == 'json' else LaporanStreaming
+        self.output_streaming = kelas('<stdout>', self._info_laporan(), file=sys.stdout)
+    
+    def tutup_laporan_streaming(self, lengkap: bool = True) -> None:
+        """Tulis trailer statistik & ringkasan ke output stdout & laporan NDJSON terus tutup"""
+        if self.output_streaming is not None:
+            output, self.output_streaming = self.output_streaming, None
+            output.tutup(self.statistik, lengkap=lengkap, api_metrics=self.metrik_api.ke_dict())
+        if self.laporan_streaming is None:
+            return
+        laporan, self.laporan_streaming = self.laporan_streaming, None
+        try:
+            laporan.tutup(self.statistik, lengkap=lengkap, api_metrics=self.metrik_api.ke_dict())
+            self.console.print(
+                f"[green]✓[/green] Laporan NDJSON ({laporan.jumlah} resources) "
+                f"udah diekspor ke: [bold]{laporan.nama_file}[/bold]"
+            )
+        except Exception as e:
+            self.console.print(f"[red]✗[/red] Gagal nutup laporan: {e}")
+    
+    def ekspor_laporan(self, resources: List[UnusedResource], nama_file: Optional[str] = None,
+                       compress: bool = False) -> None:
+        """Ekspor laporan detail ke file JSON"""
+        nama_file = self._nama_file_laporan(nama_file, 'json', compress)
         
-        # Group resources by type for report
-        grouped_resources = {}
-        for resource in resources:
-            resource_type = resource.get('resource_type', 'unknown')
-            if resource_type not in grouped_resources:
-                grouped_resources[resource_type] = []
-            grouped_resources[resource_type].append(resource)
+        rollup = self._rollup(resources)
+        ringkasan_type = rollup.ringkasan('resource_type')
         
         data_laporan = {
-            "timestamp": datetime.now().isoformat(),
-            "region": self.region,
-            "profile": self.profile,
+            **self._info_laporan(),
             "statistik": self.statistik,
             "resource_summary": {
                 resource_type: {
-                    "count": len(resource_list),
-                    "total_cost": sum(r.get('estimated_cost', 0.0) for r in resource_list),
-                    "resources": resource_list
+                    "count": ringkasan_type[resource_type]['count'],
+                    "total_cost": ringkasan_type[resource_type]['total_cost'],
+                    "resources": [r.ke_dict() for r in resource_list]
                 }
-                for resource_type, resource_list in grouped_resources.items()
+                for resource_type, resource_list in rollup.kelompok('resource_type').items()
             },
+            "region_summary": rollup.ringkasan('region'),
+            "account_summary": rollup.ringkasan('account_id'),
+            "tag_summary": {tag_key: rollup.ringkasan(f"tag:{tag_key}") for tag_key in self.rollup_tags},
             "total_potential_savings": {
-                "monthly": sum(r.get('estimated_cost', 0.0) for r in resources),
-                "yearly": sum(r.get('estimated_cost', 0.0) for r in resources) * 12
-            }
+                "monthly": rollup.total_cost,
+                "yearly": rollup.total_cost * 12
+            },
+            "actual_savings": {
+                "monthly": rollup.penghematan_aktual,
+                "yearly": rollup.penghematan_aktual * 12
+            },
+            "api_metrics": self.metrik_api.ke_dict()
         }
         
         try:
-            with open(nama_file, 'w') as f:
+            buka = gzip.open if compress else open
+            with buka(nama_file, 'wt', encoding='utf-8') as f:
                 json.dump(data_laporan, f, indent=2, default=str)
-            console.print(f"[green]✓[/green] Laporan udah diekspor ke: [bold]{nama_file}[/bold]")
+            self.console.print(f"[green]✓[/green] Laporan udah diekspor ke: [bold]{nama_file}[/bold]")
         except Exception as e:
-            console.print(f"[red]✗[/red] Gagal ekspor laporan: {e}")
+            self.console.print(f"[red]✗[/red] Gagal ekspor laporan: {e}")
     
     def tampilkan_statistik_akhir(self) -> None:
         """Tampilkan statistik eksekusi akhir"""
+        from rich.table import Table
+        
         if self.statistik['deleted_resources'] > 0 or self.statistik['failed_deletions'] > 0:
-            console.print("\n" + "="*60)
-            console.print("[bold blue]📊 Ringkasan Eksekusi[/bold blue]")
+            self.console.print("\n" + "="*60)
+            self.console.print("[bold blue]📊 Ringkasan Eksekusi[/bold blue]")
             
             tabel_stats = Table(show_header=False, box=None)
             tabel_stats.add_column("Metrik", style="bold")
@@ -813,17 +3999,390 @@ class AWSResourceCleanerBetawi:
             if self.statistik['failed_deletions'] > 0:
                 tabel_stats.add_row("Gagal hapus:", f"[red]{self.statistik['failed_deletions']}[/red]")
             
+            if self.statistik['protected_resources'] > 0:
+                tabel_stats.add_row("Dilindungin tag:", f"[green]{self.statistik['protected_resources']}[/green]")
+            
             if self.statistik['deleted_resources'] > 0:
-                # Hitung actual savings berdasarkan yang berhasil dihapus
-                # Kita assume rata-rata cost per resource
-                avg_cost = self.statistik['total_savings'] / max(self.statistik['total_resources'], 1)
-                actual_savings = self.statistik['deleted_resources'] * avg_cost
+                # Penghematan aktual = total cost resource yang beneran sukses dihapus
+                actual_savings = self.statistik['actual_savings']
                 
                 tabel_stats.add_row("Penghematan bulanan:", f"[bold green]${actual_savings:.2f}[/bold green]")
                 tabel_stats.add_row("Penghematan tahunan:", f"[bold green]${actual_savings * 12:.2f}[/bold green]")
             
-            console.print(tabel_stats)
-            console.print("="*60)
+            self.console.print(tabel_stats)
+            self.console.print("="*60)
+    
+    def tampilkan_metrik_api(self, maks_baris: int = 15) -> None:
+        """Tampilkan operation API yang paling makan waktu plus waktu tiap scanner"""
+        from rich.table import Table
+        
+        operasi = self.metrik_api.ringkasan_operasi()
+        if not operasi:
+            return
+        
+        table = Table(title="📡 Metrik API AWS", show_header=True, header_style="bold magenta")
+        table.add_column("Operation", style="cyan", overflow="fold")
+        table.add_column("Calls", justify="right")
+        table.add_column("Error", justify="right")
+        table.add_column("Retry", justify="right")
+        table.add_column("Throttle", justify="right")
+        table.add_column("Avg ms", justify="right")
+        table.add_column("p95 ms", justify="right")
+        table.add_column("Max ms", justify="right")
+        for nama, entry in operasi[:maks_baris]:
+            table.add_row(
+                nama,
+                str(entry['calls']),
+                f"[red]{entry['errors']}[/red]" if entry['errors'] else "0",
+                str(entry['retries']),
+                f"[yellow]{entry['throttles']}[/yellow]" if entry['throttles'] else "0",
+                f"{entry['avg_s'] * 1000:.1f}",
+                f"≤{entry['p95_s'] * 1000:.0f}",
+                f"{entry['max_s'] * 1000:.1f}"
+            )
+        if len(operasi) > maks_baris:
+            table.add_row(f"[dim]... dan {len(operasi) - maks_baris} lainnya[/dim]", *[""] * 7)
+        self.console.print(table)
+        
+        scanner = self.metrik_api.ringkasan_scanner()
+        if scanner:
+            table = Table(title="⏱️ Waktu Scanner", show_header=True, header_style="bold magenta")
+            table.add_column("Resource Type", style="cyan")
+            table.add_column("Runs", justify="right")
+            table.add_column("Resources", justify="right")
+            table.add_column("Total (s)", justify="right")
+            table.add_column("Max (s)", justify="right")
+            for resource_type, entry in sorted(scanner.items(), key=lambda item: item[1]['total_s'], reverse=True):
+                table.add_row(
+                    resource_type,
+                    str(entry['runs']),
+                    str(entry['resources']),
+                    f"{entry['total_s']:.2f}",
+                    f"{entry['max_s']:.2f}"
+                )
+            self.console.print(table)
+    
+    def tulis_metrik_prometheus(self, nama_file: str) -> None:
+        """Tulis metrik ke textfile Prometheus secara atomic (buat textfile collector node exporter)"""
+        try:
+            sementara = f"{nama_file}.{os.getpid()}.tmp"
+            with open(sementara, 'w') as f:
+                f.write(self.metrik_api.format_prometheus(self.statistik))
+            os.replace(sementara, nama_file)
+            self.console.print(f"[green]✓[/green] Metrik Prometheus ditulis ke: [bold]{nama_file}[/bold]")
+        except OSError as e:
+            self.console.print(f"[red]✗[/red] Gagal nulis metrik Prometheus: {e}")
+
+
+class DaemonScan:
+    """
+    Mode serve: session & connection pool tetep anget, scan dijadwal per account/region
+    pake jitter, hasil terakhir disajiin lewat HTTP lokal
+    
+    Response JSON dibikin ulang tiap ada scan yang kelar, jadi request dashboard
+    tinggal nyalin bytes yang udah jadi. Cuma /status & /healthz yang kecil
+    dirender per request biar error putaran terakhir langsung keliatan.
+    """
+    
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_PORT = 8787
+    DEFAULT_INTERVAL = 3600     # detik antar scan per lokasi
+    DEFAULT_JITTER = 0.1        # +/- 10% dari interval biar kagak barengan nembak API
+    JEDA_AWAL_MAKS = 30         # detik, sebaran scan pertama pas daemon baru nyala
+    
+    def __init__(self, cleaner: AWSResourceCleanerBetawi, resource_types: Set[str],
+                 interval: float = DEFAULT_INTERVAL, jitter: float = DEFAULT_JITTER):
+        """
+        Args:
+            cleaner: Manager yang session & client-nya dipake terus
+            resource_types: Resource types yang di-scan tiap putaran
+            interval: Jarak antar scan satu account/region (detik)
+            jitter: Fraksi acak interval, 0.1 = +/- 10%
+        """
+        self.cleaner = cleaner
+        self.resource_types = resource_types
+        self.interval = max(1.0, interval)
+        self.jitter = min(max(0.0, jitter), 1.0)
+        
+        jeda_awal = min(self.JEDA_AWAL_MAKS, self.interval * self.jitter)
+        self._jadwal: Dict[Tuple[Optional[str], str], float] = {
+            (account_id, region): time.time() + random.uniform(0, jeda_awal)
+            for account_id in cleaner.accounts
+            for region in cleaner.regions
+        }
+        self._hasil: Dict[Tuple[Optional[str], str], Dict] = {}
+        self._respons: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._berhenti = threading.Event()
+        # Waktu putaran terakhir yang sukses & (waktu, pesan) error putaran terakhir yang gagal
+        self._sukses_terakhir: Optional[float] = None
+        self._error_terakhir: Optional[Tuple[float, str]] = None
+        self._bikin_respons()
+    
+    def _jadwal_berikut(self) -> float:
+        return time.time() + self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+    
+    def _scan(self, lokasi: List[Tuple[Optional[str], str]]) -> None:
+        """Scan lokasi yang udah jatuh tempo barengan, hasil lama diganti per lokasi"""
+        mulai = time.time()
+        hasil: Dict[Tuple[Optional[str], str], List[UnusedResource]] = {lok: [] for lok in lokasi}
+        error = None
+        try:
+            for resource in self.cleaner.iter_scan_resources(self.resource_types, lokasi=lokasi):
+                hasil[(resource.account_id, resource.region)].append(resource)
+        except Exception as e:  # daemon kagak boleh mati gara-gara satu putaran gagal
+            error = str(e)
+            self.cleaner.logger.error(f"Scan daemon gagal: {e}")
+        
+        selesai = time.time()
+        with self._lock:
+            for lok in lokasi:
+                lama = self._hasil.get(lok, {})
+                self._hasil[lok] = {
+                    # Kalo gagal, hasil terakhir yang sukses tetep disajiin
+                    'resources': hasil[lok] if error is None else lama.get('resources', []),
+                    'last_scan': selesai if error is None else lama.get('last_scan'),
+                    'duration_s': round(selesai - mulai, 3),
+                    'error': error
+                }
+                self._jadwal[lok] = self._jadwal_berikut()
+        self._bikin_respons()
+        with self._lock:
+            if error is None:
+                self._sukses_terakhir = selesai
+                self._error_terakhir = None
+            else:
+                self._error_terakhir = (selesai, error)
+    
+    def _bikin_respons(self) -> None:
+        """Render ulang response JSON yang gede dari hasil terakhir tiap lokasi"""
+        with self._lock:
+            hasil = dict(self._hasil)
+        
+        resources = [r for h in hasil.values() for r in h['resources']]
+        rollup = RollupBiaya(resources, self.cleaner.region)
+        with self.cleaner._statistik_lock:
+            self.cleaner.statistik['unused_resources'] = len(resources)
+            self.cleaner.statistik['total_savings'] = rollup.total_cost
+            # Dihitung ulang dari hasil terakhir, bukan ditambahin tiap putaran
+            self.cleaner.statistik['protected_resources'] = sum(1 for r in resources if r.protected_by)
+        
+        dibikin = datetime.now().isoformat()
+        respons = {
+            '/resources': {
+                'generated_at': dibikin,
+                'total': len(resources),
+                'resources': [r.ke_dict() for r in resources]
+            },
+            '/rollup': {
+                'generated_at': dibikin,
+                'resource_summary': rollup.ringkasan('resource_type'),
+                'region_summary': rollup.ringkasan('region'),
+                'account_summary': rollup.ringkasan('account_id'),
+                'tag_summary': {tag_key: rollup.ringkasan(f"tag:{tag_key}") for tag_key in self.cleaner.rollup_tags},
+                'total_potential_savings': {
+                    'monthly': rollup.total_cost,
+                    'yearly': rollup.total_cost * 12
+                },
+                'total_size_gb': rollup.total_size_gb
+            }
+        }
+        encoded = {path: json.dumps(isi, default=str).encode() for path, isi in respons.items()}
+        with self._lock:
+            self._respons = encoded
+    
+    def _status(self) -> Dict:
+        """Isi /status: kondisi daemon plus jadwal, durasi & error per lokasi"""
+        waktu = lambda detik: datetime.fromtimestamp(detik).isoformat() if detik else None  # noqa: E731
+        with self._lock:
+            hasil = dict(self._hasil)
+            jadwal = dict(self._jadwal)
+            sukses_terakhir = self._sukses_terakhir
+            error_terakhir = self._error_terakhir
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'resource_types': sorted(self.resource_types),
+            'interval_s': self.interval,
+            'last_success': waktu(sukses_terakhir),
+            'last_error': error_terakhir[1] if error_terakhir else None,
+            'last_error_at': waktu(error_terakhir[0]) if error_terakhir else None,
+            'locations': [
+                {
+                    'account': account_id or 'default',
+                    'region': region,
+                    'last_scan': waktu(hasil.get((account_id, region), {}).get('last_scan')),
+                    'next_scan': waktu(jadwal[(account_id, region)]),
+                    'duration_s': hasil.get((account_id, region), {}).get('duration_s'),
+                    'unused_resources': len(hasil.get((account_id, region), {}).get('resources', [])),
+                    'error': hasil.get((account_id, region), {}).get('error')
+                }
+                for account_id, region in jadwal
+            ]
+        }
+    
+    def _loop_jadwal(self) -> None:
+        """Thread scheduler: scan lokasi yang jatuh tempo, sisanya tidur sampe jadwal berikutnya"""
+        while not self._berhenti.is_set():
+            sekarang = time.time()
+            with self._lock:
+                jatuh_tempo = [lok for lok, waktu in self._jadwal.items() if waktu <= sekarang]
+                berikut = min(self._jadwal.values())
+            if not jatuh_tempo:
+                self._berhenti.wait(berikut - sekarang)
+                continue
+            try:
+                self._scan(jatuh_tempo)
+            except Exception as e:  # scheduler kagak boleh mati, putaran berikutnya dicoba lagi
+                self.cleaner.logger.error(f"Putaran daemon gagal: {e}", exc_info=True)
+                with self._lock:
+                    self._error_terakhir = (time.time(), f"{type(e).__name__}: {e}")
+                    for lok in jatuh_tempo:
+                        self._jadwal[lok] = self._jadwal_berikut()
+    
+    def respons(self, path: str) -> Optional[Tuple[int, bytes, str]]:
+        """(status HTTP, body, content type) buat path HTTP, None kalo path-nya kagak ada"""
+        path = path.split('?', 1)[0].rstrip('/') or '/status'
+        if path == '/healthz':
+            with self._lock:
+                error_terakhir = self._error_terakhir
+            if error_terakhir:
+                return 503, f"error: {error_terakhir[1]}\n".encode(), 'text/plain'
+            return 200, b'ok\n', 'text/plain'
+        if path == '/status':
+            return 200, json.dumps(self._status(), default=str).encode(), 'application/json'
+        if path == '/metrics':
+            body = self.cleaner.metrik_api.format_prometheus(self.cleaner.statistik).encode()
+            return 200, body, 'text/plain; version=0.0.4'
+        with self._lock:
+            body = self._respons.get(path)
+        return (200, body, 'application/json') if body is not None else None
+    
+    def jalanin(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Nyalain scheduler & HTTP server, nge-block sampe dihentiin (Ctrl+C)"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        daemon = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                hasil = daemon.respons(handler.path)
+                if hasil is None:
+                    handler.send_error(404, "Endpoint: /status /resources /rollup /metrics /healthz")
+                    return
+                status, body, content_type = hasil
+                handler.send_response(status)
+                handler.send_header('Content-Type', content_type)
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+            
+            def log_message(handler, format, *args):
+                daemon.cleaner.logger.debug(f"HTTP {handler.address_string()} {format % args}")
+        
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        scheduler = threading.Thread(target=self._loop_jadwal, name="scheduler", daemon=True)
+        scheduler.start()
+        self.cleaner.console.print(
+            f"[green]✓[/green] Daemon jalan di [bold]http://{host}:{server.server_address[1]}[/bold] - "
+            f"{len(self._jadwal)} lokasi, scan tiap {self.interval:.0f}s (±{self.jitter * 100:.0f}%)"
+        )
+        try:
+            server.serve_forever()
+        finally:
+            self._berhenti.set()
+            server.server_close()
+
+
+def baca_daftar_akun(accounts: Optional[str], accounts_file: Optional[str]) -> Optional[List[str]]:
+    """Gabungin daftar account dari --accounts dan --accounts-file"""
+    daftar = []
+    if accounts:
+        daftar.extend(a.strip() for a in accounts.split(',') if a.strip())
+    if accounts_file:
+        try:
+            with open(accounts_file) as f:
+                for baris in f:
+                    baris = baris.split('#', 1)[0].strip()
+                    if baris:
+                        daftar.append(baris)
+        except OSError as e:
+            console.print(f"[red]✗[/red] Gagal baca file account: {e}")
+            sys.exit(1)
+    return daftar or None
+
+
+def parse_rate_overrides(daftar: List[str]) -> Dict[str, float]:
+    """Parse --api-rate-override format SERVICE[.Operation]=RATE"""
+    overrides = {}
+    for item in daftar:
+        key, _, nilai = item.partition('=')
+        try:
+            overrides[key.strip()] = float(nilai)
+        except ValueError:
+            console.print(f"[yellow]Warning: Override rate '{item}' kagak valid, dilewatin deh[/yellow]")
+    return overrides
+
+
+def parse_delete_concurrency(nilai: Optional[str]) -> Dict[str, int]:
+    """Parse --delete-concurrency format TYPE=N,TYPE=N"""
+    hasil = {}
+    for item in (nilai or '').split(','):
+        if not item.strip():
+            continue
+        resource_type, _, jumlah = item.partition('=')
+        resource_type = resource_type.strip().lower()
+        if resource_type not in AWSResourceCleanerBetawi.SUPPORTED_RESOURCES or not jumlah.strip().isdigit():
+            console.print(f"[yellow]Warning: Delete concurrency '{item}' kagak valid, dilewatin deh[/yellow]")
+            continue
+        hasil[resource_type] = max(1, int(jumlah))
+    return hasil
+
+
+def parse_filter(daftar: List[str]) -> Optional[FilterResource]:
+    """Parse --filter, ekspresi yang kagak valid langsung exit biar kagak salah hapus"""
+    if not daftar:
+        return None
+    try:
+        return FilterResource(daftar)
+    except ValueError as e:
+        console.print(f"[red]✗[/red] Filter kagak valid: {e}")
+        sys.exit(1)
+
+
+def parse_proteksi(daftar: List[str]) -> Optional[AturanProteksi]:
+    """Parse --protect-tag, aturan yang kagak valid langsung exit biar kagak salah hapus"""
+    if not daftar:
+        return None
+    try:
+        return AturanProteksi(daftar)
+    except ValueError as e:
+        console.print(f"[red]✗[/red] Aturan --protect-tag kagak valid: {e}")
+        sys.exit(1)
+
+
+def siapin_indeks_harga(offer_files: List[str], path: Optional[str]) -> Optional[IndeksHarga]:
+    """Buka index harga offline, di-index dulu kalo ada file offer baru; None kalo index kosong"""
+    if not offer_files and not os.path.exists(path or os.path.join(_direktori_cache(), 'pricing.sqlite3')):
+        return None
+    indeks = IndeksHarga(path)
+    if offer_files:
+        jumlah = indeks.bangun(offer_files)
+        if jumlah:
+            console.print(f"[green]✓[/green] {jumlah} harga masuk ke index {indeks.path}")
+    return None if indeks.kosong else indeks
+
+
+def siapin_inventory_cache(args: argparse.Namespace) -> Optional[InventoryCache]:
+    """
+    Cache inventory kalo --cache dipake
+    
+    Cuma --dry-run yang boleh baca cache. Mode yang ngehapus sama --serve selalu
+    scan langsung ke AWS, hasilnya doang yang disimpen buat dry run berikutnya.
+    """
+    if not args.cache:
+        return None
+    return InventoryCache(path=args.cache_file, ttl=args.cache_ttl, refresh=args.refresh or not args.dry_run)
 
 
 def bikin_parser() -> argparse.ArgumentParser:
@@ -837,8 +4396,15 @@ Contoh penggunaan:
   %(prog)s --interactive                # Pilih-pilih resource yang mau dihapus
   %(prog)s --batch --yes                # Hapus semua unused resources otomatis
   %(prog)s --profile prod --region us-west-2  # Pake profile dan region tertentu
+  %(prog)s --dry-run --regions all      # Scan semua region yang enabled sekaligus
+  %(prog)s --dry-run --accounts-file accounts.txt  # Scan banyak account lewat AssumeRole
   %(prog)s --export-report              # Bikin laporan JSON yang detail
+  %(prog)s -e --report-format ndjson --compress  # Laporan NDJSON.gz ditulis streaming
   %(prog)s --resources eip,ebs          # Cuma scan resource types tertentu
+  %(prog)s -d -o ndjson | jq .resource_id  # Hasil scan buat pipeline, tanpa Rich
+  %(prog)s --dry-run --cache            # Dry run pake cache inventory lokal
+  %(prog)s --resume journal.ndjson      # Lanjutin batch delete yang kepotong
+  %(prog)s -b --protect-tag keep=true   # Resource bertag keep=true kagak disentuh
         """
     )
     
@@ -859,12 +4425,69 @@ Contoh penggunaan:
         action='store_true',
         help='Mode batch - hapus semua unused resources sekaligus'
     )
+    mode_group.add_argument(
+        '--serve',
+        action='store_true',
+        help='Mode daemon - scan terjadwal terus hasilnya disajiin lewat HTTP lokal (read-only)'
+    )
+    mode_group.add_argument(
+        '--resume',
+        metavar='JOURNAL',
+        help='Lanjutin batch delete yang kepotong dari journal-nya, tanpa scan ulang'
+    )
+    
+    # Opsi mode serve
+    parser.add_argument(
+        '--serve-host',
+        default=DaemonScan.DEFAULT_HOST,
+        help=f'Alamat HTTP buat mode serve (default: {DaemonScan.DEFAULT_HOST})'
+    )
+    parser.add_argument(
+        '--serve-port',
+        type=int,
+        default=DaemonScan.DEFAULT_PORT,
+        help=f'Port HTTP buat mode serve (default: {DaemonScan.DEFAULT_PORT})'
+    )
+    parser.add_argument(
+        '--serve-interval',
+        type=float,
+        default=DaemonScan.DEFAULT_INTERVAL,
+        help=f'Jarak antar scan tiap account/region dalam detik (default: {DaemonScan.DEFAULT_INTERVAL})'
+    )
+    parser.add_argument(
+        '--serve-jitter',
+        type=float,
+        default=DaemonScan.DEFAULT_JITTER,
+        help=f'Acakan jadwal scan, fraksi dari interval (default: {DaemonScan.DEFAULT_JITTER})'
+    )
     
     # Resource selection
     parser.add_argument(
         '--resources', '-t',
         help='Resource types yang mau dicek (pisahin pake koma): eip,elb,ebs,snapshot,rds,nat,eni'
     )
+    parser.add_argument(
+        '--filter', '-f',
+        action='append',
+        default=[],
+        metavar='EXPR',
+        help='Saring resource, contoh: "tag:env=dev,staging and age>90 and type=gp2" '
+             '(field: tag:KEY, id, type, size, age, vpc, az, engine, region, account; bisa diulang)'
+    )
+    parser.add_argument(
+        '--protect-tag',
+        action='append',
+        default=[],
+        metavar='KEY[=VALUE]',
+        help='Resource dengan tag ini kagak bakal dihapus, contoh: keep=true, team=payments,platform-* '
+             'atau do-not-delete (asal ada tag-nya); bisa diulang'
+    )
+    parser.add_argument(
+        '--snapshot-age-days',
+        type=int,
+        default=AWSResourceCleanerBetawi.DEFAULT_SNAPSHOT_AGE_DAYS,
+        help=f'Snapshot yang lebih tua dari ini (hari) dianggap lama (default: {AWSResourceCleanerBetawi.DEFAULT_SNAPSHOT_AGE_DAYS})'
+    )
     
     # Konfigurasi AWS
     parser.add_argument(
@@ -875,12 +4498,154 @@ Contoh penggunaan:
         '--region', '-r',
         help='Region AWS (default: us-east-1 atau AWS_DEFAULT_REGION)'
     )
+    parser.add_argument(
+        '--regions',
+        help="Scan banyak region sekaligus: 'all' buat semua region yang enabled, "
+             "atau daftar region pisahin pake koma (contoh: us-east-1,eu-west-1)"
+    )
+    
+    # Multi-account lewat AssumeRole
+    parser.add_argument(
+        '--accounts',
+        help='Daftar account ID atau role ARN (pisahin pake koma) yang mau di-scan lewat AssumeRole'
+    )
+    parser.add_argument(
+        '--accounts-file',
+        help='File berisi account ID atau role ARN, satu per baris (baris diawali # diabaikan)'
+    )
+    parser.add_argument(
+        '--role-name',
+        default=AWSResourceCleanerBetawi.DEFAULT_ROLE_NAME,
+        help=f'Nama role yang di-assume kalo cuma dikasih account ID (default: {AWSResourceCleanerBetawi.DEFAULT_ROLE_NAME})'
+    )
+    parser.add_argument(
+        '--external-id',
+        help='ExternalId buat AssumeRole (kalo role-nya minta)'
+    )
+    
+    # Cache inventory
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Pake cache inventory lokal; cuma --dry-run yang baca cache, mode lain scan langsung ke AWS'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Abaikan cache lama, scan ulang terus simpen hasil barunya'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=InventoryCache.DEFAULT_TTL,
+        help=f'Umur maksimal cache inventory dalam detik (default: {InventoryCache.DEFAULT_TTL})'
+    )
+    parser.add_argument(
+        '--cache-file',
+        help='Lokasi file cache SQLite (default: ~/.cache/aws_resource_cleaner/inventory.sqlite3)'
+    )
+    
+    # Harga offline
+    parser.add_argument(
+        '--pricing-file',
+        action='append',
+        default=[],
+        metavar='FILE',
+        help='File AWS Price List (offer JSON AmazonEC2/AmazonRDS/AWSELB) buat di-index, '
+             'cuma di-parse ulang kalo file-nya berubah (bisa diulang)'
+    )
+    parser.add_argument(
+        '--pricing-index',
+        help='Lokasi index harga SQLite (default: ~/.cache/aws_resource_cleaner/pricing.sqlite3)'
+    )
+    
+    # Opsi memory
+    parser.add_argument(
+        '--keep-raw',
+        action='store_true',
+        help='Simpen response boto mentah tiap resource di laporan (lebih boros memory)'
+    )
+    
+    # Opsi performa
+    parser.add_argument(
+        '--delete-concurrency',
+        metavar='TYPE=N,...',
+        help='Jumlah penghapusan barengan per resource type, contoh: snapshot=16,ebs=8 '
+             f'(default: {",".join(f"{k}={v}" for k, v in AWSResourceCleanerBetawi.DEFAULT_DELETE_CONCURRENCY.items())})'
+    )
+    parser.add_argument(
+        '--max-pool-connections',
+        type=int,
+        metavar='N',
+        help='Koneksi HTTP per client AWS (default: ngikutin scan/health check/delete concurrency, minimal 10)'
+    )
+    parser.add_argument(
+        '--retry-mode',
+        choices=PoolClientAWS.RETRY_MODES,
+        default=PoolClientAWS.DEFAULT_RETRY_MODE,
+        help=f'Mode retry botocore (default: {PoolClientAWS.DEFAULT_RETRY_MODE})'
+    )
+    parser.add_argument(
+        '--max-attempts',
+        type=int,
+        default=PoolClientAWS.DEFAULT_MAX_ATTEMPTS,
+        help=f'Total percobaan per request AWS termasuk retry (default: {PoolClientAWS.DEFAULT_MAX_ATTEMPTS})'
+    )
+    parser.add_argument(
+        '--api-rate',
+        type=float,
+        default=AdaptiveRateLimiter.DEFAULT_RATE,
+        help=f'Rate awal panggilan API per operation, request/detik (default: {AdaptiveRateLimiter.DEFAULT_RATE})'
+    )
+    parser.add_argument(
+        '--api-rate-max',
+        type=float,
+        default=AdaptiveRateLimiter.DEFAULT_MAX_RATE,
+        help=f'Rate maksimal yang boleh dicapai pas ramp-up (default: {AdaptiveRateLimiter.DEFAULT_MAX_RATE})'
+    )
+    parser.add_argument(
+        '--api-rate-override',
+        action='append',
+        default=[],
+        metavar='SERVICE[.Operation]=RATE',
+        help='Rate awal khusus, contoh: ec2.DescribeSnapshots=5 (bisa diulang)'
+    )
+    parser.add_argument(
+        '--scan-workers',
+        type=int,
+        default=AWSResourceCleanerBetawi.DEFAULT_SCAN_WORKERS,
+        help=f'Jumlah scanner yang jalan barengan (default: {AWSResourceCleanerBetawi.DEFAULT_SCAN_WORKERS})'
+    )
+    parser.add_argument(
+        '--page-size',
+        type=int,
+        default=AWSResourceCleanerBetawi.DEFAULT_PAGE_SIZE,
+        help=f'Jumlah item per page buat API describe_* (default: {AWSResourceCleanerBetawi.DEFAULT_PAGE_SIZE}, '
+             'otomatis disesuaiin sama limit tiap API)'
+    )
+    parser.add_argument(
+        '--idle-days',
+        type=int,
+        default=AWSResourceCleanerBetawi.DEFAULT_IDLE_DAYS,
+        help=f'RDS/LB/NAT tanpa koneksi/traffic di CloudWatch selama ini (hari) dianggap idle (default: {AWSResourceCleanerBetawi.DEFAULT_IDLE_DAYS})'
+    )
+    parser.add_argument(
+        '--health-check-workers',
+        type=int,
+        default=AWSResourceCleanerBetawi.DEFAULT_HEALTH_CHECK_WORKERS,
+        help=f'Jumlah cek health Load Balancer yang jalan barengan (default: {AWSResourceCleanerBetawi.DEFAULT_HEALTH_CHECK_WORKERS})'
+    )
     
     # Opsi tambahan
     parser.add_argument(
         '--yes', '-y',
         action='store_true',
-        help='Skip konfirmasi (pake bareng --batch)'
+        help='Skip konfirmasi (pake bareng --batch atau --resume)'
+    )
+    parser.add_argument(
+        '--journal',
+        metavar='FILE',
+        help='Path journal penghapusan mode batch (default: folder cache, nama pake timestamp)'
     )
     parser.add_argument(
         '--export-report', '-e',
@@ -891,6 +4656,45 @@ Contoh penggunaan:
         '--report-file',
         help='Nama file custom buat laporan yang diekspor'
     )
+    parser.add_argument(
+        '--output', '-o',
+        choices=AWSResourceCleanerBetawi.FORMAT_OUTPUT,
+        default='table',
+        help='Format hasil: table (default), summary (angka per type doang), '
+             'json/ndjson (ke stdout tanpa warna, resource ditulis pas ketemu, tampilan lain ke stderr; '
+             'tanpa mode otomatis --dry-run & semua resource types)'
+    )
+    parser.add_argument(
+        '--max-rows',
+        type=int,
+        default=AWSResourceCleanerBetawi.DEFAULT_MAX_ROWS,
+        metavar='N',
+        help=f'Baris maksimal per resource type di tabel dry run, yang paling mahal duluan '
+             f'(default: {AWSResourceCleanerBetawi.DEFAULT_MAX_ROWS}, 0 = semua)'
+    )
+    parser.add_argument(
+        '--report-format',
+        choices=['json', 'ndjson'],
+        default='json',
+        help='Format laporan: json (satu dokumen, default) atau ndjson (ditulis streaming pas scan)'
+    )
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Kompres file laporan pake gzip (.gz)'
+    )
+    parser.add_argument(
+        '--metrics-file',
+        metavar='FILE',
+        help='Tulis metrik API & hasil run ke textfile Prometheus (contoh: /var/lib/node_exporter/aws_cleaner.prom)'
+    )
+    parser.add_argument(
+        '--rollup-tag',
+        action='append',
+        default=[],
+        metavar='KEY',
+        help='Tampilin & laporin rollup biaya per nilai tag KEY (bisa diulang)'
+    )
     parser.add_argument(
         '--version', '-v',
         action='version',
@@ -900,8 +4704,28 @@ Contoh penggunaan:
     return parser
 
 
+def tampilkan_bantuan_kredensial() -> None:
+    """Pesan error kalo kredensial AWS kagak ada/kurang lengkap"""
+    console.print("[red]✗[/red] Kredensial AWS kagak ada atau kurang lengkap nih!")
+    console.print("Tolong setting kredensial AWS pake:")
+    console.print("  • aws configure")
+    console.print("  • Environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)")
+    console.print("  • IAM roles (buat instance EC2)")
+
+
 def main():
     """Main function aplikasi"""
+    # Parse argument duluan, --help/--version kagak perlu nunggu rich/boto3 ke-load
+    parser = bikin_parser()
+    args = parser.parse_args()
+    
+    # Output mesin punya stdout sendiri, semua tampilan Rich pindah ke stderr
+    output_mesin = args.output in AWSResourceCleanerBetawi.FORMAT_MESIN
+    if output_mesin:
+        _konsol(stderr=True)
+    
+    from rich.panel import Panel
+    
     # Tampilkan banner
     console.print(Panel.fit(
         "[bold blue]🚀 AWS Resource Cleaner Comprehensive Edisi Betawi[/bold blue]\n"
@@ -909,17 +4733,58 @@ def main():
         border_style="blue"
     ))
     
-    # Parse argument
-    parser = bikin_parser()
-    args = parser.parse_args()
-    
-    # Default ke mode interaktif kalo kagak ada mode yang dipilih
-    if not any([args.dry_run, args.interactive, args.batch]):
-        args.interactive = True
+    # Default ke mode interaktif kalo kagak ada mode yang dipilih, kecuali output-nya
+    # buat mesin: pipeline kagak bisa ditanya-tanya, jadi cukup dry run
+    if not any([args.dry_run, args.interactive, args.batch, args.serve, args.resume]):
+        if output_mesin:
+            args.dry_run = True
+        else:
+            args.interactive = True
     
+    manager = None
     try:
         # Inisialisasi manager
-        manager = AWSResourceCleanerBetawi(profile=args.profile, region=args.region)
+        manager = AWSResourceCleanerBetawi(
+            profile=args.profile,
+            region=args.region,
+            scan_workers=args.scan_workers,
+            page_size=args.page_size,
+            snapshot_age_days=args.snapshot_age_days,
+            health_check_workers=args.health_check_workers,
+            idle_days=args.idle_days,
+            regions=args.regions.split(',') if args.regions else None,
+            accounts=baca_daftar_akun(args.accounts, args.accounts_file),
+            role_name=args.role_name,
+            external_id=args.external_id,
+            rate_limiter=AdaptiveRateLimiter(
+                rate=args.api_rate,
+                max_rate=args.api_rate_max,
+                overrides=parse_rate_overrides(args.api_rate_override)
+            ),
+            delete_concurrency=parse_delete_concurrency(args.delete_concurrency),
+            inventory_cache=siapin_inventory_cache(args),
+            keep_raw=args.keep_raw,
+            rollup_tags=args.rollup_tag,
+            pricing=siapin_indeks_harga(args.pricing_file, args.pricing_index),
+            filter_resource=parse_filter(args.filter),
+            pool_client=PoolClientAWS(
+                max_pool_connections=args.max_pool_connections,
+                retry_mode=args.retry_mode,
+                max_attempts=args.max_attempts
+            ),
+            output=args.output,
+            max_rows=args.max_rows,
+            proteksi=parse_proteksi(args.protect_tag)
+        )
+        
+        # Resume kagak perlu scan, daftar resource-nya udah ada di journal
+        if args.resume:
+            manager.lanjutin_journal(args.resume, konfirmasi=not args.yes)
+            manager.tampilkan_statistik_akhir()
+            manager.tampilkan_metrik_api()
+            if args.metrics_file:
+                manager.tulis_metrik_prometheus(args.metrics_file)
+            return
         
         # Pilih resource types
         if args.resources:
@@ -935,12 +4800,24 @@ def main():
             if not selected_resources:
                 console.print("[red]Kagak ada resource type yang valid![/red]")
                 sys.exit(1)
+        elif args.serve or (output_mesin and not args.interactive):
+            # Daemon & pipeline kagak bisa ditanya-tanya, default semua resource types
+            selected_resources = set(manager.SUPPORTED_RESOURCES)
         else:
             # Interactive selection
             selected_resources = manager.pilih_resources()
         
         console.print(f"\n[green]✓[/green] Akan scan resource types: {', '.join(selected_resources)}")
         
+        if args.serve:
+            manager.mode_serve(selected_resources, host=args.serve_host, port=args.serve_port,
+                               interval=args.serve_interval, jitter=args.serve_jitter)
+            return
+        
+        # Laporan NDJSON dibuka sebelum scan biar resource langsung ditulis pas ketemu
+        if args.export_report and args.report_format == 'ndjson':
+            manager.mulai_laporan_streaming(args.report_file, compress=args.compress)
+        
         # Scan resources
         unused_resources = manager.scan_resources(selected_resources)
         
@@ -953,20 +4830,36 @@ def main():
         elif args.interactive:
             manager.mode_interaktif(unused_resources)
         elif args.batch:
-            manager.mode_batch(unused_resources, konfirmasi=not args.yes)
+            manager.mode_batch(unused_resources, konfirmasi=not args.yes,
+                               journal=args.journal or JournalHapus.nama_default())
         
         # Ekspor laporan kalo diminta
-        if args.export_report:
-            manager.ekspor_laporan(unused_resources, args.report_file)
+        if args.export_report and args.report_format != 'ndjson':
+            manager.ekspor_laporan(unused_resources, args.report_file, compress=args.compress)
+        # Trailer laporan NDJSON & --output json/ndjson ditulis abis mode kelar biar statistik hapusnya ikut
+        manager.tutup_laporan_streaming()
         
         # Tampilkan statistik akhir
         manager.tampilkan_statistik_akhir()
+        manager.tampilkan_metrik_api()
+        if args.metrics_file:
+            manager.tulis_metrik_prometheus(args.metrics_file)
         
+    except (NoCredentialsError, PartialCredentialsError):
+        # Kredensial baru kevalidasi di API call pertama, jadi error-nya bisa muncul di mana aja
+        tampilkan_bantuan_kredensial()
+        if manager is not None:
+            manager.tutup_laporan_streaming(lengkap=False)
+        sys.exit(1)
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠ Operasi dibatalin oleh user[/yellow]")
+        if manager is not None:
+            manager.tutup_laporan_streaming(lengkap=False)
         sys.exit(0)
     except Exception as e:
         console.print(f"[red]✗ Error unexpected: {e}[/red]")
+        if manager is not None:
+            manager.tutup_laporan_streaming(lengkap=False)
         sys.exit(1)
 
 
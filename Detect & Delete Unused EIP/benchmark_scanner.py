@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Benchmark Scanner & Deleter Pake Account Sintetis
+=================================================
+
+Ngukur gimana scan_resources, mode_batch dan ekspor laporan nge-scale dari
+ribuan sampe jutaan resource, tanpa nyentuh AWS beneran.
+
+Semua API call dicegat di event 'before-call' botocore (kayak Stubber, tapi
+datanya digenerate on-the-fly per page), jadi serialisasi request, paginator,
+rate limiter dan parsing response tetep jalan kayak aslinya.
+
+Tiap fase x skala dijalanin di proses terpisah biar peak RSS-nya akurat. Yang
+dilaporin: wall time, throughput, jumlah API call per operation dan peak RSS.
+Hasilnya bisa disimpen jadi baseline, run berikutnya dibandingin ke situ.
+
+Contoh:
+  python3 benchmark_scanner.py --skala 1000,10000 --simpan-baseline
+  python3 benchmark_scanner.py --skala 1000,10000            # cek regresi
+  python3 benchmark_scanner.py --skala 1000000 --fase scan-ebs,export-ndjson
+"""
+
+import argparse
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DEFAULT = os.path.join(FOLDER, 'benchmark_baseline.json')
+
+FASE = (
+    'scan-eip', 'scan-ebs', 'scan-snapshot', 'scan-eni', 'scan-nat', 'scan-elb', 'scan-rds',
+    'export-json', 'export-ndjson', 'batch'
+)
+SEMUA_TYPE = {'eip', 'ebs', 'snapshot', 'eni', 'nat', 'elb', 'rds'}
+TOLERANSI_DEFAULT = 0.2
+
+WAKTU_LAMA = datetime(2020, 1, 1, tzinfo=timezone.utc)
+ACCOUNT_ID = '123456789012'
+
+
+class AkunSintetis:
+    """
+    Stand-in AWS buat satu account sintetis dengan `jumlah` resource per type
+
+    Item dibikin dari index-nya pas page-nya diminta, jadi account sejuta
+    resource kagak perlu disimpen di memory. Separuh resource dibikin kepake
+    (EIP attached, NAT ada route, LB ada target healthy) biar logic filter
+    scanner ikut kehitung. Di CloudWatch cuma resource kelipatan 4 yang ada
+    traffic/koneksinya.
+    """
+
+    def __init__(self, jumlah: int):
+        self.jumlah = jumlah
+        self.api_calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reset_hitungan(self) -> None:
+        with self._lock:
+            self.api_calls = {}
+
+    # Generator item per index
+
+    def _eip(self, i: int) -> Dict:
+        eip = {'AllocationId': f'eipalloc-{i:08x}', 'PublicIp': f'10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}',
+               'Domain': 'vpc'}
+        if i % 2:
+            eip['InstanceId'] = f'i-{i:08x}'
+        return eip
+
+    def _volume(self, i: int) -> Dict:
+        return {'VolumeId': f'vol-{i:08x}', 'Size': 8 + i % 500, 'VolumeType': 'gp3', 'State': 'available',
+                'CreateTime': WAKTU_LAMA, 'AvailabilityZone': 'us-east-1a',
+                'Tags': [{'Key': 'team', 'Value': f'team-{i % 10}'}]}
+
+    def _snapshot(self, i: int) -> Dict:
+        return {'SnapshotId': f'snap-{i:08x}', 'VolumeId': f'vol-{i:08x}', 'VolumeSize': 8 + i % 500,
+                'StartTime': WAKTU_LAMA, 'State': 'completed', 'OwnerId': ACCOUNT_ID}
+
+    def _image(self, i: int) -> Dict:
+        # Satu AMI tiap 10 snapshot, jadi 10% snapshot dianggap masih kepake
+        return {'ImageId': f'ami-{i:08x}',
+                'BlockDeviceMappings': [{'DeviceName': '/dev/xvda', 'Ebs': {'SnapshotId': f'snap-{i * 10:08x}'}}]}
+
+    def _eni(self, i: int) -> Dict:
+        return {'NetworkInterfaceId': f'eni-{i:08x}', 'Status': 'available', 'VpcId': 'vpc-1',
+                'SubnetId': 'subnet-1', 'TagSet': []}
+
+    def _nat(self, i: int) -> Dict:
+        return {'NatGatewayId': f'nat-{i:08x}', 'State': 'available', 'VpcId': 'vpc-1', 'CreateTime': WAKTU_LAMA,
+                'NatGatewayAddresses': [{'AllocationId': f'eipalloc-n{i:07x}'}]}
+
+    def _route_table(self, i: int) -> Dict:
+        # Route table ke-i nge-route ke NAT genap, jadi NAT ganjil kagak kepake
+        return {'RouteTableId': f'rtb-{i:08x}', 'VpcId': 'vpc-1',
+                'Routes': [{'DestinationCidrBlock': '0.0.0.0/0', 'NatGatewayId': f'nat-{i * 2:08x}'}],
+                'Associations': [{'SubnetId': f'subnet-{i:08x}', 'Main': False}]}
+
+    def _lb_arn(self, i: int) -> str:
+        return f'arn:aws:elasticloadbalancing:us-east-1:{ACCOUNT_ID}:loadbalancer/app/lb-{i:08x}/{i:016x}'
+
+    def _lb_v2(self, i: int) -> Dict:
+        return {'LoadBalancerArn': self._lb_arn(i), 'LoadBalancerName': f'lb-{i:08x}', 'Type': 'application',
+                'State': {'Code': 'active'}, 'CreatedTime': WAKTU_LAMA, 'VpcId': 'vpc-1'}
+
+    def _target_group(self, i: int) -> Dict:
+        return {'TargetGroupArn': f'arn:aws:elasticloadbalancing:us-east-1:{ACCOUNT_ID}:targetgroup/tg-{i:08x}/{i:016x}',
+                'LoadBalancerArns': [self._lb_arn(i)]}
+
+    def _lb_classic(self, i: int) -> Dict:
+        return {'LoadBalancerName': f'classic-{i:08x}', 'CreatedTime': WAKTU_LAMA,
+                'Instances': [{'InstanceId': f'i-{i:08x}'}] if i % 2 else []}
+
+    def _db(self, i: int) -> Dict:
+        return {'DBInstanceIdentifier': f'db-{i:08x}', 'DBInstanceStatus': 'stopped' if i % 8 == 7 else 'available',
+                'Engine': 'postgres', 'DBInstanceClass': 'db.t3.medium', 'AllocatedStorage': 20,
+                'DBInstanceArn': f'arn:aws:rds:us-east-1:{ACCOUNT_ID}:db:db-{i:08x}', 'InstanceCreateTime': WAKTU_LAMA}
+
+    def _metric_data(self, queries: List[Dict]) -> List[Dict]:
+        hasil = []
+        for query in queries:
+            dimensi = query['MetricStat']['Metric']['Dimensions'][0]['Value']
+            i = int(re.search(r'-([0-9a-f]{8})', dimensi).group(1), 16)
+            hasil.append({'Id': query['Id'], 'StatusCode': 'Complete', 'Label': dimensi,
+                          'Timestamps': [WAKTU_LAMA] if i % 4 == 0 else [],
+                          'Values': [42.0] if i % 4 == 0 else []})
+        return hasil
+
+    def simpan_params(self, params: Dict, context: Dict, **kwargs) -> None:
+        """Handler 'before-parameter-build': simpen parameter API buat operation yang body-nya CBOR"""
+        context['benchmark_params'] = params
+
+    def _koleksi(self, service: str, operation: str):
+        """(result key, generator item, jumlah item, nama param token & page size, nama token di response)"""
+        n = self.jumlah
+        # Load balancer dibagi dua: separuh ALB, separuh Classic
+        n_lb = max(1, n // 2)
+        return {
+            ('ec2', 'DescribeVolumes'): ('Volumes', self._volume, n, 'NextToken', 'MaxResults', 'NextToken'),
+            ('ec2', 'DescribeSnapshots'): ('Snapshots', self._snapshot, n, 'NextToken', 'MaxResults', 'NextToken'),
+            ('ec2', 'DescribeImages'): ('Images', self._image, max(1, n // 10), 'NextToken', 'MaxResults', 'NextToken'),
+            ('ec2', 'DescribeNetworkInterfaces'): ('NetworkInterfaces', self._eni, n, 'NextToken', 'MaxResults', 'NextToken'),
+            ('ec2', 'DescribeNatGateways'): ('NatGateways', self._nat, n, 'NextToken', 'MaxResults', 'NextToken'),
+            ('ec2', 'DescribeRouteTables'): ('RouteTables', self._route_table, max(1, n // 2), 'NextToken', 'MaxResults', 'NextToken'),
+            ('elbv2', 'DescribeLoadBalancers'): ('LoadBalancers', self._lb_v2, n_lb, 'Marker', 'PageSize', 'NextMarker'),
+            ('elbv2', 'DescribeTargetGroups'): ('TargetGroups', self._target_group, n_lb, 'Marker', 'PageSize', 'NextMarker'),
+            ('elb', 'DescribeLoadBalancers'): ('LoadBalancerDescriptions', self._lb_classic, n_lb, 'Marker', 'PageSize', 'NextMarker'),
+            ('rds', 'DescribeDBInstances'): ('DBInstances', self._db, n, 'Marker', 'MaxRecords', 'Marker'),
+        }.get((service, operation))
+
+    def _page(self, params: Dict, koleksi) -> Dict:
+        result_key, bikin_item, jumlah, param_token, param_size, token_response = koleksi
+        mulai = int(params.get(param_token) or 0)
+        ukuran = int(params.get(param_size) or jumlah or 1)
+        akhir = min(mulai + ukuran, jumlah)
+        response = {result_key: [bikin_item(i) for i in range(mulai, akhir)]}
+        if akhir < jumlah:
+            response[token_response] = str(akhir)
+        return response
+
+    def handler(self, model, params, context, **kwargs):
+        """Handler 'before-call': balikin response sintetis, request kagak pernah dikirim"""
+        from botocore.awsrequest import AWSResponse
+
+        operation = model.name
+        service = model.service_model.service_name
+        key = f'{service}.{operation}'
+        with self._lock:
+            self.api_calls[key] = self.api_calls.get(key, 0) + 1
+
+        body = params.get('body')
+        params = body if isinstance(body, dict) else {}
+        response: Dict = {'ResponseMetadata': {'HTTPStatusCode': 200}}
+        koleksi = self._koleksi(service, operation)
+
+        if operation == 'DescribeNatGateways' and any(k.startswith('NatGatewayId') for k in params):
+            # Polling abis delete: langsung anggap udah 'deleted'
+            response['NatGateways'] = [{'NatGatewayId': v, 'State': 'deleted'}
+                                       for k, v in params.items() if k.startswith('NatGatewayId')]
+        elif koleksi:
+            response.update(self._page(params, koleksi))
+        elif operation == 'DescribeAddresses':
+            # describe_addresses kagak punya paginasi, semua balik sekaligus
+            response['Addresses'] = [self._eip(i) for i in range(self.jumlah)]
+        elif operation == 'DescribeTargetHealth':
+            i = int(params['TargetGroupArn'].rsplit('/', 1)[1], 16)
+            state = 'healthy' if i % 2 else 'unhealthy'
+            response['TargetHealthDescriptions'] = [{'Target': {'Id': f'i-{i:08x}'}, 'TargetHealth': {'State': state}}]
+        elif operation == 'DescribeInstanceHealth':
+            response['InstanceStates'] = [{'InstanceId': 'i-1', 'State': 'OutOfService'}]
+        elif operation == 'GetMetricData':
+            queries = context['benchmark_params']['MetricDataQueries']
+            response['MetricDataResults'] = self._metric_data(queries)
+        elif operation == 'GetCallerIdentity':
+            response.update({'Account': ACCOUNT_ID, 'Arn': f'arn:aws:iam::{ACCOUNT_ID}:user/benchmark',
+                             'UserId': 'benchmark'})
+        return AWSResponse('https://benchmark.invalid', 200, {}, None), response
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS proses ini (Linux: KB, macOS: byte)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def jalanin_fase(fase: str, skala: int) -> Dict:
+    """Jalanin satu fase di proses ini, balikin metriknya"""
+    sys.path.insert(0, FOLDER)
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+    os.environ['AWS_EC2_METADATA_DISABLED'] = 'true'
+
+    import aws_resource_cleaner as arc
+    from rich.console import Console
+
+    # Output tool-nya didiemin, yang diukur kerjaannya bukan rendering terminal
+    arc._console_asli = Console(quiet=True)
+
+    akun = AkunSintetis(skala)
+    manager = arc.AWSResourceCleanerBetawi(
+        region='us-east-1',
+        rate_limiter=arc.AdaptiveRateLimiter(rate=1e9, max_rate=1e9)
+    )
+    # register_last biar rate limiter (before-call juga) tetep kehitung overhead-nya
+    manager.session.events.register_last('before-call', akun.handler)
+    manager.session.events.register('before-parameter-build', akun.simpan_params)
+
+    with tempfile.TemporaryDirectory() as folder:
+        if fase.startswith('scan-'):
+            mulai = time.perf_counter()
+            resources = manager.scan_resources({fase[5:]})
+            durasi = time.perf_counter() - mulai
+
+        elif fase == 'export-json':
+            resources = manager.scan_resources(SEMUA_TYPE)
+            akun.reset_hitungan()
+            mulai = time.perf_counter()
+            manager.ekspor_laporan(resources, os.path.join(folder, 'laporan.json'))
+            durasi = time.perf_counter() - mulai
+
+        elif fase == 'export-ndjson':
+            # Laporan streaming ditulis barengan scan, jadi yang diukur scan + tulis
+            mulai = time.perf_counter()
+            manager.mulai_laporan_streaming(os.path.join(folder, 'laporan.ndjson'))
+            resources = manager.scan_resources(SEMUA_TYPE)
+            manager.tutup_laporan_streaming()
+            durasi = time.perf_counter() - mulai
+
+        elif fase == 'batch':
+            resources = manager.scan_resources(SEMUA_TYPE)
+            akun.reset_hitungan()
+            mulai = time.perf_counter()
+            manager.mode_batch(resources, konfirmasi=False)
+            durasi = time.perf_counter() - mulai
+
+        else:
+            raise ValueError(f"Fase kagak dikenal: {fase}")
+
+    return {
+        'fase': fase,
+        'skala': skala,
+        'resources': len(resources),
+        'wall_s': round(durasi, 4),
+        'throughput_per_s': round(len(resources) / durasi, 1) if durasi > 0 else None,
+        'api_calls': dict(sorted(akun.api_calls.items())),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def jalanin_di_proses_baru(fase: str, skala: int) -> Dict:
+    """Jalanin fase di subprocess biar peak RSS-nya kagak kecampur fase lain"""
+    hasil = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', fase, str(skala)],
+        capture_output=True, text=True
+    )
+    if hasil.returncode != 0:
+        raise RuntimeError(f"Fase {fase}@{skala} gagal:\n{hasil.stderr}")
+    return json.loads(hasil.stdout.strip().splitlines()[-1])
+
+
+def cek_regresi(hasil: Dict, baseline: Dict, toleransi: float) -> List[str]:
+    """Bandingin satu hasil ke baseline-nya, balikin daftar regresi yang ketemu"""
+    regresi = []
+    for metrik in ('wall_s', 'peak_rss_mb'):
+        lama, baru = baseline.get(metrik), hasil.get(metrik)
+        if lama and baru and baru > lama * (1 + toleransi):
+            regresi.append(f"{metrik} {lama} -> {baru} (+{(baru / lama - 1) * 100:.0f}%)")
+    for operation, jumlah in hasil['api_calls'].items():
+        lama = baseline.get('api_calls', {}).get(operation, 0)
+        if jumlah > lama:
+            regresi.append(f"API {operation} {lama} -> {jumlah} call")
+    return regresi
+
+
+def main():
+    """Main function benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark scanner & deleter pake account sintetis")
+    parser.add_argument('--skala', default='1000,10000',
+                        help='Jumlah resource per type, pisahin pake koma (default: 1000,10000)')
+    parser.add_argument('--fase', default=','.join(FASE),
+                        help=f"Fase yang dijalanin (default: semua: {','.join(FASE)})")
+    parser.add_argument('--baseline', default=BASELINE_DEFAULT,
+                        help='File baseline JSON (default: benchmark_baseline.json di sebelah script ini)')
+    parser.add_argument('--simpan-baseline', action='store_true',
+                        help='Simpen hasil run ini jadi baseline baru')
+    parser.add_argument('--toleransi', type=float, default=TOLERANSI_DEFAULT,
+                        help=f'Batas naik wall time/RSS sebelum dianggap regresi (default: {TOLERANSI_DEFAULT})')
+    parser.add_argument('--output', help='Simpen hasil lengkap run ini ke file JSON')
+    parser.add_argument('--worker', nargs=2, metavar=('FASE', 'SKALA'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(jalanin_fase(args.worker[0], int(args.worker[1]))))
+        return
+
+    daftar_skala = [int(s) for s in args.skala.split(',') if s.strip()]
+    daftar_fase = [f.strip() for f in args.fase.split(',') if f.strip() in FASE]
+
+    baseline: Dict[str, Dict] = {}
+    if os.path.exists(args.baseline) and not args.simpan_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    semua_hasil: Dict[str, Dict] = {}
+    semua_regresi: List[str] = []
+    print(f"{'Fase':<15} {'Skala':>8} {'Resources':>10} {'Wall (s)':>9} {'Res/s':>10} "
+          f"{'API calls':>10} {'RSS (MB)':>9}  Status")
+    for skala in daftar_skala:
+        for fase in daftar_fase:
+            hasil = jalanin_di_proses_baru(fase, skala)
+            key = f"{fase}@{skala}"
+            semua_hasil[key] = hasil
+
+            status = 'baru'
+            if key in baseline:
+                regresi = cek_regresi(hasil, baseline[key], args.toleransi)
+                status = 'OK' if not regresi else 'REGRESI'
+                semua_regresi.extend(f"{key}: {r}" for r in regresi)
+
+            print(f"{fase:<15} {skala:>8} {hasil['resources']:>10} {hasil['wall_s']:>9.3f} "
+                  f"{hasil['throughput_per_s'] or 0:>10.0f} {sum(hasil['api_calls'].values()):>10} "
+                  f"{hasil['peak_rss_mb']:>9.1f}  {status}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(semua_hasil, f, indent=2)
+
+    if args.simpan_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(semua_hasil, f, indent=2)
+        print(f"\nBaseline disimpen ke {args.baseline}")
+
+    if semua_regresi:
+        print("\nRegresi ketemu:")
+        for regresi in semua_regresi:
+            print(f"  - {regresi}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
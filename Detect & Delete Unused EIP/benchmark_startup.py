@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark Waktu Start AWS Resource Cleaner
+==========================================
+
+Ngukur berapa lama tool-nya start buat skenario yang sering dipake cron:
+--version & --help sampe proses kelar, sama scan satu resource type sampe
+request AWS pertama nyampe.
+
+Biar kagak nyentuh AWS beneran, semua endpoint diarahin ke HTTP server lokal
+yang nyatet kapan request pertama dateng terus prosesnya langsung dimatiin.
+
+Contoh:
+  python3 benchmark_startup.py
+  python3 benchmark_startup.py --runs 20 --baseline-ref HEAD~1
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+SCRIPT_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'aws_resource_cleaner.py')
+
+# Nama skenario -> (argumen CLI, diukur sampe request AWS pertama atau sampe proses kelar)
+SKENARIO = {
+    'version': (['--version'], False),
+    'help': (['--help'], False),
+    'scan-eip': (['--dry-run', '--resources', 'eip'], True),
+    'scan-rds': (['--dry-run', '--resources', 'rds'], True),
+}
+
+TIMEOUT_DETIK = 60
+
+
+class ServerAWSPalsu(ThreadingHTTPServer):
+    """HTTP server lokal yang nyatet waktu request pertama, semua request dijawab 500"""
+    
+    daemon_threads = True
+    
+    def __init__(self):
+        self.request_pertama = threading.Event()
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(handler):
+                self.request_pertama.set()
+                handler.send_response(500)
+                handler.send_header('Content-Length', '0')
+                handler.end_headers()
+            
+            do_GET = do_POST
+            
+            def log_message(handler, *args):
+                pass
+        
+        super().__init__(('127.0.0.1', 0), Handler)
+
+
+def env_benchmark(port: int) -> Dict[str, str]:
+    """Environment yang ngarahin semua API call ke server lokal tanpa retry"""
+    env = dict(os.environ)
+    env.update({
+        'AWS_ACCESS_KEY_ID': 'benchmark',
+        'AWS_SECRET_ACCESS_KEY': 'benchmark',
+        'AWS_DEFAULT_REGION': 'us-east-1',
+        'AWS_ENDPOINT_URL': f'http://127.0.0.1:{port}',
+        'AWS_MAX_ATTEMPTS': '1',
+        'AWS_RETRY_MODE': 'standard',
+        'AWS_EC2_METADATA_DISABLED': 'true',
+    })
+    return env
+
+
+def ukur(script: str, skenario: str, runs: int, server: ServerAWSPalsu, env: Dict[str, str]) -> List[float]:
+    """Jalanin script beberapa kali, balikin durasi tiap run (ms)"""
+    argumen, sampe_request = SKENARIO[skenario]
+    hasil = []
+    for _ in range(runs):
+        server.request_pertama.clear()
+        mulai = time.perf_counter()
+        proses = subprocess.Popen(
+            [sys.executable, script, *argumen],
+            env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        if sampe_request:
+            if not server.request_pertama.wait(TIMEOUT_DETIK):
+                raise RuntimeError(f"Skenario {skenario} kagak pernah manggil API")
+            selesai = time.perf_counter()
+            proses.kill()
+            proses.wait()
+        else:
+            proses.wait(TIMEOUT_DETIK)
+            selesai = time.perf_counter()
+        hasil.append((selesai - mulai) * 1000)
+    return hasil
+
+
+def script_dari_git(ref: str, script: str, folder: str) -> str:
+    """Ambil versi script dari git ref tertentu ke folder sementara"""
+    repo = os.path.dirname(os.path.abspath(script))
+    path_di_repo = subprocess.run(
+        ['git', 'ls-files', '--full-name', os.path.basename(script)],
+        cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    isi = subprocess.run(
+        ['git', 'show', f'{ref}:{path_di_repo}'],
+        cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+    tujuan = os.path.join(folder, os.path.basename(script))
+    with open(tujuan, 'w') as f:
+        f.write(isi)
+    return tujuan
+
+
+def main():
+    """Main function benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark waktu start AWS Resource Cleaner")
+    parser.add_argument('--runs', type=int, default=10, help='Jumlah run per skenario (default: 10)')
+    parser.add_argument('--script', default=SCRIPT_DEFAULT, help='Script yang mau diukur')
+    parser.add_argument('--baseline-ref', help='Git ref pembanding, contoh HEAD~1 atau main')
+    parser.add_argument('--skenario', default=','.join(SKENARIO),
+                        help=f"Skenario yang dijalanin, pisahin pake koma (default: {','.join(SKENARIO)})")
+    args = parser.parse_args()
+
+    server = ServerAWSPalsu()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    env = env_benchmark(server.server_address[1])
+    daftar_skenario = [nama.strip() for nama in args.skenario.split(',') if nama.strip() in SKENARIO]
+
+    with tempfile.TemporaryDirectory() as folder:
+        baseline: Optional[str] = None
+        if args.baseline_ref:
+            baseline = script_dari_git(args.baseline_ref, args.script, folder)
+
+        print(f"{'Skenario':<12} {'Median (ms)':>12} {'Min (ms)':>10}"
+              + (f" {'Baseline (ms)':>14} {'Speedup':>8}" if baseline else ""))
+        for nama in daftar_skenario:
+            sekarang = ukur(args.script, nama, args.runs, server, env)
+            baris = f"{nama:<12} {statistics.median(sekarang):>12.1f} {min(sekarang):>10.1f}"
+            if baseline:
+                lama = ukur(baseline, nama, args.runs, server, env)
+                baris += f" {statistics.median(lama):>14.1f} {statistics.median(lama) / statistics.median(sekarang):>7.1f}x"
+            print(baris)
+    
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
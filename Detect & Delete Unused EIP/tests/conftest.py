@@ -0,0 +1,50 @@
+"""Fixture bareng buat test aws_resource_cleaner, semua call AWS lewat botocore Stubber"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aws_resource_cleaner as arc  # noqa: E402
+
+
+@pytest.fixture
+def env_aws(monkeypatch, tmp_path):
+    """Kredensial palsu, region tetap & folder cache sementara biar kagak nyentuh AWS/home"""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.setenv('AWS_EC2_METADATA_DISABLED', 'true')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.delenv('AWS_PROFILE', raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def bikin_cleaner(env_aws):
+    """Factory cleaner yang diem (Console quiet), argumen diterusin ke constructor"""
+    from rich.console import Console
+    
+    def bikin(**kwargs):
+        kwargs.setdefault('console', Console(quiet=True))
+        return arc.AWSResourceCleanerBetawi(**kwargs)
+    return bikin
+
+
+@pytest.fixture
+def stub(bikin_cleaner):
+    """Pasang Stubber ke client cleaner: stub(cleaner, 'ec2') -> Stubber yang udah aktif"""
+    from botocore.stub import Stubber
+    
+    stubbers = []
+    
+    def pasang(cleaner, service, region=None, account_id=None):
+        stubber = Stubber(cleaner._client(service, region, account_id))
+        stubber.activate()
+        stubbers.append(stubber)
+        return stubber
+    yield pasang
+    for stubber in stubbers:
+        stubber.deactivate()
@@ -0,0 +1,82 @@
+"""Session multi-account lewat AssumeRole: refresh kredensial & account yang gagal dilewatin"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+def kredensial(nomor, berlaku=timedelta(hours=1)):
+    return {
+        'Credentials': {
+            'AccessKeyId': f'AKIAKEY{nomor:013d}',
+            'SecretAccessKey': f'rahasia-{nomor}',
+            'SessionToken': f'token-{nomor}',
+            'Expiration': datetime.now(timezone.utc) + berlaku
+        }
+    }
+
+
+def params_assume(account_id, **extra):
+    return {
+        'RoleArn': f'arn:aws:iam::{account_id}:role/OrganizationAccountAccessRole',
+        'RoleSessionName': 'aws-resource-cleaner-betawi',
+        'DurationSeconds': 3600,
+        **extra
+    }
+
+
+@pytest.fixture
+def cleaner(bikin_cleaner):
+    # Satu worker biar urutan call ke Stubber tetap
+    return bikin_cleaner(scan_workers=1)
+
+
+def test_kredensial_di_refresh_sebelum_expired(cleaner, stub):
+    sts = stub(cleaner, 'sts')
+    # Kredensial pertama udah mepet expired, jadi pas dipake langsung di-assume ulang
+    sts.add_response('assume_role', kredensial(1, timedelta(minutes=1)), params_assume('111111111111'))
+    sts.add_response('assume_role', kredensial(2), params_assume('111111111111'))
+    
+    session = cleaner._bikin_session_assume_role(
+        'arn:aws:iam::111111111111:role/OrganizationAccountAccessRole'
+    )
+    beku = session.get_credentials().get_frozen_credentials()
+    
+    sts.assert_no_pending_responses()
+    assert beku.access_key == kredensial(2)['Credentials']['AccessKeyId']
+    assert beku.token == 'token-2'
+
+
+def test_external_id_ikut_dikirim(bikin_cleaner, stub):
+    cleaner = bikin_cleaner(scan_workers=1, external_id='rahasia-org')
+    sts = stub(cleaner, 'sts')
+    sts.add_response('assume_role', kredensial(1), params_assume('111111111111', ExternalId='rahasia-org'))
+    
+    cleaner._bikin_session_assume_role('arn:aws:iam::111111111111:role/OrganizationAccountAccessRole')
+    
+    sts.assert_no_pending_responses()
+
+
+def test_account_gagal_assume_dilewatin(cleaner, stub):
+    sts = stub(cleaner, 'sts')
+    sts.add_response('assume_role', kredensial(1), params_assume('111111111111'))
+    sts.add_client_error('assume_role', 'AccessDenied', expected_params=params_assume('222222222222'))
+    sts.add_response('assume_role', kredensial(3), {
+        **params_assume('333333333333'),
+        'RoleArn': 'arn:aws:iam::333333333333:role/Audit'
+    })
+    
+    cleaner._siapin_sessions_akun(['111111111111', '222222222222', 'arn:aws:iam::333333333333:role/Audit'])
+    
+    sts.assert_no_pending_responses()
+    assert cleaner.accounts == ['111111111111', '333333333333']
+    assert set(cleaner.account_sessions) == {'111111111111', '333333333333'}
+    assert cleaner.role_arns['333333333333'] == 'arn:aws:iam::333333333333:role/Audit'
+
+
+def test_semua_account_gagal_keluar(cleaner, stub):
+    sts = stub(cleaner, 'sts')
+    sts.add_client_error('assume_role', 'AccessDenied')
+    
+    with pytest.raises(SystemExit):
+        cleaner._siapin_sessions_akun(['111111111111'])
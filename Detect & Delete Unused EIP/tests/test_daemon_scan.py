@@ -0,0 +1,52 @@
+"""Scheduler DaemonScan tetep hidup walaupun satu putaran error"""
+
+import json
+import threading
+import time
+
+import aws_resource_cleaner as arc
+
+
+def test_putaran_gagal_kagak_matiin_scheduler(bikin_cleaner, monkeypatch):
+    cleaner = bikin_cleaner()
+    monkeypatch.setattr(cleaner, 'iter_scan_resources', lambda *a, **k: iter(()))
+    daemon = arc.DaemonScan(cleaner, {'eip'}, interval=1, jitter=0)
+    
+    putaran = []
+    
+    def bikin_respons_rusak():
+        putaran.append(time.time())
+        raise RuntimeError("render rusak")
+    monkeypatch.setattr(daemon, '_bikin_respons', bikin_respons_rusak)
+    
+    scheduler = threading.Thread(target=daemon._loop_jadwal, daemon=True)
+    scheduler.start()
+    try:
+        batas = time.time() + 5
+        while len(putaran) < 2 and time.time() < batas:
+            time.sleep(0.05)
+        # Putaran kedua tetep jalan sesuai jadwal, thread-nya kagak mati
+        assert len(putaran) >= 2
+        assert scheduler.is_alive()
+        
+        status, body, _ = daemon.respons('/healthz')
+        assert status == 503 and b'render rusak' in body
+        isi = json.loads(daemon.respons('/status')[1])
+        assert 'render rusak' in isi['last_error']
+        assert isi['last_error_at'] is not None and isi['last_success'] is None
+    finally:
+        daemon._berhenti.set()
+        scheduler.join(5)
+
+
+def test_putaran_sukses_ngisi_last_success(bikin_cleaner, monkeypatch):
+    cleaner = bikin_cleaner()
+    monkeypatch.setattr(cleaner, 'iter_scan_resources', lambda *a, **k: iter(()))
+    daemon = arc.DaemonScan(cleaner, {'eip'}, interval=60, jitter=0)
+    
+    daemon._error_terakhir = (time.time(), "lama")
+    daemon._scan(list(daemon._jadwal))
+    
+    assert daemon.respons('/healthz')[0] == 200
+    isi = json.loads(daemon.respons('/status')[1])
+    assert isi['last_success'] is not None and isi['last_error'] is None
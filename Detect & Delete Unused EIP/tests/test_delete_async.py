@@ -0,0 +1,52 @@
+"""delete_async yang distop di tengah kagak boleh mulai penghapusan baru"""
+
+import asyncio
+import threading
+import time
+
+import aws_resource_cleaner as arc
+
+
+def bikin_volumes(jumlah):
+    return [arc.UnusedResource('ebs', f'vol-{i}', 'us-east-1', estimated_cost=1.0) for i in range(jumlah)]
+
+
+def test_break_awal_nahan_penghapusan_baru(bikin_cleaner, monkeypatch):
+    cleaner = bikin_cleaner()
+    dipanggil = []
+    lock = threading.Lock()
+    
+    def hapus_palsu(resource):
+        with lock:
+            dipanggil.append(resource.resource_id)
+        time.sleep(0.02)
+        return f"Deleted EBS Volume: {resource.resource_id}"
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', hapus_palsu)
+    
+    async def ambil_tiga():
+        hasil = []
+        async for resource, sukses in cleaner.delete_async(bikin_volumes(100)):
+            hasil.append((resource, sukses))
+            if len(hasil) == 3:
+                break
+        return hasil
+    
+    hasil = asyncio.run(ambil_tiga())
+    
+    assert len(hasil) == 3 and all(sukses for _, sukses in hasil)
+    # Paling banter yang udah terlanjur jalan barengan (concurrency ebs) yang ikut kelar
+    batas = 3 + 2 * cleaner.delete_concurrency['ebs']
+    assert len(dipanggil) <= batas
+    time.sleep(0.2)
+    assert len(dipanggil) <= batas
+
+
+def test_tanpa_break_semua_dihapus(bikin_cleaner, monkeypatch):
+    cleaner = bikin_cleaner()
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', lambda resource: f"Deleted {resource.resource_id}")
+    
+    async def ambil_semua():
+        return [sukses async for _, sukses in cleaner.delete_async(bikin_volumes(20))]
+    
+    assert asyncio.run(ambil_semua()) == [True] * 20
+    assert cleaner.statistik['deleted_resources'] == 20
@@ -0,0 +1,116 @@
+"""Parser --filter, predikat yang dititipin ke Filters= API, sama tag ELB dari index"""
+
+import pytest
+
+import aws_resource_cleaner as arc
+
+TIPE_TAG_ELB = ['elasticloadbalancing:loadbalancer']
+
+
+def test_parse_ekspresi():
+    saring = arc.FilterResource(['tag:env=dev,staging and age>90', 'type!="io2" AND tag:keep'])
+    
+    assert saring.predikat == [
+        ('tag', 'env', '=', ['dev', 'staging']),
+        ('age', None, '>', [90.0]),
+        ('type', None, '!=', ['io2']),
+        ('tag', 'keep', None, []),
+    ]
+
+
+@pytest.mark.parametrize('ekspresi', [
+    'warna=merah',     # field kagak dikenal
+    'size',            # kagak ada operator
+    'tag=dev',         # tag tanpa key
+    'age>tua',         # nilai angka
+    'type>gp3',        # operator banding buat field teks
+    'size>10,20',      # operator banding cuma satu nilai
+    'id=',             # kagak ada nilai
+])
+def test_ekspresi_kagak_valid(ekspresi):
+    with pytest.raises(ValueError):
+        arc.FilterResource([ekspresi])
+
+
+def test_predikat_sama_dengan_dititipin_ke_server():
+    saring = arc.FilterResource(['tag:env=dev and type!=io2 and size=100 and age>90 and region=us-east-1'])
+    
+    filters, sisa = saring.kompil('ebs')
+    
+    assert filters == [
+        {'Name': 'tag:env', 'Values': ['dev']},
+        {'Name': 'size', 'Values': ['100']},
+    ]
+    # Predikat lokasi dicek sebelum scan, kagak ikut di dua-duanya
+    assert sisa == [('type', None, '!=', ['io2']), ('age', None, '>', [90.0])]
+
+
+def test_predikat_yang_kagak_bisa_dititipin():
+    saring = arc.FilterResource(['size=1.5 and tag:keep and engine=postgres* and id=db-1'])
+    
+    assert saring.kompil('ebs')[0] == [
+        {'Name': 'tag-key', 'Values': ['keep']},
+        {'Name': 'volume-id', 'Values': ['db-1']},
+    ]
+    # Filter RDS kagak ngerti wildcard & tag, ELB kagak punya Filters sama sekali
+    assert saring.kompil('rds')[0] == [{'Name': 'db-instance-id', 'Values': ['db-1']}]
+    assert saring.kompil('elb')[0] == []
+    assert saring.pakai_tag('elb') and not saring.pakai_tag('ebs')
+
+
+def test_nama_parameter_nat():
+    saring = arc.FilterResource(['vpc=vpc-1'])
+    
+    assert saring.params_server('nat') == ('Filter', [{'Name': 'vpc-id', 'Values': ['vpc-1']}])
+    assert saring.params_server('eni')[0] == 'Filters'
+
+
+def test_cocok_di_client():
+    saring = arc.FilterResource(['tag:env=dev* and type!=io2'])
+    volume = {'VolumeType': 'gp3', 'Tags': [{'Key': 'env', 'Value': 'dev-1'}]}
+    
+    assert saring.cocok('elb', {}, tags={'env': 'development'})
+    assert not saring.cocok('elb', {}, tags={})
+    assert arc.FilterResource(['type!=io2 and size>=100']).cocok('ebs', {'VolumeType': 'gp3', 'Size': 100})
+    assert not arc.FilterResource(['vpc!=vpc-1']).cocok('eni', {'VpcId': 'vpc-1'})
+    assert arc.FilterResource(['vpc!=vpc-1']).cocok('eni', {})
+    assert saring._nilai('tag', 'env', 'ebs', volume) == 'dev-1'
+
+
+def test_tag_alb_diambil_dari_index(bikin_cleaner, stub):
+    cleaner = bikin_cleaner(filter_resource=arc.FilterResource(['tag:env=dev']))
+    cleaner._tipe_index_tag = TIPE_TAG_ELB
+    arn = 'arn:aws:elasticloadbalancing:us-east-1:123456789012:loadbalancer/app/{}/50dc6c495c0c9188'
+    elbv2 = stub(cleaner, 'elbv2')
+    elbv2.add_response('describe_load_balancers', {'LoadBalancers': [
+        {'LoadBalancerName': nama, 'LoadBalancerArn': arn.format(nama)} for nama in ('web-dev', 'web-prod')
+    ]})
+    tagging = stub(cleaner, 'resourcegroupstaggingapi')
+    tagging.add_response('get_resources', {'ResourceTagMappingList': [
+        {'ResourceARN': arn.format('web-dev'), 'Tags': [{'Key': 'env', 'Value': 'dev'}]},
+        {'ResourceARN': arn.format('web-prod'), 'Tags': [{'Key': 'env', 'Value': 'prod'}]},
+    ]})
+    
+    hasil = list(cleaner._paginate_resource('elb', 'elbv2', 'describe_load_balancers', 'LoadBalancers',
+                                            'us-east-1', None))
+    
+    tagging.assert_no_pending_responses()
+    assert [lb['LoadBalancerName'] for lb in hasil] == ['web-dev']
+
+
+def test_filter_tag_elb_nyalain_sweep_index(bikin_cleaner, monkeypatch):
+    tipe = {}
+    
+    def bikin(filter_resource):
+        cleaner = bikin_cleaner(filter_resource=filter_resource)
+        
+        def scan_palsu(region, account_id):
+            tipe[filter_resource.ekspresi[0]] = cleaner._tipe_index_tag
+            return iter(())
+        monkeypatch.setattr(cleaner, '_scan_methods', lambda: {'elb': scan_palsu, 'ebs': scan_palsu})
+        return cleaner
+    
+    list(bikin(arc.FilterResource(['tag:env=dev'])).iter_scan_resources({'elb', 'ebs'}))
+    list(bikin(arc.FilterResource(['age>30'])).iter_scan_resources({'elb', 'ebs'}))
+    
+    assert tipe == {'tag:env=dev': TIPE_TAG_ELB, 'age>30': []}
@@ -0,0 +1,108 @@
+"""Batch delete: EIP bekas NAT ikut dilepas, error sementara vs permanen"""
+
+import pytest
+from botocore.exceptions import ClientError
+
+import aws_resource_cleaner as arc
+
+
+def nat(nat_id, allocation_id=None):
+    eips = [{'allocation_id': allocation_id, 'public_ip': '203.0.113.10'}] if allocation_id else None
+    return arc.UnusedResource('nat', nat_id, 'us-east-1', estimated_cost=32.85, associated_eips=eips)
+
+
+def respons_nat(nat_id, state, *allocation_ids):
+    alamat = [{'AllocationId': a, 'PublicIp': '203.0.113.10'} for a in allocation_ids]
+    return {'NatGateways': [{'NatGatewayId': nat_id, 'State': state, 'NatGatewayAddresses': alamat}]}
+
+
+@pytest.fixture
+def cleaner(bikin_cleaner, monkeypatch):
+    cleaner = bikin_cleaner()
+    # Stubber cuma bisa ngejawab berurutan, jadi NAT-nya dihapus satu-satu
+    cleaner.delete_concurrency['nat'] = 1
+    monkeypatch.setattr(cleaner, 'NAT_DELETE_POLL_INTERVAL', 0)
+    return cleaner
+
+
+def test_eip_nat_dilepas_abis_nat_kehapus(cleaner, stub):
+    ec2 = stub(cleaner, 'ec2')
+    ec2.add_response('delete_nat_gateway', {'NatGatewayId': 'nat-1'}, {'NatGatewayId': 'nat-1'})
+    ec2.add_response('describe_nat_gateways', respons_nat('nat-1', 'deleting'), {'NatGatewayIds': ['nat-1']})
+    ec2.add_response('describe_nat_gateways', respons_nat('nat-1', 'deleted'), {'NatGatewayIds': ['nat-1']})
+    ec2.add_response('release_address', {}, {'AllocationId': 'eipalloc-1'})
+    
+    selesai = []
+    cleaner._hapus_paralel([nat('nat-1', 'eipalloc-1')], on_done=lambda r, sukses: selesai.append((r.resource_id, sukses)))
+    
+    ec2.assert_no_pending_responses()
+    assert selesai == [('nat-1', True), ('eipalloc-1', True)]
+    assert cleaner.statistik['deleted_resources'] == 2
+    assert cleaner.statistik['actual_savings'] == pytest.approx(32.85 + 3.65)
+
+
+def test_error_cek_status_cuma_gagalin_nat_itu(cleaner, stub):
+    ec2 = stub(cleaner, 'ec2')
+    for nat_id in ('nat-a', 'nat-b'):
+        ec2.add_response('delete_nat_gateway', {'NatGatewayId': nat_id}, {'NatGatewayId': nat_id})
+    # Call gabungan gagal, terus dicek satu-satu: nat-a beres, nat-b kagak bisa dicek
+    ec2.add_client_error('describe_nat_gateways', 'UnauthorizedOperation')
+    ec2.add_response('describe_nat_gateways', respons_nat('nat-a', 'deleted'), {'NatGatewayIds': ['nat-a']})
+    ec2.add_client_error('describe_nat_gateways', 'UnauthorizedOperation', expected_params={'NatGatewayIds': ['nat-b']})
+    ec2.add_response('release_address', {}, {'AllocationId': 'eipalloc-a'})
+    
+    cleaner._hapus_paralel([nat('nat-a', 'eipalloc-a'), nat('nat-b', 'eipalloc-b')])
+    
+    ec2.assert_no_pending_responses()
+    assert cleaner.statistik['deleted_resources'] == 3
+
+
+def test_eip_nat_dicatet_pas_scan_tanpa_yang_dilindungin(bikin_cleaner, stub):
+    cleaner = bikin_cleaner(proteksi=arc.AturanProteksi(['keep']))
+    ec2 = stub(cleaner, 'ec2')
+    ec2.add_response('describe_nat_gateways', respons_nat('nat-1', 'available', 'eipalloc-1', 'eipalloc-2'))
+    ec2.add_response('describe_route_tables', {'RouteTables': []})
+    ec2.add_response('describe_addresses', {'Addresses': [
+        {'AllocationId': 'eipalloc-1', 'Tags': [{'Key': 'env', 'Value': 'dev'}]},
+        {'AllocationId': 'eipalloc-2', 'Tags': [{'Key': 'keep', 'Value': 'yes'}]},
+    ]}, {'AllocationIds': ['eipalloc-1', 'eipalloc-2']})
+    
+    hasil = list(cleaner.scan_nat_gateways('us-east-1'))
+    
+    ec2.assert_no_pending_responses()
+    assert hasil[0].associated_eips == [{'allocation_id': 'eipalloc-1', 'public_ip': '203.0.113.10'}]
+    assert hasil[0].ke_dict()['associated_eips'] == hasil[0].associated_eips
+
+
+def test_batch_ngitung_eip_nat_di_konfirmasi_dan_progress(cleaner, monkeypatch):
+    from rich.progress import Progress
+    from rich.prompt import Confirm
+    
+    pertanyaan, total = [], []
+    monkeypatch.setattr(Confirm, 'ask', classmethod(lambda cls, teks, **kwargs: pertanyaan.append(teks)))
+    cleaner.mode_batch([nat('nat-1', 'eipalloc-1')])
+    
+    monkeypatch.setattr(cleaner, '_hapus_paralel', lambda resources, on_done=None: None)
+    add_task = Progress.add_task
+    monkeypatch.setattr(Progress, 'add_task',
+                        lambda self, *args, **kwargs: total.append(kwargs['total']) or add_task(self, *args, **kwargs))
+    cleaner.mode_batch([nat('nat-1', 'eipalloc-1')], konfirmasi=False)
+    
+    assert pertanyaan == ['Hapus SEMUA 1 unused resources + 1 EIP bekas NAT? (Ini bisa hemat $36.50/month lho!)']
+    assert total == [2]
+
+
+@pytest.mark.parametrize('error_code', ['VolumeInUse', 'InvalidSnapshot.InUse'])
+def test_error_in_use_permanen_kagak_diulang(bikin_cleaner, monkeypatch, error_code):
+    cleaner = bikin_cleaner()
+    dipanggil = []
+    
+    def hapus_palsu(resource):
+        dipanggil.append(resource.resource_id)
+        raise ClientError({'Error': {'Code': error_code, 'Message': 'in use'}}, 'DeleteVolume')
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', hapus_palsu)
+    
+    cleaner._hapus_paralel([arc.UnusedResource('ebs', 'vol-1', 'us-east-1', estimated_cost=1.0)])
+    
+    assert dipanggil == ['vol-1']
+    assert cleaner.statistik['failed_deletions'] == 1
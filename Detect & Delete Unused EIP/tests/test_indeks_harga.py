@@ -0,0 +1,130 @@
+"""Harga offline: parser JSON streaming per chunk & index SQLite dari file Price List"""
+
+import io
+import json
+import os
+
+import pytest
+
+import aws_resource_cleaner as arc
+
+DOKUMEN = {
+    'kutip "dalem" \\ miring': 'baris\nbaru é 🚀',
+    'dilewatin': {'dalem': [1, {'z': '}'}], '}': {'{': '"'}},
+    'angka': 12345.5,
+    'nested': {'x': {'y': [True, None, -0.25e3]}, 'kosong': {}},
+}
+
+
+def produk(sku, family, **atribut):
+    return sku, {'sku': sku, 'productFamily': family, 'attributes': {'regionCode': 'us-east-1', **atribut}}
+
+
+def term_ondemand(sku, *tier):
+    dimensi = {
+        f'{sku}.dim{i}': {'beginRange': mulai, 'unit': unit, 'pricePerUnit': {'USD': usd},
+                          'description': f'${usd} per "{unit}"'}
+        for i, (mulai, usd, unit) in enumerate(tier)
+    }
+    return {f'{sku}.JRTCKXETXF': {'sku': sku, 'priceDimensions': dimensi}}
+
+
+def offer(harga_gp3='0.08'):
+    products = dict([
+        produk('GP3', 'Storage', volumeApiName='gp3', usagetype='EBS:VolumeUsage.gp3'),
+        produk('EIP', 'IP Address', usagetype='USE1-ElasticIP:IdleAddress'),
+        produk('RDS-LI', 'Database Instance', instanceType='db.t3.micro', databaseEngine='MySQL',
+               deploymentOption='Single-AZ'),
+        produk('RDS-BYOL', 'Database Instance', instanceType='db.t3.micro', databaseEngine='MySQL',
+               deploymentOption='Single-AZ'),
+        produk('TRANSFER', 'Data Transfer', usagetype='DataTransfer-Out-Bytes'),
+    ])
+    return {
+        'formatVersion': 'v1.0',
+        'products': products,
+        'terms': {
+            'OnDemand': {
+                'GP3': term_ondemand('GP3', ('0', harga_gp3, 'GB-Mo')),
+                # Cuma tier yang beginRange-nya 0 yang dipake
+                'EIP': term_ondemand('EIP', ('0', '0.005', 'Hrs'), ('1', '0.004', 'Hrs')),
+                'RDS-LI': term_ondemand('RDS-LI', ('0', '0.034', 'Hrs')),
+                'RDS-BYOL': term_ondemand('RDS-BYOL', ('0', '0.017', 'Hrs')),
+                'TRANSFER': term_ondemand('TRANSFER', ('0', '0.09', 'GB')),
+            },
+            'Reserved': {'GP3': term_ondemand('GP3', ('0', '0.01', 'GB-Mo'))},
+        },
+    }
+
+
+def baca(teks):
+    pembaca = arc._PembacaJSONStreaming(io.StringIO(teks))
+    hasil = {}
+    for key in pembaca.members():
+        if key == 'dilewatin':
+            pembaca.lewati()
+        else:
+            hasil[key] = pembaca.value()
+    return hasil
+
+
+@pytest.mark.parametrize('ukuran_chunk', [1, 2, 3, 7, 1 << 20])
+def test_token_kepotong_antar_chunk(monkeypatch, ukuran_chunk):
+    monkeypatch.setattr(arc._PembacaJSONStreaming, 'UKURAN_CHUNK', ukuran_chunk)
+    teks = json.dumps(DOKUMEN, indent=1)
+    
+    hasil = baca(teks)
+    
+    assert hasil == {key: nilai for key, nilai in DOKUMEN.items() if key != 'dilewatin'}
+
+
+def test_escape_unicode_mentah(monkeypatch):
+    monkeypatch.setattr(arc._PembacaJSONStreaming, 'UKURAN_CHUNK', 2)
+    
+    assert baca(json.dumps(DOKUMEN, ensure_ascii=False)) == baca(json.dumps(DOKUMEN))
+
+
+@pytest.mark.parametrize('teks', ['{"a": {"b": 1}', '{"a": 1 "b": 2}', '["bukan object"]'])
+def test_json_kepotong_atau_rusak(monkeypatch, teks):
+    monkeypatch.setattr(arc._PembacaJSONStreaming, 'UKURAN_CHUNK', 3)
+    
+    with pytest.raises(ValueError):
+        baca(teks)
+
+
+@pytest.fixture
+def file_offer(tmp_path):
+    path = tmp_path / 'AmazonEC2.json'
+    path.write_text(json.dumps(offer(), indent=2), encoding='utf-8')
+    return path
+
+
+def test_index_dibangun_dari_offer(file_offer, tmp_path, monkeypatch):
+    monkeypatch.setattr(arc._PembacaJSONStreaming, 'UKURAN_CHUNK', 5)
+    indeks = arc.IndeksHarga(str(tmp_path / 'pricing.sqlite3'))
+    
+    assert indeks.bangun([str(file_offer)]) == 3
+    
+    rds = {'Engine': 'mysql', 'DBInstanceClass': 'db.t3.micro', 'MultiAZ': False}
+    assert indeks.harga(indeks.key_resource('ebs', 'us-east-1', {'VolumeType': 'gp3'})) == (0.08, 'GB-Mo')
+    assert indeks.harga(indeks.key_resource('eip', 'us-east-1', {})) == (0.005, 'Hrs')
+    # Dua SKU satu key (license beda), yang termurah yang disimpen
+    assert indeks.harga(indeks.key_resource('rds', 'us-east-1', rds)) == (0.017, 'Hrs')
+    assert indeks.harga(indeks.key_resource('ebs', 'eu-west-1', {'VolumeType': 'gp3'})) is None
+    assert not indeks.kosong
+
+
+def test_index_cuma_dibangun_ulang_kalo_file_berubah(file_offer, tmp_path):
+    path_index = str(tmp_path / 'pricing.sqlite3')
+    indeks = arc.IndeksHarga(path_index)
+    indeks.bangun([str(file_offer)])
+    key = indeks.key_resource('ebs', 'us-east-1', {'VolumeType': 'gp3'})
+    assert indeks.harga(key) == (0.08, 'GB-Mo')
+    
+    # Run berikutnya buka index yang sama, file offer-nya kagak di-parse lagi
+    assert arc.IndeksHarga(path_index).bangun([str(file_offer)]) == 0
+    
+    file_offer.write_text(json.dumps(offer(harga_gp3='0.09'), indent=2), encoding='utf-8')
+    info = os.stat(file_offer)
+    os.utime(file_offer, (info.st_atime, info.st_mtime + 10))
+    assert indeks.bangun([str(file_offer)]) == 3
+    assert indeks.harga(key) == (0.09, 'GB-Mo')
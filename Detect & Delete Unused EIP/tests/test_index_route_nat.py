@@ -0,0 +1,82 @@
+"""Index route table buat NAT: satu sweep describe_route_tables per lokasi, bukan per NAT"""
+
+from datetime import datetime, timezone
+
+from botocore.stub import ANY
+
+UDAH_LAMA = datetime(2020, 1, 1, tzinfo=timezone.utc)
+PARAMS_ROUTE = {'Filters': [{'Name': 'route.nat-gateway-id', 'Values': ['nat-*']}], 'MaxResults': ANY}
+
+
+def nat(nat_id, state='available'):
+    return {'NatGatewayId': nat_id, 'State': state, 'CreateTime': UDAH_LAMA}
+
+
+def route_table(rt_id, nat_ids, subnets=(), main=False):
+    associations = [{'RouteTableId': rt_id, 'SubnetId': s, 'Main': False} for s in subnets]
+    if main:
+        associations.append({'RouteTableId': rt_id, 'Main': True})
+    return {
+        'RouteTableId': rt_id,
+        'Associations': associations,
+        'Routes': [{'DestinationCidrBlock': '0.0.0.0/0', 'NatGatewayId': n} for n in nat_ids]
+                  + [{'DestinationCidrBlock': '10.0.0.0/16', 'GatewayId': 'local'}],
+    }
+
+
+def test_index_digabung_dari_semua_page(bikin_cleaner, stub):
+    cleaner = bikin_cleaner()
+    ec2 = stub(cleaner, 'ec2')
+    ec2.add_response('describe_route_tables', {
+        'RouteTables': [route_table('rtb-1', ['nat-a'], subnets=['subnet-1'])], 'NextToken': 'lanjut'
+    }, PARAMS_ROUTE)
+    ec2.add_response('describe_route_tables', {'RouteTables': [
+        route_table('rtb-2', ['nat-a', 'nat-b'], subnets=['subnet-2']),
+        route_table('rtb-3', ['nat-c'], main=True),
+    ]}, {**PARAMS_ROUTE, 'NextToken': 'lanjut'})
+    
+    index = cleaner._bangun_index_route_nat('us-east-1', None)
+    
+    ec2.assert_no_pending_responses()
+    assert index == {
+        'nat-a': {'route_tables': ['rtb-1', 'rtb-2'], 'subnets': {'subnet-1', 'subnet-2'}, 'main': False},
+        'nat-b': {'route_tables': ['rtb-2'], 'subnets': {'subnet-2'}, 'main': False},
+        'nat-c': {'route_tables': ['rtb-3'], 'subnets': set(), 'main': True},
+    }
+
+
+def test_scan_nat_cuma_sekali_describe_route_tables(bikin_cleaner, stub):
+    cleaner = bikin_cleaner()
+    ec2 = stub(cleaner, 'ec2')
+    ec2.add_response('describe_nat_gateways', {'NatGateways': [
+        nat('nat-pending', 'pending'), nat('nat-tanpa-route'), nat('nat-yatim'), nat('nat-kepake'), nat('nat-main'),
+    ]})
+    ec2.add_response('describe_route_tables', {'RouteTables': [
+        route_table('rtb-yatim', ['nat-yatim']),
+        route_table('rtb-app', ['nat-kepake'], subnets=['subnet-app']),
+        route_table('rtb-main', ['nat-main'], main=True),
+    ]}, PARAMS_ROUTE)
+    # Cuma NAT yang route-nya kepake yang dicek traffic-nya: nat-kepake idle, nat-main masih ada traffic
+    stub(cleaner, 'cloudwatch').add_response('get_metric_data', {'MetricDataResults': [
+        {'Id': 'm0', 'Values': [0.0], 'StatusCode': 'Complete'},
+        {'Id': 'm1', 'Values': [1024.0], 'StatusCode': 'Complete'},
+    ]}, {'MetricDataQueries': ANY, 'StartTime': ANY, 'EndTime': ANY})
+    
+    hasil = list(cleaner.scan_nat_gateways('us-east-1'))
+    
+    ec2.assert_no_pending_responses()
+    assert [(r.resource_id, r.unused_reason) for r in hasil] == [
+        ('nat-tanpa-route', 'kagak ada route'),
+        ('nat-yatim', 'route table kagak nyambung ke subnet'),
+        ('nat-kepake', f'kagak ada traffic {cleaner.idle_days} hari terakhir'),
+    ]
+
+
+def test_kagak_ada_nat_available_kagak_sweep_route(bikin_cleaner, stub):
+    cleaner = bikin_cleaner()
+    ec2 = stub(cleaner, 'ec2')
+    ec2.add_response('describe_nat_gateways', {'NatGateways': [nat('nat-1', 'deleted')]})
+    
+    # Stubber bakal error kalo describe_route_tables ikut dipanggil
+    assert list(cleaner.scan_nat_gateways('us-east-1')) == []
+    ec2.assert_no_pending_responses()
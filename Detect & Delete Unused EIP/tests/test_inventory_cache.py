@@ -0,0 +1,109 @@
+"""Cache inventory: TTL, key per kredensial & lokasi, invalidasi abis hapus, opt-in dari CLI"""
+
+import pytest
+
+import aws_resource_cleaner as arc
+
+EIP = {'Addresses': [{'AllocationId': 'eipalloc-1', 'PublicIp': '203.0.113.10', 'Domain': 'vpc'}]}
+
+
+@pytest.fixture
+def cache(env_aws):
+    return arc.InventoryCache(path=str(env_aws / 'inventory.sqlite3'), ttl=60)
+
+
+def ambil_eip(cleaner, region='us-east-1'):
+    return list(cleaner._paginate('ec2', 'describe_addresses', 'Addresses', region=region))
+
+
+def test_entry_kadaluarsa_abis_ttl(cache, monkeypatch):
+    key = cache.bikin_key('profile:default', 'us-east-1', 'ec2', 'describe_addresses', {})
+    cache.mulai(key, 'profile:default', 'us-east-1', 'describe_addresses')
+    cache.tulis_page(key, 0, EIP)
+    cache.selesai(key)
+    
+    assert list(cache.ambil(key)) == [EIP]
+    sekarang = arc.time.time()
+    monkeypatch.setattr(arc.time, 'time', lambda: sekarang + 61)
+    assert cache.ambil(key) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entry_yang_belom_complete_kagak_dibaca(cache):
+    key = cache.bikin_key('profile:default', 'us-east-1', 'ec2', 'describe_addresses', {})
+    cache.mulai(key, 'profile:default', 'us-east-1', 'describe_addresses')
+    cache.tulis_page(key, 0, EIP)
+    
+    assert cache.ambil(key) is None
+
+
+def test_hit_kedua_kagak_manggil_api_maupun_sts(bikin_cleaner, stub, cache):
+    cleaner = bikin_cleaner(inventory_cache=cache)
+    ec2 = stub(cleaner, 'ec2')
+    ec2.add_response('describe_addresses', EIP, {})
+    # Kagak ada response STS, call GetCallerIdentity bakal bikin Stubber error
+    stub(cleaner, 'sts')
+    
+    pertama = ambil_eip(cleaner)
+    kedua = ambil_eip(cleaner)
+    
+    ec2.assert_no_pending_responses()
+    assert pertama == kedua == EIP['Addresses']
+    assert cache.hits == 1
+
+
+def test_key_dipisah_per_kredensial_dan_region(bikin_cleaner, stub, cache, monkeypatch):
+    cleaner = bikin_cleaner(inventory_cache=cache)
+    stub(cleaner, 'ec2').add_response('describe_addresses', EIP, {})
+    ambil_eip(cleaner)
+    
+    # Region lain di kredensial yang sama tetep nanya ke AWS
+    lain_region = stub(cleaner, 'ec2', region='eu-west-1')
+    lain_region.add_response('describe_addresses', {'Addresses': []}, {})
+    assert ambil_eip(cleaner, 'eu-west-1') == []
+    lain_region.assert_no_pending_responses()
+    
+    # Access key lain (account lain) kagak boleh kebagian cache-nya
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing-lain')
+    cleaner_lain = bikin_cleaner(inventory_cache=cache)
+    ec2_lain = stub(cleaner_lain, 'ec2')
+    ec2_lain.add_response('describe_addresses', {'Addresses': []}, {})
+    assert ambil_eip(cleaner_lain) == []
+    ec2_lain.assert_no_pending_responses()
+    
+    # Profile yang dipilih explicit menang dari environment
+    cleaner_lain.profile = 'prod'
+    assert cleaner_lain._cache_account(None) == 'profile:prod'
+    assert len({cleaner._cache_account(None), cleaner_lain._cache_account(None),
+                cleaner._cache_account('111111111111')}) == 3
+
+
+def test_cache_lokasi_dibuang_abis_ada_yang_dihapus(bikin_cleaner, stub, cache):
+    cleaner = bikin_cleaner(inventory_cache=cache)
+    ec2 = stub(cleaner, 'ec2')
+    ec2.add_response('describe_addresses', EIP, {})
+    ec2.add_response('describe_addresses', {'Addresses': []}, {})
+    
+    ambil_eip(cleaner)
+    cleaner._invalidasi_cache(arc.UnusedResource('eip', 'eipalloc-1', 'us-east-1'))
+    
+    assert ambil_eip(cleaner) == []
+    ec2.assert_no_pending_responses()
+
+
+@pytest.mark.parametrize('argumen, dibaca', [
+    (['--dry-run', '--cache'], True),
+    (['--dry-run', '--cache', '--refresh'], False),
+    (['--batch', '--cache'], False),
+    (['--serve', '--cache'], False),
+])
+def test_cuma_dry_run_yang_baca_cache(env_aws, argumen, dibaca):
+    args = arc.bikin_parser().parse_args(argumen)
+    
+    cache = arc.siapin_inventory_cache(args)
+    
+    assert cache.refresh is not dibaca
+
+
+def test_cache_mati_tanpa_flag(env_aws):
+    assert arc.siapin_inventory_cache(arc.bikin_parser().parse_args(['--batch'])) is None
@@ -0,0 +1,138 @@
+"""Journal penghapusan: --resume cuma nyoba ulang yang belom ada hasilnya"""
+
+import os
+
+import pytest
+from botocore.exceptions import ClientError
+
+import aws_resource_cleaner as arc
+
+
+def bikin_journal(nama_file):
+    """Journal kepotong: vol-0 sukses, vol-1 udah 'mulai' tapi belom ada hasil, vol-2 gagal"""
+    resources = [arc.UnusedResource('ebs', f'vol-{i}', 'us-east-1', estimated_cost=10.0) for i in range(3)]
+    journal = arc.JournalHapus.baru(nama_file, {'statistik': {'unused_resources': 3}}, resources)
+    journal.catat_mulai([resources[0], resources[2]])
+    journal.catat_hasil(resources[0], True)
+    journal.catat_hasil(resources[2], False, 'UnauthorizedOperation')
+    journal.catat_mulai([resources[1]])
+    # Proses mati di sini, sebelum hasil vol-1 sempet ditulis
+    journal.tutup()
+    return nama_file
+
+
+@pytest.fixture
+def cleaner(bikin_cleaner, monkeypatch):
+    cleaner = bikin_cleaner()
+    cleaner.dipanggil = []
+    
+    def hapus_palsu(resource):
+        cleaner.dipanggil.append(resource.resource_id)
+        return f"Deleted EBS Volume: {resource.resource_id}"
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', hapus_palsu)
+    return cleaner
+
+
+def test_resume_cuma_nyoba_ulang_yang_kepotong(cleaner, tmp_path):
+    nama_file = bikin_journal(str(tmp_path / 'hapus.ndjson'))
+    
+    cleaner.lanjutin_journal(nama_file, konfirmasi=False)
+    
+    assert cleaner.dipanggil == ['vol-1']
+    assert cleaner.statistik['deleted_resources'] == 2
+    assert cleaner.statistik['failed_deletions'] == 1
+    assert cleaner.statistik['actual_savings'] == pytest.approx(20.0)
+    # Path yang dikasih sendiri kagak dihapus walaupun udah kelar
+    assert arc.JournalHapus.buka(nama_file).kelar()
+
+
+def test_resume_not_found_yang_kepotong_dianggep_sukses(cleaner, tmp_path, monkeypatch):
+    nama_file = bikin_journal(str(tmp_path / 'hapus.ndjson'))
+    
+    def udah_ilang(resource):
+        raise ClientError({'Error': {'Code': 'InvalidVolume.NotFound', 'Message': 'gone'}}, 'DeleteVolume')
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', udah_ilang)
+    
+    cleaner.lanjutin_journal(nama_file, konfirmasi=False)
+    
+    assert cleaner.statistik['deleted_resources'] == 2
+    assert cleaner.statistik['failed_deletions'] == 1
+
+
+def test_mulai_segelombang_di_fsync_sekali_sebelum_api_dipanggil(cleaner, tmp_path, monkeypatch):
+    resources = [arc.UnusedResource('ebs', f'vol-{i}', 'us-east-1') for i in range(3)]
+    nama_file = str(tmp_path / 'hapus.ndjson')
+    cleaner.journal = arc.JournalHapus.baru(nama_file, {}, resources)
+    disync = []
+    monkeypatch.setattr(arc.os, 'fsync', lambda fd: disync.append(fd))
+    pas_dipanggil = []
+    
+    def hapus_palsu(resource):
+        with open(nama_file, encoding='utf-8') as f:
+            mulai = sum('"mulai"' in baris for baris in f)
+        pas_dipanggil.append((len(disync), mulai))
+        return f"Deleted EBS Volume: {resource.resource_id}"
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', hapus_palsu)
+    
+    cleaner._hapus_paralel(resources)
+    
+    # Tiga-tiganya kebagian slot di gelombang pertama: satu fsync, semua niatnya udah di disk
+    assert pas_dipanggil == [(1, 3)] * 3
+    cleaner.tutup_journal()
+
+
+def test_plan_dicocokin_pake_identitas_resource(tmp_path):
+    nama_file = str(tmp_path / 'hapus.ndjson')
+    journal = arc.JournalHapus.baru(nama_file, {}, [arc.UnusedResource('ebs', 'vol-0', 'us-east-1')])
+    
+    # Record baru dengan identitas sama (misalnya hasil scan ulang) nyatet ke plan yang sama
+    journal.catat_hasil(arc.UnusedResource('ebs', 'vol-0', 'us-east-1'), True)
+    journal.tutup()
+    
+    assert arc.JournalHapus.buka(nama_file).kelar()
+
+
+def test_buka_motong_baris_kepotong_pake_offset_byte(tmp_path):
+    nama_file = str(tmp_path / 'hapus.ndjson')
+    # Baris terakhir yang kepotong dibuang, abis itu journal-nya tetep bisa ditambahin
+    resources = [arc.UnusedResource('ebs', f'vol-{i}', 'us-east-1', label='volume é 🚀') for i in range(2)]
+    journal = arc.JournalHapus.baru(nama_file, {'catatan': 'ünïcödé'}, resources)
+    journal.catat_mulai(resources)
+    journal.catat_hasil(resources[0], True)
+    journal.tutup()
+    with open(nama_file, 'ab') as f:
+        f.write('{"record": "hasil", "n": 1, "ok": tr'.encode('utf-8'))
+    
+    journal = arc.JournalHapus.buka(nama_file)
+    journal.catat_hasil(journal.resources[1], False, 'UnauthorizedOperation')
+    journal.tutup()
+    
+    journal = arc.JournalHapus.buka(nama_file)
+    assert journal.header['catatan'] == 'ünïcödé'
+    assert journal.resources[1].label == 'volume é 🚀'
+    assert journal.hasil == {0: (True, None), 1: (False, 'UnauthorizedOperation')}
+
+
+def test_journal_default_yang_kelar_dihapus(cleaner):
+    resources = [arc.UnusedResource('ebs', f'vol-{i}', 'us-east-1', estimated_cost=1.0) for i in range(2)]
+    nama_file = arc.JournalHapus.nama_default()
+    
+    cleaner.mode_batch(resources, konfirmasi=False, journal=nama_file)
+    
+    assert sorted(cleaner.dipanggil) == ['vol-0', 'vol-1']
+    assert not os.path.exists(nama_file)
+
+
+def test_journal_default_yang_kepotong_disimpen(cleaner, monkeypatch):
+    resources = [arc.UnusedResource('ebs', f'vol-{i}', 'us-east-1', estimated_cost=1.0) for i in range(2)]
+    nama_file = arc.JournalHapus.nama_default()
+    
+    def mati(resource):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', mati)
+    
+    with pytest.raises(KeyboardInterrupt):
+        cleaner.mode_batch(resources, konfirmasi=False, journal=nama_file)
+    
+    assert os.path.exists(nama_file)
+    assert len(arc.JournalHapus.buka(nama_file).sisa()) == 2
@@ -0,0 +1,122 @@
+"""Deteksi idle lewat CloudWatch GetMetricData: batching, paging & resource yang masih baru"""
+
+from datetime import datetime, timedelta, timezone
+
+from botocore.stub import ANY
+
+PARAMS_METRIK = {'MetricDataQueries': ANY, 'StartTime': ANY, 'EndTime': ANY}
+UDAH_LAMA = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def spec_nat(i, dibikin=UDAH_LAMA):
+    return 'nat', (('NatGatewayId', f'nat-{i}'),), dibikin
+
+
+def hasil(values_per_id, **extra):
+    return {
+        'MetricDataResults': [
+            {'Id': query_id, 'Values': values, 'StatusCode': 'Complete'}
+            for query_id, values in values_per_id.items()
+        ],
+        **extra
+    }
+
+
+def catat_ukuran_batch(client):
+    ukuran = []
+    client.meta.events.register(
+        'before-parameter-build.cloudwatch.GetMetricData',
+        lambda params, **kwargs: ukuran.append(len(params['MetricDataQueries']))
+    )
+    return ukuran
+
+
+def test_query_dipak_500_per_call(bikin_cleaner, stub):
+    cleaner = bikin_cleaner()
+    cloudwatch = stub(cleaner, 'cloudwatch')
+    ukuran = catat_ukuran_batch(cleaner._client('cloudwatch'))
+    # Tiap item: kagak ada datapoint, nol semua, atau ada traffic, gantian
+    values = [[], [0.0, 0.0], [5.0]]
+    for awal, jumlah in ((0, 500), (500, 500), (1000, 200)):
+        cloudwatch.add_response('get_metric_data', hasil({
+            f'm{n}': values[(awal + n) % 3] for n in range(jumlah)
+        }), PARAMS_METRIK)
+    
+    hasil_idle = list(cleaner._saring_idle(range(1200), spec_nat, 'us-east-1', None))
+    
+    cloudwatch.assert_no_pending_responses()
+    assert ukuran == [500, 500, 200]
+    assert hasil_idle == [(i, i % 3 != 2) for i in range(1200)]
+
+
+def test_page_next_token_digabung_per_id(bikin_cleaner, stub):
+    cleaner = bikin_cleaner()
+    cloudwatch = stub(cleaner, 'cloudwatch')
+    cloudwatch.add_response('get_metric_data', hasil({'m0': [0.0], 'm1': [0.0]}, NextToken='lanjut'),
+                            PARAMS_METRIK)
+    cloudwatch.add_response('get_metric_data', hasil({'m1': [0.0, 7.0]}),
+                            {**PARAMS_METRIK, 'NextToken': 'lanjut'})
+    
+    nilai = cleaner._ambil_metrik([spec_nat(0)[:2], spec_nat(1)[:2]], 'us-east-1', None)
+    
+    cloudwatch.assert_no_pending_responses()
+    assert nilai == [0.0, 7.0]
+
+
+def test_resource_muda_kagak_dicek(bikin_cleaner, stub):
+    cleaner = bikin_cleaner(idle_days=14)
+    cloudwatch = stub(cleaner, 'cloudwatch')
+    kemaren = datetime.now(timezone.utc) - timedelta(days=1)
+    # Datetime tanpa timezone dianggep UTC
+    tanpa_tz = (datetime.now(timezone.utc) - timedelta(days=2)).replace(tzinfo=None)
+    specs = {0: spec_nat(0, kemaren), 1: spec_nat(1, tanpa_tz), 2: None}
+    
+    hasil_idle = list(cleaner._saring_idle(range(3), specs.get, 'us-east-1', None))
+    
+    # Kagak ada call sama sekali; Stubber bakal error kalo ada yang nyasar ke API
+    cloudwatch.assert_no_pending_responses()
+    assert hasil_idle == [(0, False), (1, False), (2, False)]
+
+
+def test_metrik_gagal_atau_kagak_lengkap_dianggep_kagak_idle(bikin_cleaner, stub):
+    cleaner = bikin_cleaner()
+    cloudwatch = stub(cleaner, 'cloudwatch')
+    # Batch pertama ditolak (permission cloudwatch:GetMetricData kagak ada), batch kedua jalan
+    cloudwatch.add_client_error('get_metric_data', 'AccessDenied')
+    cloudwatch.add_response('get_metric_data', {'MetricDataResults': [
+        {'Id': 'm0', 'Values': [], 'StatusCode': 'Complete'},
+        {'Id': 'm1', 'Values': [0.0], 'StatusCode': 'PartialData'},
+        {'Id': 'm2', 'Values': [], 'StatusCode': 'InternalError'},
+        # m3 kagak dijawab sama sekali
+    ]}, PARAMS_METRIK)
+    
+    hasil_idle = dict(cleaner._saring_idle(range(504), spec_nat, 'us-east-1', None))
+    
+    cloudwatch.assert_no_pending_responses()
+    assert not any(hasil_idle[i] for i in range(500))
+    assert [hasil_idle[i] for i in range(500, 504)] == [True, False, False, False]
+
+
+def test_metrik_gagal_kagak_ngebatalin_scan_elb(bikin_cleaner, stub):
+    cleaner = bikin_cleaner()
+    arn_lb = 'arn:aws:elasticloadbalancing:us-east-1:123456789012:loadbalancer/app/web/50dc6c495c0c9188'
+    arn_tg = 'arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/web/73e2d6bc24d8a067'
+    elbv2 = stub(cleaner, 'elbv2')
+    elbv2.add_response('describe_load_balancers', {'LoadBalancers': [
+        {'LoadBalancerName': 'web', 'LoadBalancerArn': arn_lb, 'Type': 'application', 'CreatedTime': UDAH_LAMA}
+    ]})
+    elbv2.add_response('describe_target_groups', {'TargetGroups': [
+        {'TargetGroupArn': arn_tg, 'LoadBalancerArns': [arn_lb]}
+    ]})
+    elbv2.add_response('describe_target_health', {'TargetHealthDescriptions': [
+        {'Target': {'Id': 'i-1'}, 'TargetHealth': {'State': 'healthy'}}
+    ]})
+    stub(cleaner, 'cloudwatch').add_client_error('get_metric_data', 'AccessDenied')
+    stub(cleaner, 'elb').add_response('describe_load_balancers', {'LoadBalancerDescriptions': [
+        {'LoadBalancerName': 'classic-kosong', 'Instances': []}
+    ]})
+    
+    hasil = list(cleaner.scan_load_balancers('us-east-1'))
+    
+    # ALB yang metriknya kagak kebaca kagak ditandain, Classic ELB tetep ke-scan
+    assert [(r.resource_id, r.unused_reason) for r in hasil] == [('classic-kosong', 'kagak ada instance')]
@@ -0,0 +1,140 @@
+"""--protect-tag: resource tetep dilaporin pake protected_by, tapi kagak pernah dihapus"""
+
+import asyncio
+
+import pytest
+from botocore.stub import ANY
+
+import aws_resource_cleaner as arc
+
+
+def volumes():
+    return [
+        arc.UnusedResource('ebs', 'vol-aman', 'us-east-1', estimated_cost=10.0, tags={'Keep': 'True'}),
+        arc.UnusedResource('ebs', 'vol-buang', 'us-east-1', estimated_cost=5.0, tags={'env': 'dev'}),
+    ]
+
+
+@pytest.fixture
+def cleaner(bikin_cleaner, monkeypatch):
+    cleaner = bikin_cleaner(proteksi=arc.AturanProteksi(['keep=true']))
+    cleaner.dipanggil = []
+    
+    def hapus_palsu(resource):
+        cleaner.dipanggil.append(resource.resource_id)
+        return f"Deleted EBS Volume: {resource.resource_id}"
+    monkeypatch.setattr(cleaner, '_panggil_api_hapus', hapus_palsu)
+    return cleaner
+
+
+def hasil_scan(cleaner, monkeypatch):
+    monkeypatch.setattr(cleaner, '_scan_methods', lambda: {'ebs': lambda region, account_id: iter(volumes())})
+    return list(cleaner.iter_scan_resources({'ebs'}))
+
+
+def test_yang_dilindungin_tetep_ada_di_hasil_scan(cleaner, monkeypatch):
+    hasil = hasil_scan(cleaner, monkeypatch)
+    
+    assert [(r.resource_id, r.protected_by) for r in hasil] == [('vol-aman', 'Keep=True'), ('vol-buang', None)]
+    assert hasil[0].ke_dict()['protected_by'] == 'Keep=True'
+    assert 'protected_by' not in hasil[1].ke_dict()
+    assert cleaner.statistik['protected_resources'] == 1
+
+
+def test_mode_batch_ngelewatin_yang_dilindungin(cleaner, monkeypatch):
+    cleaner.mode_batch(hasil_scan(cleaner, monkeypatch), konfirmasi=False)
+    
+    assert cleaner.dipanggil == ['vol-buang']
+    assert cleaner.statistik['deleted_resources'] == 1
+
+
+def test_mode_interaktif_ngelewatin_yang_dilindungin(cleaner, monkeypatch):
+    from rich.prompt import Confirm
+    
+    monkeypatch.setattr(Confirm, 'ask', classmethod(lambda cls, *args, **kwargs: True))
+    
+    cleaner.mode_interaktif(hasil_scan(cleaner, monkeypatch))
+    
+    assert cleaner.dipanggil == ['vol-buang']
+
+
+def test_delete_async_ngelewatin_yang_dilindungin(cleaner, monkeypatch):
+    resources = hasil_scan(cleaner, monkeypatch)
+    
+    async def ambil_semua():
+        return [(r.resource_id, sukses) async for r, sukses in cleaner.delete_async(resources)]
+    
+    assert asyncio.run(ambil_semua()) == [('vol-buang', True)]
+    assert cleaner.dipanggil == ['vol-buang']
+
+
+def test_laporan_nyatet_penghematan_aktual_abis_batch(cleaner, monkeypatch, tmp_path):
+    import json
+    from rich.prompt import Confirm
+    
+    monkeypatch.setattr(Confirm, 'ask', classmethod(lambda cls, *args, **kwargs: True))
+    resources = hasil_scan(cleaner, monkeypatch)
+    cleaner.tampilkan_hasil_scan(resources)
+    
+    cleaner.mode_batch(resources, konfirmasi=True)
+    cleaner.ekspor_laporan(resources, str(tmp_path / 'laporan.json'))
+    
+    with open(tmp_path / 'laporan.json', encoding='utf-8') as f:
+        laporan = json.load(f)
+    assert cleaner.statistik['actual_savings'] == pytest.approx(5.0)
+    assert laporan['actual_savings']['monthly'] == pytest.approx(5.0)
+
+
+def test_jumlah_dilindungin_kagak_numpuk_tiap_putaran_daemon(cleaner, monkeypatch):
+    monkeypatch.setattr(cleaner, '_scan_methods', lambda: {'ebs': lambda region, account_id: iter(volumes())})
+    daemon = arc.DaemonScan(cleaner, {'ebs'})
+    lokasi = [(None, cleaner.region)]
+    
+    daemon._scan(lokasi)
+    daemon._scan(lokasi)
+    
+    assert cleaner.statistik['protected_resources'] == 1
+
+
+def test_resume_nyatet_yang_dilindungin_sebagai_dilewatin(bikin_cleaner, stub, tmp_path):
+    resources = volumes()
+    nama_file = str(tmp_path / 'hapus.ndjson')
+    arc.JournalHapus.baru(nama_file, {}, resources).tutup()
+    cleaner = bikin_cleaner(proteksi=arc.AturanProteksi(['keep=true', 'env=dev']))
+    stub(cleaner, 'resourcegroupstaggingapi').add_response('get_resources', {'ResourceTagMappingList': []})
+    
+    cleaner.lanjutin_journal(nama_file, konfirmasi=False)
+    
+    journal = arc.JournalHapus.buka(nama_file)
+    assert journal.kelar()
+    assert set(journal.hasil.values()) == {(False, arc.JournalHapus.DILEWATIN)}
+    assert cleaner.statistik['failed_deletions'] == 0
+
+
+def test_tag_cuma_disimpen_kalo_ada_yang_make(bikin_cleaner):
+    volume = {'Tags': [{'Key': 'Keep', 'Value': 'True'}, {'Key': 'team', 'Value': 'data'},
+                       {'Key': 'Name', 'Value': 'vol-besar'}]}
+    
+    def tags(**kwargs):
+        return bikin_cleaner(**kwargs)._bikin_record('ebs', volume, 'vol-1', 'us-east-1', None, 1.0).tags
+    
+    assert tags() is None
+    assert tags(proteksi=arc.AturanProteksi(['keep'])) == {'Keep': 'True'}
+    assert tags(rollup_tags=['team'], proteksi=arc.AturanProteksi(['owner'])) == {'team': 'data'}
+    assert tags(filter_resource=arc.FilterResource(['tag:Name=vol-*'])) is None
+
+
+def test_resume_ngecek_tag_baru_ke_index(bikin_cleaner, stub, tmp_path):
+    # Journal run awal cuma nyimpen tag yang dipake aturan waktu itu
+    resources = [arc.UnusedResource('ebs', 'vol-tim', 'us-east-1', estimated_cost=5.0)]
+    nama_file = str(tmp_path / 'hapus.ndjson')
+    arc.JournalHapus.baru(nama_file, {}, resources).tutup()
+    cleaner = bikin_cleaner(proteksi=arc.AturanProteksi(['team=payments']))
+    stub(cleaner, 'resourcegroupstaggingapi').add_response('get_resources', {'ResourceTagMappingList': [
+        {'ResourceARN': 'arn:aws:ec2:us-east-1:123456789012:volume/vol-tim',
+         'Tags': [{'Key': 'team', 'Value': 'payments'}, {'Key': 'Name', 'Value': 'db'}]},
+    ]}, {'ResourceTypeFilters': ['ec2:volume'], 'ResourcesPerPage': ANY})
+    
+    cleaner.lanjutin_journal(nama_file, konfirmasi=False)
+    
+    assert arc.JournalHapus.buka(nama_file).hasil == {0: (False, arc.JournalHapus.DILEWATIN)}